@@ -25,33 +25,68 @@ Fecha: 2025
 
 import geopandas as gpd
 import pandas as pd
+import matplotlib
+
+matplotlib.use('Agg')  # Sin pantalla: también en los procesos de mapas regionales
 import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
+import matplotlib.path as mpath
 import numpy as np
+import shapely
+from shapely.geometry import box
 import os
-import sys
+import re
+import hashlib
 import warnings
+import contextlib
+import functools
 import logging
+import unicodedata
+from dataclasses import dataclass
 from pathlib import Path
 from matplotlib.gridspec import GridSpec, GridSpecFromSubplotSpec
 from matplotlib.cm import ScalarMappable
+from matplotlib.collections import PatchCollection, PathCollection, PolyCollection
 from matplotlib.colors import LinearSegmentedColormap
+from matplotlib.font_manager import FontProperties, findfont
 from datetime import datetime
 import argparse
+import atexit
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from io import BytesIO
-from matplotlib.patches import Rectangle
+from matplotlib.patches import Polygon as MplPolygon, Rectangle
+from matplotlib.text import Text
+from matplotlib.transforms import ScaledTranslation
 from PIL import Image
-import urllib.request
-import tempfile
-import shutil
+
+try:
+    from rapidfuzz import fuzz, process  # Opcional: emparejamiento difuso de comunas
+except ImportError:
+    process = None
+
+try:
+    import pyogrio  # Lectura vectorial por lotes (GDAL, arreglos NumPy)
+except ImportError:
+    pyogrio = None
+
+try:
+    import charset_normalizer  # Opcional: detección de la codificación del CSV
+except ImportError:
+    charset_normalizer = None
+
+# Renderizado Agg: trazados largos en bloques y simplificación de segmentos
+# casi colineales (por debajo de 1 píxel)
+matplotlib.rcParams['agg.path.chunksize'] = 10000
+matplotlib.rcParams['path.simplify'] = True
+matplotlib.rcParams['path.simplify_threshold'] = 1.0
 
 # Configuración de logging
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
-warnings.filterwarnings('ignore')
 
 # ============================================================================
 # CONSTANTES Y CONFIGURACIONES
@@ -117,6 +152,85 @@ TAMANOS_FUENTE_REGION = {
     16: 9
 }
 
+# Tabla única de atributos por región (indexada por número de región)
+_REGION_TABLE = pd.DataFrame({
+    'num': range(1, 17),
+    'nombre': [REGIONES_ANTIGUAS_NUM[i] for i in range(1, 17)],
+    'titulo': [REGIONES_NOMBRES_TITULOS[i] for i in range(1, 17)],
+    'fuente': [TAMANOS_FUENTE_REGION[i] for i in range(1, 17)],
+}).set_index('num')
+
+# Tipo categórico para la columna de región del CSV
+_REGION_DTYPE = pd.CategoricalDtype(categories=range(1, 17), ordered=False)
+
+# Directorio de caché para capas geográficas preprocesadas (GeoParquet)
+DIRECTORIO_CACHE = Path('cache')
+
+# Versión del preprocesamiento guardado en la caché de comunas; incrementarla
+# cuando cambie lo que _cargar_comunas_cache escribe en el GeoParquet
+VERSION_CACHE_COMUNAS = 2
+
+# Codificaciones candidatas del CSV electoral (en orden de prueba)
+CODIFICACIONES_CSV = ['utf-8-sig', 'latin-1', 'iso-8859-1', 'cp1252', 'utf-8']
+
+# Columnas del CSV que no se usan en los mapas (no se copian al unir datos)
+COLUMNAS_ELECTORALES_NO_UNIDAS = ('blanco_pct', 'nulo_pct', 'emitidos_pct')
+
+# Marcadores de valor faltante en el CSV electoral
+VALORES_NA_CSV = ['', 'NA', '-']
+
+# Emparejamiento difuso de comunas sin coincidencia exacta (opcional, requiere
+# rapidfuzz; se activa con --emparejamiento-difuso)
+EMPAREJAMIENTO_DIFUSO = False
+
+# Umbral de similitud (0-100) para aceptar un emparejamiento difuso de comunas
+UMBRAL_EMPAREJAMIENTO_DIFUSO = 88
+
+# Tolerancia de simplificación de geometrías en grados (~50 m)
+TOLERANCIA_SIMPLIFICACION = 0.0005
+
+# Simplificación adicional de los mapas regionales al detalle visible: la
+# tolerancia es la mayor dimensión de la región dividida por este factor
+# (~1 píxel a 300 dpi). Desactivada por defecto: cada polígono se simplifica
+# por separado y pueden abrirse huecos o solapes entre comunas vecinas.
+SIMPLIFICAR_GEOMETRIAS = False
+FACTOR_TOLERANCIA_REGIONAL = 2000
+
+# URLs de recursos remotos
+URL_GRAN_SANTIAGO = "https://raw.githubusercontent.com/robsalasco/precenso_2016_geojson_chile/master/Extras/GRAN_SANTIAGO.geojson"
+
+FOTOS_JARA_URLS = [
+    "https://upload.wikimedia.org/wikipedia/commons/2/2d/Live_Especial_Mujeres_Comit%C3%A9_Pol%C3%ADtico%2C_Ministra_Jannette_Jara_%28cropped%29.jpg",
+    "https://www.latercera.com/resizer/v2/W4LV4DZTLVG2JLA4FSNXGSZ53U.jpg?auth=ac72355711cd6ba404761233d4e8c5db88b09d7e1383330b23f44f6fe4c4da02&smart=true&width=800&height=533&quality=70",
+    "https://media.biobiochile.cl/wp-content/uploads/2022/03/Jannette-Jara-1-1200x800.jpg"
+]
+
+FOTOS_KAST_URLS = [
+    "https://upload.wikimedia.org/wikipedia/commons/thumb/1/19/Jos%C3%A9_Antonio_Kast_en_2025_%28cropped%29.jpg/960px-Jos%C3%A9_Antonio_Kast_en_2025_%28cropped%29.jpg",
+    "https://www.latercera.com/resizer/v2/CHVAFJVR7FCPJNPW2WSY7O3GEE.jpg?auth=4283b658dda7f5ed3f2e4e014eefc4fa4cf096e36131ed2620338bd73bf0b73a&smart=true&width=800&height=533&quality=70",
+    "https://media.biobiochile.cl/wp-content/uploads/2021/11/kast-1-1200x800.jpg"
+]
+
+# Cabeceras HTTP para la descarga de imágenes
+CABECERAS_IMAGENES = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'image/webp,image/apng,image/*,*/*;q=0.8',
+    'Accept-Language': 'es-ES,es;q=0.9',
+    'Referer': 'https://www.google.com/'
+}
+
+# Sesión HTTP compartida (reutiliza conexiones TLS y reintenta errores transitorios
+# del servidor; los errores de conexión no se reintentan para no demorar las
+# ejecuciones sin red)
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4, pool_maxsize=16,
+    max_retries=Retry(total=2, connect=0, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+))
+
+# URLs cuya descarga ya falló en esta ejecución (no se vuelven a intentar)
+_DESCARGAS_FALLIDAS = set()
+
 # Tamaños de fuente para áreas metropolitanas
 TAMANOS_FUENTE_AREAS_METROPOLITANAS = {
     'gran_valparaiso': 9,
@@ -156,6 +270,53 @@ NOMBRES_CSV_A_NUM = {
     "Los Rios": 14
 }
 
+
+def _clave_region(nombre):
+    """Normaliza un nombre de región a minúsculas ASCII sin acentos."""
+    if not nombre.isascii():
+        nombre = unicodedata.normalize('NFKD', nombre).encode('ascii', 'ignore').decode('ascii')
+    return nombre.lower().strip()
+
+
+# Mapeo normalizado (sin acentos, minúsculas) de nombres de región a números
+_REGION_LUT = {_clave_region(nombre): num for nombre, num in NOMBRES_CSV_A_NUM.items()}
+
+# Nombres de región en minúsculas (búsqueda exacta y parcial de mapear_region)
+_REGION_EXACTA = {nombre.lower(): num for nombre, num in NOMBRES_CSV_A_NUM.items()}
+
+
+def mapear_region(nombre):
+    """
+    Mapea un nombre textual de región a su número.
+
+    Busca primero en el diccionario de nombres exactos y solo ante un fallo
+    recorre los nombres conocidos buscando una coincidencia parcial.
+
+    Args:
+        nombre (str): Nombre de región.
+
+    Returns:
+        int or None: Número de región o None si no se reconoce.
+    """
+    if pd.isna(nombre):
+        return None
+
+    nombre_str = str(nombre).strip()
+    clave = nombre_str.lower()
+
+    # Búsqueda exacta
+    num = _REGION_EXACTA.get(clave)
+    if num is not None:
+        return num
+
+    # Búsqueda parcial
+    for region_csv, num in _REGION_EXACTA.items():
+        if region_csv in clave:
+            return num
+
+    print(f" ⚠ No se pudo mapear región: '{nombre_str}'")
+    return None
+
 # Paleta de colores para la diferencia entre candidatos
 COLORES_BALOTAJE = [
     '#0F2D5C',
@@ -176,6 +337,108 @@ COLORES_BALOTAJE = [
 # Mapa de colores continuo para la escala
 cmap_continuo = LinearSegmentedColormap.from_list('jara_kast_divergente', COLORES_BALOTAJE, N=256)
 
+# Normalización fija de la escala de diferencias (compartida por todas las barras de colores)
+_NORMA_DIFERENCIA = plt.Normalize(-100, 100)
+
+# Marcas de la barra de colores en los paneles de estadísticas
+_MARCAS_DIFERENCIA = (-100, -50, -10, 0, 10, 50, 100)
+_ETIQUETAS_MARCAS_DIFERENCIA = ('-100', '-50', '-10', '0', '10', '50', '+100')
+
+# Marcas de tiempo de la ejecución (se calculan una sola vez)
+_FECHA_EJECUCION = datetime.now()
+_FECHA = _FECHA_EJECUCION.strftime("%d/%m/%Y")
+_FECHA_HORA = _FECHA_EJECUCION.strftime("%d/%m/%Y %H:%M")
+_FECHA_HORA_SEGUNDOS = _FECHA_EJECUCION.strftime("%d/%m/%Y %H:%M:%S")
+
+# Plantilla del pie de página de los mapas y reportes
+_PLANTILLA_PIE = "Análisis Segunda Vuelta Presidencial Chile 2025 - Jara vs Kast | {} | Generado: {}"
+
+
+def _texto_pie(contexto, fecha=_FECHA):
+    """
+    Arma el texto del pie de página con la fecha de la ejecución.
+
+    Args:
+        contexto (str): Mapa o reporte (región, área, etc.).
+        fecha (str): Fecha ya formateada (_FECHA o _FECHA_HORA).
+
+    Returns:
+        str: Texto del pie de página.
+    """
+    return _PLANTILLA_PIE.format(contexto, fecha)
+
+# Fuente en negrita para títulos, resuelta una sola vez a su archivo
+_FP_TITULO = FontProperties(fname=findfont(FontProperties(weight='bold')))
+
+
+# Límites de los tramos de diferencia y color de cada tramo (Kast +50% a Jara +50%)
+_DIFF_BINS = np.array([-50, -40, -30, -20, -10, 0, 10, 20, 30, 40, 50], dtype=float)
+_DIFF_LUT = np.array([
+    '#0F2D5C', '#1A3D7C', '#2A58A6', '#3D76D1', '#5E91E8', '#8BB2F0',
+    '#F8A0A0', '#F28787', '#E86969', '#DA4A4A', '#C92A2A', '#B91C1C',
+])
+
+
+# Paleta completa: tramos de diferencia, empate y sin datos
+_PALETA_DIFERENCIA = np.append(_DIFF_LUT, ['#9CA3AF', '#D3D3D3'])
+_CODIGO_EMPATE = len(_DIFF_LUT)
+_CODIGO_SIN_DATOS = len(_DIFF_LUT) + 1
+
+
+def _codigos_color(diferencias):
+    """
+    Calcula el índice en _PALETA_DIFERENCIA para cada diferencia porcentual.
+
+    Ubica cada diferencia en su tramo con una búsqueda binaria sobre
+    _DIFF_BINS, sin recorrer fila por fila.
+
+    Args:
+        diferencias (array-like): Diferencias porcentuales (Jara% - Kast%).
+
+    Returns:
+        numpy.ndarray: Códigos (int8), uno por diferencia.
+    """
+    diferencias = np.asarray(diferencias, dtype=float)
+
+    # Los tramos de Kast incluyen su límite en valor absoluto (-10 es "Kast +10%"),
+    # por eso los negativos se ubican por la izquierda y los positivos por la derecha
+    codigos = np.where(diferencias < 0,
+                       np.searchsorted(_DIFF_BINS, diferencias, side='left'),
+                       np.searchsorted(_DIFF_BINS, diferencias, side='right')).astype(np.int8)
+
+    codigos[diferencias == 0] = _CODIGO_EMPATE
+    codigos[np.isnan(diferencias)] = _CODIGO_SIN_DATOS
+    return codigos
+
+
+def asignar_colores_vector(diferencias):
+    """
+    Asigna colores hexadecimales a un conjunto completo de diferencias porcentuales.
+
+    Args:
+        diferencias (array-like): Diferencias porcentuales (Jara% - Kast%).
+
+    Returns:
+        numpy.ndarray: Códigos hexadecimales, uno por diferencia.
+    """
+    return _PALETA_DIFERENCIA[_codigos_color(diferencias)]
+
+
+def colorizar(diferencias):
+    """
+    Asigna colores a las diferencias como columna categórica.
+
+    Guarda un código de 1 byte por fila en lugar de una cadena hexadecimal,
+    por lo que es la forma preferida para la columna 'color' de los mapas.
+
+    Args:
+        diferencias (array-like): Diferencias porcentuales (Jara% - Kast%).
+
+    Returns:
+        pandas.Categorical: Colores hexadecimales, uno por diferencia.
+    """
+    return pd.Categorical.from_codes(_codigos_color(diferencias), categories=_PALETA_DIFERENCIA)
+
 
 def asignar_color_diferencia(diferencia):
     """
@@ -187,39 +450,31 @@ def asignar_color_diferencia(diferencia):
     Returns:
         str: Código hexadecimal del color asignado.
     """
-    if pd.isna(diferencia):
-        return "#D3D3D3"
-
-    if diferencia == 0:
-        return "#9CA3AF"
-
-    if diferencia > 0:
-        if diferencia >= 50:
-            return "#B91C1C"
-        elif diferencia >= 40:
-            return "#C92A2A"
-        elif diferencia >= 30:
-            return "#DA4A4A"
-        elif diferencia >= 20:
-            return "#E86969"
-        elif diferencia >= 10:
-            return "#F28787"
-        else:
-            return "#F8A0A0"
-    else:
-        diferencia_abs = abs(diferencia)
-        if diferencia_abs >= 50:
-            return "#0F2D5C"
-        elif diferencia_abs >= 40:
-            return "#1A3D7C"
-        elif diferencia_abs >= 30:
-            return "#2A58A6"
-        elif diferencia_abs >= 20:
-            return "#3D76D1"
-        elif diferencia_abs >= 10:
-            return "#5E91E8"
-        else:
-            return "#8BB2F0"
+    return str(asignar_colores_vector([diferencia])[0])
+
+
+# Simbología de la escala de diferencias (color, etiqueta)
+LEYENDA_DIFERENCIA = [
+    ('#B91C1C', 'Jara +50% o más'),
+    ('#C92A2A', 'Jara +40% a +50%'),
+    ('#DA4A4A', 'Jara +30% a +40%'),
+    ('#E86969', 'Jara +20% a +30%'),
+    ('#F28787', 'Jara +10% a +20%'),
+    ('#F8A0A0', 'Jara +1% a +10%'),
+    ('#9CA3AF', 'Empate técnico'),
+    ('#8BB2F0', 'Kast +1% a +10%'),
+    ('#5E91E8', 'Kast +10% a +20%'),
+    ('#3D76D1', 'Kast +20% a +30%'),
+    ('#2A58A6', 'Kast +30% a +40%'),
+    ('#1A3D7C', 'Kast +40% a +50%'),
+    ('#0F2D5C', 'Kast +50% o más'),
+    ('#D3D3D3', 'Sin datos'),
+]
+
+# Rectángulos y colores de la simbología (una fila por entrada, de arriba hacia abajo)
+_LEYENDA_VERTICES = np.array([[[0, -i], [1.2, -i], [1.2, -i - 0.7], [0, -i - 0.7]]
+                              for i in range(len(LEYENDA_DIFERENCIA))], dtype=float)
+_LEYENDA_COLORES = [color for color, _ in LEYENDA_DIFERENCIA]
 
 
 # ============================================================================
@@ -248,6 +503,21 @@ GRAN_CONCEPCION = [
     "Penco", "San Pedro de la Paz", "Talcahuano", "Tomé"
 ]
 
+# Límites geográficos de las islas oceánicas (mapas separados)
+LIMITES_ISLA_PASCUA = {
+    'minx': -109.5,
+    'miny': -27.2,
+    'maxx': -109.2,
+    'maxy': -27.0
+}
+
+LIMITES_JUAN_FERNANDEZ = {
+    'minx': -79.0,
+    'miny': -33.8,
+    'maxx': -78.7,
+    'maxy': -33.6
+}
+
 # Mapeo de comunas del Gran Santiago a números (para etiquetas pequeñas)
 MAQUEO_COMUNAS_NUMEROS = {
     "Conchalí": "1",
@@ -402,11 +672,63 @@ COMUNAS_NUMEROS_REGION_16 = {
     "Coelemu": "5"
 }
 
+# Regiones con etiquetas numeradas (fuera de la RM) y su nombre para los mensajes
+ETIQUETAS_REGIONES_NUMERADAS = {
+    5: "Valparaíso",
+    6: "O'Higgins",
+    7: "Maule",
+    8: "Biobío",
+    9: "Araucanía",
+    10: "Los Lagos",
+    12: "Magallanes",
+    16: "Ñuble"
+}
+
+# Comunas numeradas de cada región (simbología y etiquetas)
+COMUNAS_NUMEROS_POR_REGION = {
+    5: COMUNAS_NUMEROS_REGION_5,
+    6: COMUNAS_NUMEROS_REGION_6,
+    7: COMUNAS_NUMEROS_REGION_7,
+    8: COMUNAS_NUMEROS_REGION_8,
+    9: COMUNAS_NUMEROS_REGION_9,
+    10: COMUNAS_NUMEROS_REGION_10,
+    12: COMUNAS_NUMEROS_REGION_12,
+    13: COMUNAS_NUMEROS_RM,
+    16: COMUNAS_NUMEROS_REGION_16
+}
+
+# Tabla única de números de etiqueta indexada por (región, comuna)
+_ETIQUETAS_NUMERO = pd.concat([
+    pd.DataFrame({'REGION_NUM': region_num, 'NOM_COM': list(numeros), 'numero': list(numeros.values())})
+    for region_num, numeros in COMUNAS_NUMEROS_POR_REGION.items()
+]).set_index(['REGION_NUM', 'NOM_COM'])['numero']
+
 
 # ============================================================================
 # FUNCIONES DE UTILIDAD Y PREPROCESAMIENTO
 # ============================================================================
 
+# Tablas de normalización de nombres de comunas (se construyen una sola vez)
+_CORRECCIONES_NOMBRES = (
+    ("llay-llay", "llaillay"),
+    ("cabo de hornos(ex-navarino)", "cabo de hornos"),
+    ("trehuaco", "treguaco")
+)
+_REEMPLAZOS_TOKENS = (
+    ('puerto ', ''), ('las ', ''), ('los ', ''),
+    ('el ', ''), ('la ', ''), ('del ', ''),
+    (' de ', ' '), (' y ', ' ')
+)
+_TRADUCCION_SIMBOLOS = str.maketrans({"'": None, '"': None, '-': ' ', '.': None})
+
+
+def _quitar_acentos(texto):
+    """Elimina tildes y diacríticos (descomposición NFKD sin marcas combinantes)."""
+    if texto.isascii():
+        return texto
+    return ''.join(c for c in unicodedata.normalize('NFKD', texto) if not unicodedata.combining(c))
+
+
 def normalizar_nombre(nombre):
     """
     Normaliza nombres de comunas para comparación.
@@ -423,29 +745,247 @@ def normalizar_nombre(nombre):
     if pd.isna(nombre):
         return ""
 
-    nombre_str = str(nombre).lower()
+    return _normalizar_cached(str(nombre))
+
+
+@functools.lru_cache(maxsize=None)
+def _normalizar_cached(nombre):
+    """Normaliza un nombre ya convertido a str (resultado memorizado por nombre)."""
+    nombre_str = nombre.lower()
 
     # Correcciones específicas para nombres problemáticos
-    nombre_str = nombre_str.replace("llay-llay", "llaillay")
-    nombre_str = nombre_str.replace("cabo de hornos(ex-navarino)", "cabo de hornos")
-    nombre_str = nombre_str.replace("trehuaco", "treguaco")
-
-    # Tabla de reemplazos para normalización
-    reemplazos = {
-        'á': 'a', 'é': 'e', 'í': 'i', 'ó': 'o', 'ú': 'u',
-        'ñ': 'n', 'ü': 'u',
-        'puerto ': '', 'las ': '', 'los ': '',
-        'el ': '', 'la ': '', 'del ': '',
-        ' de ': ' ', ' y ': ' ', "'": '', '"': '',
-        '-': ' ', '.': '', ' ': ' '
-    }
+    for orig, reemp in _CORRECCIONES_NOMBRES:
+        nombre_str = nombre_str.replace(orig, reemp)
 
-    for orig, reemp in reemplazos.items():
+    # Acentos, prefijos/conectores en orden y luego símbolos
+    nombre_str = _quitar_acentos(nombre_str)
+    for orig, reemp in _REEMPLAZOS_TOKENS:
         nombre_str = nombre_str.replace(orig, reemp)
+    nombre_str = nombre_str.translate(_TRADUCCION_SIMBOLOS)
 
     return nombre_str.strip()
 
 
+def normalizar_nombres_serie(nombres):
+    """
+    Normaliza una serie completa de nombres de comunas.
+
+    Aplica los mismos pasos que normalizar_nombre con operaciones .str sobre
+    toda la columna, en lugar de llamar a la función fila por fila.
+
+    Args:
+        nombres (Series): Nombres de comunas.
+
+    Returns:
+        Series: Nombres normalizados ("" para valores faltantes).
+    """
+    nombres = nombres.astype(object)
+    nombres_str = nombres.where(nombres.notna(), '').astype(str).str.lower()
+
+    for orig, reemp in _CORRECCIONES_NOMBRES:
+        nombres_str = nombres_str.str.replace(orig, reemp, regex=False)
+
+    nombres_str = nombres_str.map(_quitar_acentos)
+    for orig, reemp in _REEMPLAZOS_TOKENS:
+        nombres_str = nombres_str.str.replace(orig, reemp, regex=False)
+
+    return nombres_str.str.translate(_TRADUCCION_SIMBOLOS).str.strip()
+
+
+# Conjuntos de nombres normalizados de las áreas metropolitanas (para filtros isin)
+_CONURB_STGO_SET = frozenset(normalizar_nombre(comuna) for comuna in CONURBACION_SANTIAGO)
+_GRAN_VALPO_SET = frozenset(normalizar_nombre(comuna) for comuna in GRAN_VALPARAISO)
+_GRAN_CONCE_SET = frozenset(normalizar_nombre(comuna) for comuna in GRAN_CONCEPCION)
+
+# Comunas de la RM que se etiquetan con nombre y números del Gran Santiago
+_RM_ETIQUETAS_SET = frozenset(COMUNAS_ETIQUETAS_RM)
+_MAQUEO_SERIES = pd.Series(MAQUEO_COMUNAS_NUMEROS)
+
+# Desplazamientos (dx, dy) de etiquetas en la Región Metropolitana para
+# comunas cuyo punto representativo queda mal ubicado
+OFFSETS_RM = {
+    "Lo Barnechea": (0, 0.01),
+    "Colina": (0.005, 0),
+    "Lampa": (0, -0.005),
+    "Curacaví": (-0.008, 0),
+    "María Pinto": (0, 0.008),
+    "Melipilla": (0.01, 0),
+    "San José de Maipo": (-0.01, 0),
+}
+
+# Comunas insulares de Valparaíso que se excluyen del mapa regional (tienen mapa propio)
+ISLAS_VALPARAISO = ['Juan Fernández', 'Isla de Pascua', 'Rapa Nui', 'Easter Island']
+_PATRON_ISLAS_VALPARAISO = re.compile('|'.join(ISLAS_VALPARAISO), re.IGNORECASE)
+
+
+def mapear_regiones_csv(regiones):
+    """
+    Mapea una serie completa de nombres de región a números de región.
+
+    Normaliza todos los nombres de una vez (sin acentos, minúsculas) y los
+    busca en _REGION_LUT, de modo que variantes como "Valparaíso" y
+    "Valparaiso" comparten una sola entrada.
+
+    Args:
+        regiones (Series): Nombres de región tal como vienen en el CSV.
+
+    Returns:
+        Series: Números de región (Int8); NA para nombres no reconocidos.
+    """
+    claves = regiones.astype(str)
+
+    # Solo los nombres con caracteres no ASCII pasan por la descomposición NFKD
+    no_ascii = ~claves.map(str.isascii).astype(bool)
+    if no_ascii.any():
+        claves = claves.copy()
+        claves[no_ascii] = (claves[no_ascii]
+                            .str.normalize('NFKD')
+                            .str.encode('ascii', 'ignore')
+                            .str.decode('ascii'))
+
+    claves = claves.str.lower().str.strip()
+    return claves.map(_REGION_LUT).astype('Int8')
+
+
+# Tabla de traducción para nombres de archivo: sin tildes, espacios ni comillas
+_TRADUCCION_ARCHIVO = str.maketrans({
+    'á': 'a', 'é': 'e', 'í': 'i', 'ó': 'o', 'ú': 'u', 'ñ': 'n', 'Ñ': 'N',
+    ' ': '_', "'": None, '"': None,
+})
+
+
+def _nombre_archivo_region(nombre):
+    """Convierte el nombre corto de una región en un fragmento de nombre de archivo."""
+    return nombre.translate(_TRADUCCION_ARCHIVO)
+
+
+@functools.lru_cache(maxsize=None)
+def _rutas_salida(output_dir):
+    """
+    Precalcula todas las rutas de salida y crea el directorio una sola vez.
+
+    Args:
+        output_dir (str): Directorio de salida.
+
+    Returns:
+        dict: Rutas (Path) por clave de salida; 'regiones' indexa por número de región.
+    """
+    base = Path(output_dir)
+    base.mkdir(parents=True, exist_ok=True)
+    return {
+        'regiones': {
+            num: base / f"REGION_{num:02d}_{_nombre_archivo_region(nombre)}_COMPLETO.png"
+            for num, nombre in _REGION_TABLE['nombre'].items()
+        },
+        'isla_pascua': base / "ISLA_DE_PASCUA_RAPA_NUI.png",
+        'juan_fernandez': base / "ARCHIPIELAGO_JUAN_FERNANDEZ.png",
+        'gran_valparaiso': base / "GRAN_VALPARAISO_METROPOLITANO.png",
+        'gran_concepcion': base / "GRAN_CONCEPCION_METROPOLITANO.png",
+        'gran_santiago': base / "GRAN_SANTIAGO_METROPOLITANO.png",
+        'conurbacion_santiago': base / "CONURBACION_SANTIAGO_.png",
+        'chile_tres_partes': base / "CHILE_MAP_COMPLETO.png",
+        'reporte_nacional': base / "REPORTE_NACIONAL_COMPLETO.png",
+        'tabla_capitales': base / "TABLA_CAPITALES_REGIONALES.png",
+        'tabla_capitales_csv': base / "TABLA_CAPITALES_REGIONALES.csv",
+        'reporte_gran_santiago': base / "REPORTE_GRAN_SANTIAGO_COMPLETO.png",
+        'reporte_final': base / "REPORTE_FINAL.txt",
+        'mapa_nacional': base / "MAPA_NACIONAL_COMPLETO.png",
+        'datos_combinados': base / "datos_combinados.csv",
+    }
+
+
+def _descargar_cache(url, directorio_cache=DIRECTORIO_CACHE, headers=None):
+    """
+    Descarga una URL usando una caché en disco.
+
+    El archivo en caché se nombra con un hash de la URL, de modo que las
+    ejecuciones siguientes no vuelven a acceder a la red. Una URL que falla
+    no se vuelve a pedir durante la misma ejecución.
+
+    Args:
+        url (str): URL a descargar.
+        directorio_cache (Path): Directorio de la caché.
+        headers (dict or None): Cabeceras HTTP adicionales.
+
+    Returns:
+        bytes: Contenido descargado.
+
+    Raises:
+        requests.RequestException: Si la descarga falla.
+    """
+    clave = hashlib.blake2b(url.encode(), digest_size=8).hexdigest()
+    ruta_cache = Path(directorio_cache) / 'descargas' / clave
+
+    if ruta_cache.exists():
+        return ruta_cache.read_bytes()
+
+    if url in _DESCARGAS_FALLIDAS:
+        raise requests.RequestException(f"Descarga ya fallida en esta ejecución: {url[:60]}")
+
+    try:
+        response = _SESSION.get(url, headers=headers, timeout=10)
+        response.raise_for_status()
+    except requests.RequestException:
+        _DESCARGAS_FALLIDAS.add(url)
+        raise
+    contenido = response.content
+
+    try:
+        ruta_cache.parent.mkdir(parents=True, exist_ok=True)
+        ruta_cache.write_bytes(contenido)
+    except OSError as e:
+        print(f" ⚠ No se pudo guardar en caché {url[:60]}: {e}")
+
+    return contenido
+
+
+def _precargar_urls(urls, headers=None, max_workers=8):
+    """
+    Descarga en paralelo un conjunto de URLs hacia la caché en disco.
+
+    Args:
+        urls (list): URLs a descargar.
+        headers (dict or None): Cabeceras HTTP adicionales.
+        max_workers (int): Número máximo de descargas simultáneas.
+
+    Returns:
+        dict: Contenido (bytes) por URL; None para las descargas fallidas.
+    """
+    def descargar(url):
+        try:
+            return _descargar_cache(url, headers=headers)
+        except Exception:
+            return None
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(urls, executor.map(descargar, urls)))
+
+
+@contextlib.contextmanager
+def _silenciado():
+    """Silencia solo los avisos conocidos de la lectura y reproyección de capas."""
+    with warnings.catch_warnings():
+        warnings.filterwarnings('ignore', category=UserWarning, module='pyogrio')
+        warnings.filterwarnings('ignore', category=RuntimeWarning, module='geopandas.array')
+        yield
+
+
+def _leer_vectorial(origen):
+    """
+    Lee una capa vectorial con pyogrio, o con geopandas si no está instalado.
+
+    Args:
+        origen (str or BytesIO): Ruta, URL o contenido en memoria de la capa.
+
+    Returns:
+        GeoDataFrame: Capa leída.
+    """
+    with _silenciado():
+        if pyogrio is not None:
+            return pyogrio.read_dataframe(origen)
+        return gpd.read_file(origen)
+
+
 def cargar_gran_santiago_geojson():
     """
     Carga GeoJSON especializado para el Gran Santiago desde GitHub.
@@ -455,13 +995,9 @@ def cargar_gran_santiago_geojson():
     """
     print("\n🗺️ CARGANDO GEOJSON ESPECÍFICO DE GRAN SANTIAGO...")
 
-    url = "https://raw.githubusercontent.com/robsalasco/precenso_2016_geojson_chile/master/Extras/GRAN_SANTIAGO.geojson"
-
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-
-        gdf_gran_santiago = gpd.read_file(BytesIO(response.content))
+        contenido = _descargar_cache(URL_GRAN_SANTIAGO)
+        gdf_gran_santiago = _leer_vectorial(BytesIO(contenido))
 
         print(f" ✓ GeoJSON de Gran Santiago cargado: {len(gdf_gran_santiago)} elementos")
 
@@ -482,7 +1018,7 @@ def cargar_gran_santiago_geojson():
         gdf_gran_santiago['REGION_NUM'] = 13
         gdf_gran_santiago['REGION'] = 13
 
-        gdf_gran_santiago['NOM_COM_NORM'] = gdf_gran_santiago['NOM_COM'].apply(normalizar_nombre)
+        gdf_gran_santiago['NOM_COM_NORM'] = normalizar_nombres_serie(gdf_gran_santiago['NOM_COM'])
 
         print(f" ✓ Gran Santiago preparado con {len(gdf_gran_santiago)} elementos")
         return gdf_gran_santiago
@@ -493,6 +1029,76 @@ def cargar_gran_santiago_geojson():
         return None
 
 
+def _simplificar_cobertura(geometrias, tolerancia=TOLERANCIA_SIMPLIFICACION):
+    """
+    Simplifica las comunas como una cobertura, conservando los bordes comunes.
+
+    shapely.coverage_simplify simplifica una sola vez cada borde compartido,
+    de modo que las comunas vecinas siguen encajando sin huecos ni solapes.
+    Requiere shapely >= 2.1; con versiones anteriores las geometrías se
+    devuelven sin simplificar.
+
+    Args:
+        geometrias (array-like): Geometrías de las comunas.
+        tolerancia (float): Tolerancia de simplificación en grados.
+
+    Returns:
+        numpy.ndarray: Geometrías simplificadas, en el mismo orden.
+    """
+    geometrias = np.asarray(geometrias, dtype=object)
+    if not hasattr(shapely, 'coverage_simplify'):
+        return geometrias
+
+    validas = ~(shapely.is_missing(geometrias) | shapely.is_empty(geometrias))
+    resultado = geometrias.copy()
+    resultado[validas] = shapely.coverage_simplify(geometrias[validas], tolerancia)
+    return resultado
+
+
+def _cargar_comunas_cache(ruta, directorio_cache=DIRECTORIO_CACHE):
+    """
+    Carga una capa de comunas usando una caché GeoParquet preprocesada.
+
+    La clave de la caché combina la ruta, la fecha de modificación del archivo,
+    la tolerancia de simplificación y la versión del preprocesamiento, por lo
+    que cambiar cualquiera de ellas invalida la caché. En un fallo de caché se
+    lee el archivo, se reproyecta a EPSG:4326 y se simplifican las geometrías
+    una sola vez, como cobertura, antes de guardarlas.
+
+    Args:
+        ruta (str): Ruta del archivo vectorial original.
+        directorio_cache (Path): Directorio donde se guardan los GeoParquet.
+
+    Returns:
+        GeoDataFrame: Capa de comunas preprocesada.
+    """
+    firma = f"{ruta}:{os.path.getmtime(ruta)}:{TOLERANCIA_SIMPLIFICACION}:v{VERSION_CACHE_COMUNAS}"
+    clave = hashlib.blake2b(firma.encode(), digest_size=8).hexdigest()
+    ruta_cache = Path(directorio_cache) / f"comunas_{clave}.parquet"
+
+    if ruta_cache.exists():
+        try:
+            gdf = gpd.read_parquet(ruta_cache)
+            print(f" ✓ Caché GeoParquet: {ruta_cache}")
+            return gdf
+        except Exception as e:
+            print(f" ⚠ Caché inválida ({ruta_cache}): {e}")
+
+    gdf = gpd.read_parquet(ruta) if str(ruta).endswith('.parquet') else _leer_vectorial(ruta)
+    with _silenciado():
+        if gdf.crs is not None and gdf.crs.to_epsg() != 4326:
+            gdf = gdf.to_crs('EPSG:4326')
+    gdf.geometry = _simplificar_cobertura(gdf.geometry.values)
+
+    try:
+        ruta_cache.parent.mkdir(parents=True, exist_ok=True)
+        gdf.to_parquet(ruta_cache)
+    except Exception as e:
+        print(f" ⚠ No se pudo guardar la caché GeoParquet: {e}")
+
+    return gdf
+
+
 def cargar_datos_geograficos():
     """
     Carga datos geográficos de comunas chilenas desde múltiples fuentes.
@@ -510,6 +1116,7 @@ def cargar_datos_geograficos():
 
     # Lista de archivos locales comunes
     archivos_locales = [
+        'comunas_chile.parquet',
         'comunas_chile.geojson',
         'comunas.geojson',
         'chile_comunas.geojson',
@@ -523,7 +1130,7 @@ def cargar_datos_geograficos():
         if os.path.exists(archivo):
             try:
                 print(f" Cargando archivo local: {archivo}")
-                gdf = gpd.read_file(archivo)
+                gdf = _cargar_comunas_cache(archivo)
                 if len(gdf) > 0:
                     print(f" ✓ Datos cargados: {len(gdf)} comunas")
                     if 'geometry' not in gdf.columns or gdf.geometry.is_empty.all():
@@ -534,11 +1141,18 @@ def cargar_datos_geograficos():
 
     # Si no hay locales, descargar por región desde GitHub
     print(" No se encontraron archivos locales. Intentando descargar por región desde caracena/chile-geojson...")
+    urls = {i: f"https://raw.githubusercontent.com/caracena/chile-geojson/master/{i}.geojson" for i in range(1, 17)}
+
+    # Las 16 descargas van en paralelo; la lectura se hace después en orden de región
+    contenidos = _precargar_urls(list(urls.values()), max_workers=16)
+
     gdfs = []
-    for i in range(1, 17):
-        url = f"https://raw.githubusercontent.com/caracena/chile-geojson/master/{i}.geojson"
+    for i, url in urls.items():
         try:
-            gdf_region = gpd.read_file(url)
+            contenido = contenidos[url]
+            if contenido is None:
+                raise requests.RequestException("descarga fallida")
+            gdf_region = _leer_vectorial(BytesIO(contenido))
             print(f" ✓ Cargado región {i}: {len(gdf_region)} comunas")
             if 'Comuna' in gdf_region.columns:
                 gdf_region['NOM_COM'] = gdf_region['Comuna']
@@ -554,21 +1168,83 @@ def cargar_datos_geograficos():
 
     # Concatenar regiones descargadas
     if gdfs:
-        gdf = pd.concat(gdfs, ignore_index=True)
+        # Alinear columnas antes de concatenar (mismo esquema en todas las regiones)
+        columnas = list(dict.fromkeys(col for gdf_region in gdfs for col in gdf_region.columns))
+        gdf = pd.concat([gdf_region.reindex(columns=columnas) for gdf_region in gdfs],
+                        ignore_index=True, sort=False)
         gdf = gpd.GeoDataFrame(gdf, crs='EPSG:4326')
         total_comunas = len(gdf)
         print(f" ✓ Datos descargados y concatenados: {total_comunas} comunas totales")
-        gdf.to_file('comunas_chile.geojson', driver='GeoJSON')
-        print(" ✓ Archivo guardado localmente como 'comunas_chile.geojson'")
         if 'geometry' not in gdf.columns or gdf.geometry.is_empty.all():
             raise ValueError("Datos geográficos inválidos: sin geometrías válidas.")
-        return gdf
+        # Guardar la capa sin simplificar en GeoParquet (binario, evita volver a
+        # descargar); la versión simplificada queda en la caché con clave
+        gdf.to_parquet('comunas_chile.parquet')
+        print(" ✓ Archivo guardado localmente como 'comunas_chile.parquet'")
+        return _cargar_comunas_cache('comunas_chile.parquet')
 
     # Si todas las descargas fallaron, crear datos básicos
     print(" ⚠ Todas las descargas fallaron. Usando datos básicos (formas cuadradas)")
     return crear_datos_basicos()
 
 
+# Límites aproximados por región para los datos de emergencia
+_LIMITES_REGIONES_BASICOS = {
+    1: {"minx": -70.5, "miny": -20.5, "maxx": -68.5, "maxy": -17.5},
+    2: {"minx": -71.5, "miny": -25.5, "maxx": -67.5, "maxy": -21.5},
+    3: {"minx": -72.5, "miny": -29.5, "maxx": -69.5, "maxy": -25.5},
+    4: {"minx": -72.5, "miny": -32.5, "maxx": -69.5, "maxy": -29.5},
+    5: {"minx": -73.5, "miny": -34.5, "maxx": -70.5, "maxy": -31.5},
+    6: {"minx": -72.5, "miny": -35.5, "maxx": -69.5, "maxy": -33.5},
+    7: {"minx": -73.5, "miny": -37.5, "maxx": -70.5, "maxy": -34.5},
+    8: {"minx": -74.5, "miny": -39.5, "maxx": -71.5, "maxy": -36.5},
+    9: {"minx": -74.5, "miny": -41.5, "maxx": -71.5, "maxy": -38.5},
+    10: {"minx": -75.5, "miny": -44.5, "maxx": -71.5, "maxy": -40.5},
+    11: {"minx": -76.5, "miny": -48.5, "maxx": -71.5, "maxy": -43.5},
+    12: {"minx": -76.5, "miny": -56.5, "maxx": -68.5, "maxy": -51.5},
+    13: {"minx": -71.5, "miny": -34.5, "maxx": -69.5, "maxy": -32.5},
+    14: {"minx": -74.5, "miny": -41.5, "maxx": -71.5, "maxy": -39.5},
+    15: {"minx": -70.5, "miny": -19.5, "maxx": -68.5, "maxy": -17.5},
+    16: {"minx": -73.5, "miny": -37.5, "maxx": -71.5, "maxy": -35.5},
+}
+
+# Nombres de comunas por región para los datos de emergencia
+_NOMBRES_COMUNAS_BASICOS = {
+    1: ["Iquique", "Alto Hospicio", "Pozo Almonte", "Camiña", "Colchane", "Huara", "Pica"],
+    2: ["Antofagasta", "Calama", "Tocopilla", "María Elena", "Mejillones", "Sierra Gorda", "Taltal"],
+    3: ["Copiapó", "Caldera", "Chañaral", "Diego de Almagro", "Huasco", "Vallenar", "Freirina"],
+    4: ["La Serena", "Coquimbo", "Ovalle", "Illapel", "Vicuña", "Andacollo", "Salamanca"],
+    5: ["Valparaíso", "Viña del Mar", "Quilpué", "Villa Alemana", "San Antonio", "Los Andes", "Quillota",
+        "Juan Fernández", "Isla de Pascua", "Concón", "Limache", "La Cruz", "Calera", "San Felipe",
+        "Panquehue", "Santa María", "Rinconada", "El Quisco", "El Tabo", "Cartagena", "Casablanca",
+        "Catemu", "Hijuelas", "La Ligua", "Llay-Llay", "Nogales", "Olmué", "Petorca", "Puchuncaví",
+        "Putaendo", "Quillota", "Quintero", "San Antonio", "San Esteban", "Santo Domingo", "Zapallar"],
+    6: ["Rancagua", "Machalí", "Graneros", "San Fernando", "Rengo", "Santa Cruz", "Pichilemu",
+        "Codegua", "Doñihue", "Olivar", "Coinco", "Quinta de Tilcoco", "Chimbarongo"],
+    7: ["Talca", "Curicó", "Linares", "Constitución", "Cauquenes", "Parral", "San Javier",
+        "Licantén", "Rauco", "San Rafael", "Río Claro", "Villa Alegre", "Yerbas Buenas", "Curepto"],
+    8: ["Concepción", "Talcahuano", "Coronel", "Chiguayante", "Los Ángeles", "Lebu", "Arauco",
+        "Hualpén", "Hualqui", "Lota", "Penco", "San Pedro de la Paz", "Tomé", "San Rosendo", "Negrete"],
+    9: ["Temuco", "Padre Las Casas", "Villarrica", "Angol", "Victoria", "Pucón", "Lautaro", "Renaico", "Ercilla",
+        "Perquenco", "Cholchol", "Nueva Imperial", "Saavedra", "Teodoro Schmidt", "Pitrufquén"],
+    10: ["Puerto Montt", "Osorno", "Castro", "Ancud", "Puerto Varas", "Frutillar", "Calbuco",
+         "San Juan de la Costa", "Quemchi", "Dalcahue", "Curaco de Vélez", "Puqueldón", "Quinchao", "Queilén"],
+    11: ["Coyhaique", "Aysén", "Chile Chico", "Cochrane", "Puerto Aysén", "Puerto Cisnes"],
+    12: ["Punta Arenas", "Puerto Natales", "Porvenir", "Cabo de Hornos", "Torres del Paine", "Laguna Blanca",
+         "San Gregorio"],
+    13: ["Santiago", "Puente Alto", "Maipú", "Las Condes", "Ñuñoa", "La Florida", "San Bernardo"],
+    14: ["Valdivia", "La Unión", "Río Bueno", "Panguipulli", "Paillaco", "Los Lagos"],
+    15: ["Arica", "Putre", "General Lagos", "Camarones"],
+    16: ["Chillán", "Chillán Viejo", "San Carlos", "Bulnes", "Yungay", "Pemuco", "Ñiquén", "Cobquecura", "Quirihue",
+         "Treguaco", "Coelemu"]
+}
+
+# Límites como arreglo (fila = número de región; columnas minx, miny, maxx, maxy)
+_LIMITES_BASICOS_ARRAY = np.array([[np.nan] * 4] + [
+    [b["minx"], b["miny"], b["maxx"], b["maxy"]] for _, b in sorted(_LIMITES_REGIONES_BASICOS.items())
+])
+
+
 def crear_datos_basicos():
     """
     Crea datos geográficos básicos de emergencia cuando no hay datos reales.
@@ -580,131 +1256,122 @@ def crear_datos_basicos():
     """
     print(" Creando datos básicos de emergencia...")
 
-    from shapely.geometry import Polygon
-
-    # Límites aproximados por región
-    region_bounds = {
-        1: {"minx": -70.5, "miny": -20.5, "maxx": -68.5, "maxy": -17.5},
-        2: {"minx": -71.5, "miny": -25.5, "maxx": -67.5, "maxy": -21.5},
-        3: {"minx": -72.5, "miny": -29.5, "maxx": -69.5, "maxy": -25.5},
-        4: {"minx": -72.5, "miny": -32.5, "maxx": -69.5, "maxy": -29.5},
-        5: {"minx": -73.5, "miny": -34.5, "maxx": -70.5, "maxy": -31.5},
-        6: {"minx": -72.5, "miny": -35.5, "maxx": -69.5, "maxy": -33.5},
-        7: {"minx": -73.5, "miny": -37.5, "maxx": -70.5, "maxy": -34.5},
-        8: {"minx": -74.5, "miny": -39.5, "maxx": -71.5, "maxy": -36.5},
-        9: {"minx": -74.5, "miny": -41.5, "maxx": -71.5, "maxy": -38.5},
-        10: {"minx": -75.5, "miny": -44.5, "maxx": -71.5, "maxy": -40.5},
-        11: {"minx": -76.5, "miny": -48.5, "maxx": -71.5, "maxy": -43.5},
-        12: {"minx": -76.5, "miny": -56.5, "maxx": -68.5, "maxy": -51.5},
-        13: {"minx": -71.5, "miny": -34.5, "maxx": -69.5, "maxy": -32.5},
-        14: {"minx": -74.5, "miny": -41.5, "maxx": -71.5, "maxy": -39.5},
-        15: {"minx": -70.5, "miny": -19.5, "maxx": -68.5, "maxy": -17.5},
-        16: {"minx": -73.5, "miny": -37.5, "maxx": -71.5, "maxy": -35.5},
-    }
-
-    # Nombres de comunas por región
-    nombres_comunas = {
-        1: ["Iquique", "Alto Hospicio", "Pozo Almonte", "Camiña", "Colchane", "Huara", "Pica"],
-        2: ["Antofagasta", "Calama", "Tocopilla", "María Elena", "Mejillones", "Sierra Gorda", "Taltal"],
-        3: ["Copiapó", "Caldera", "Chañaral", "Diego de Almagro", "Huasco", "Vallenar", "Freirina"],
-        4: ["La Serena", "Coquimbo", "Ovalle", "Illapel", "Vicuña", "Andacollo", "Salamanca"],
-        5: ["Valparaíso", "Viña del Mar", "Quilpué", "Villa Alemana", "San Antonio", "Los Andes", "Quillota",
-            "Juan Fernández", "Isla de Pascua", "Concón", "Limache", "La Cruz", "Calera", "San Felipe",
-            "Panquehue", "Santa María", "Rinconada", "El Quisco", "El Tabo", "Cartagena", "Casablanca",
-            "Catemu", "Hijuelas", "La Ligua", "Llay-Llay", "Nogales", "Olmué", "Petorca", "Puchuncaví",
-            "Putaendo", "Quillota", "Quintero", "San Antonio", "San Esteban", "Santo Domingo", "Zapallar"],
-        6: ["Rancagua", "Machalí", "Graneros", "San Fernando", "Rengo", "Santa Cruz", "Pichilemu",
-            "Codegua", "Doñihue", "Olivar", "Coinco", "Quinta de Tilcoco", "Chimbarongo"],
-        7: ["Talca", "Curicó", "Linares", "Constitución", "Cauquenes", "Parral", "San Javier",
-            "Licantén", "Rauco", "San Rafael", "Río Claro", "Villa Alegre", "Yerbas Buenas", "Curepto"],
-        8: ["Concepción", "Talcahuano", "Coronel", "Chiguayante", "Los Ángeles", "Lebu", "Arauco",
-            "Hualpén", "Hualqui", "Lota", "Penco", "San Pedro de la Paz", "Tomé", "San Rosendo", "Negrete"],
-        9: ["Temuco", "Padre Las Casas", "Villarrica", "Angol", "Victoria", "Pucón", "Lautaro", "Renaico", "Ercilla",
-            "Perquenco", "Cholchol", "Nueva Imperial", "Saavedra", "Teodoro Schmidt", "Pitrufquén"],
-        10: ["Puerto Montt", "Osorno", "Castro", "Ancud", "Puerto Varas", "Frutillar", "Calbuco",
-             "San Juan de la Costa", "Quemchi", "Dalcahue", "Curaco de Vélez", "Puqueldón", "Quinchao", "Queilén"],
-        11: ["Coyhaique", "Aysén", "Chile Chico", "Cochrane", "Puerto Aysén", "Puerto Cisnes"],
-        12: ["Punta Arenas", "Puerto Natales", "Porvenir", "Cabo de Hornos", "Torres del Paine", "Laguna Blanca",
-             "San Gregorio"],
-        13: ["Santiago", "Puente Alto", "Maipú", "Las Condes", "Ñuñoa", "La Florida", "San Bernardo"],
-        14: ["Valdivia", "La Unión", "Río Bueno", "Panguipulli", "Paillaco", "Los Lagos"],
-        15: ["Arica", "Putre", "General Lagos", "Camarones"],
-        16: ["Chillán", "Chillán Viejo", "San Carlos", "Bulnes", "Yungay", "Pemuco", "Ñiquén", "Cobquecura", "Quirihue",
-             "Treguaco", "Coelemu"]
-    }
-
-    regiones_data = []
+    codigos, nombres_todas, regiones, anillos = [], [], [], []
     for region_num in range(1, 17):
-        bounds = region_bounds.get(region_num)
-        if not bounds:
+        limite_x0, limite_y0, limite_x1, limite_y1 = _LIMITES_BASICOS_ARRAY[region_num]
+        if np.isnan(limite_x0):
             continue
 
-        nombres = nombres_comunas.get(region_num, [f"Comuna {region_num}"])
+        nombres = _NOMBRES_COMUNAS_BASICOS.get(region_num, [f"Comuna {region_num}"])
         num_comunas = len(nombres)
-        width = (bounds["maxx"] - bounds["minx"]) / num_comunas if num_comunas > 0 else 1
-
-        # Crear rectángulo para cada comuna
-        for i, nombre in enumerate(nombres):
-            minx = bounds["minx"] + i * width
-            maxx = minx + width
-            miny = bounds["miny"]
-            maxy = bounds["maxy"]
-
-            polygon = Polygon([
-                [minx, miny],
-                [maxx, miny],
-                [maxx, maxy],
-                [minx, maxy],
-                [minx, miny]
-            ])
-
-            regiones_data.append({
-                'COD_COM': f'{region_num:02d}{i + 1:03d}',
-                'NOM_COM': nombre,
-                'REGION': region_num,
-                'geometry': polygon
-            })
 
-    gdf = gpd.GeoDataFrame(regiones_data, crs='EPSG:4326')
+        # Rectángulos de todas las comunas de la región (N x 5 vértices)
+        bordes_x = np.linspace(limite_x0, limite_x1, num_comunas + 1)
+        minx, maxx = bordes_x[:-1], bordes_x[1:]
+        miny = np.full(num_comunas, limite_y0)
+        maxy = np.full(num_comunas, limite_y1)
+        xs = np.stack([minx, maxx, maxx, minx, minx], axis=1)
+        ys = np.stack([miny, miny, maxy, maxy, miny], axis=1)
+        anillos.append(np.stack([xs, ys], axis=-1))
+
+        codigos.extend(f'{region_num:02d}{i + 1:03d}' for i in range(num_comunas))
+        nombres_todas.extend(nombres)
+        regiones.extend([region_num] * num_comunas)
+
+    gdf = gpd.GeoDataFrame({
+        'COD_COM': codigos,
+        'NOM_COM': nombres_todas,
+        'REGION': regiones,
+        'geometry': shapely.polygons(np.concatenate(anillos))
+    }, crs='EPSG:4326')
     gdf['REGION_NUM'] = gdf['REGION']
 
     print(f" ✓ Datos básicos creados: {len(gdf)} comunas simuladas")
     return gdf
 
 
-def procesar_csv(csv_path):
+def _detectar_codificacion(ruta, n_bytes=65536):
     """
-    Procesa archivo CSV con datos electorales.
+    Estima la codificación de un archivo a partir de sus primeros bytes.
+
+    La detección se limita a las codificaciones de CODIFICACIONES_CSV para no
+    confundir archivos latin-1 con otras páginas de códigos parecidas.
 
     Args:
-        csv_path (str): Ruta al archivo CSV.
+        ruta (str): Ruta del archivo.
+        n_bytes (int): Cantidad de bytes a inspeccionar.
 
     Returns:
-        DataFrame: Datos electorales procesados.
-
-    Raises:
-        FileNotFoundError: Si el archivo no existe.
-        ValueError: Si faltan columnas requeridas.
+        str or None: Codificación detectada o None si no se pudo determinar.
     """
-    print(f"\n📊 PROCESANDO DATOS ELECTORALES...")
-    print(f" Cargando CSV: {csv_path}")
+    if charset_normalizer is None:
+        return None
 
-    if not os.path.exists(csv_path):
-        raise FileNotFoundError(f"Archivo no encontrado: {csv_path}")
+    with open(ruta, 'rb') as f:
+        cabecera = f.read(n_bytes)
+    mejor = charset_normalizer.from_bytes(cabecera, cp_isolation=CODIFICACIONES_CSV).best()
+    return mejor.encoding if mejor is not None else None
 
-    # Intentar diferentes codificaciones
-    codificaciones = ['utf-8-sig', 'latin-1', 'iso-8859-1', 'cp1252', 'utf-8']
 
-    for encoding in codificaciones:
+def cargar_datos_electorales(csv_path):
+    """
+    Lee el archivo CSV electoral detectando su codificación.
+
+    Usa la codificación detectada en los primeros bytes y, si falla, prueba
+    una lista de codificaciones habituales.
+
+    Args:
+        csv_path (str): Ruta al archivo CSV.
+
+    Returns:
+        DataFrame: Contenido del CSV sin procesar.
+    """
+    encoding = _detectar_codificacion(csv_path)
+    if encoding:
         try:
-            df = pd.read_csv(csv_path, encoding=encoding)
+            df = pd.read_csv(csv_path, encoding=encoding, engine='c', low_memory=False,
+                             na_values=VALORES_NA_CSV)
+            print(f" ✓ CSV cargado con encoding: {encoding} (detectado)")
+            return df
+        except (UnicodeDecodeError, LookupError):
+            pass
+
+    # Intentar diferentes codificaciones
+    for encoding in CODIFICACIONES_CSV:
+        try:
+            df = pd.read_csv(csv_path, encoding=encoding, engine='c', low_memory=False,
+                             na_values=VALORES_NA_CSV)
             print(f" ✓ CSV cargado con encoding: {encoding}")
-            break
+            return df
         except UnicodeDecodeError:
             continue
-    else:
-        df = pd.read_csv(csv_path)
-        print(" ✓ CSV cargado (encoding automático)")
+
+    df = pd.read_csv(csv_path, engine='c', low_memory=False, na_values=VALORES_NA_CSV)
+    print(" ✓ CSV cargado (encoding automático)")
+    return df
+
+
+def procesar_csv(csv_path):
+    """
+    Procesa archivo CSV con datos electorales.
+
+    Args:
+        csv_path (str): Ruta al archivo CSV.
+
+    Returns:
+        DataFrame: Datos electorales procesados.
+
+    Raises:
+        FileNotFoundError: Si el archivo no existe.
+        ValueError: Si faltan columnas requeridas.
+    """
+    print(f"\n📊 PROCESANDO DATOS ELECTORALES...")
+    print(f" Cargando CSV: {csv_path}")
+
+    if not os.path.exists(csv_path):
+        raise FileNotFoundError(f"Archivo no encontrado: {csv_path}")
+
+    df = cargar_datos_electorales(csv_path)
 
     print(f" Filas: {len(df)}")
     print(f" Columnas: {list(df.columns)}")
@@ -748,8 +1415,9 @@ def procesar_csv(csv_path):
     columnas_numericas = ['jara_pct', 'kast_pct', 'jara_votos', 'kast_votos',
                           'blanco_votos', 'nulo_votos', 'emitidos_votos']
 
+    # Las columnas que el parser C ya leyó como números no se vuelven a convertir
     for col in columnas_numericas:
-        if col in df.columns:
+        if col in df.columns and not pd.api.types.is_numeric_dtype(df[col]):
             df[col] = df[col].astype(str).str.replace(',', '.', regex=False)
             df[col] = pd.to_numeric(df[col], errors='coerce')
 
@@ -762,91 +1430,178 @@ def procesar_csv(csv_path):
         print(" Calculando votos de Kast a partir de porcentajes...")
         df['kast_votos'] = (df['kast_pct'] / 100) * df['emitidos_votos']
 
-    # Calcular diferencia porcentual
-    df['diferencia_pct'] = df['jara_pct'] - df['kast_pct']
+    # Calcular diferencia porcentual (directo sobre un arreglo preasignado)
+    diferencia = np.empty(len(df), dtype=np.float64)
+    np.subtract(df['jara_pct'].to_numpy(dtype=np.float64), df['kast_pct'].to_numpy(dtype=np.float64), out=diferencia)
+    df['diferencia_pct'] = diferencia
 
     # Calcular votos válidos si hay datos suficientes
     if all(col in df.columns for col in ['emitidos_votos', 'blanco_votos', 'nulo_votos']):
         print(" Calculando votos válidos...")
-        df['validos_votos'] = df['emitidos_votos'] - df['blanco_votos'] - df['nulo_votos']
-
-    # Validar porcentajes (deben estar entre 0 y 100)
-    invalid_rows = df[(df['jara_pct'] < 0) | (df['jara_pct'] > 100) | (df['kast_pct'] < 0) | (df['kast_pct'] > 100)]
-    if not invalid_rows.empty:
-        print(f" ⚠ Filas con porcentajes inválidos (>100 o <0): {len(invalid_rows)}")
-        df.loc[invalid_rows.index, ['jara_pct', 'kast_pct']] = np.nan
-
-    # Función auxiliar para mapear nombres de región a números
-    def mapear_region(nombre):
-        """Mapea nombre textual de región a número."""
-        if pd.isna(nombre):
-            return None
-
-        nombre_str = str(nombre).strip()
-
-        # Búsqueda exacta
-        for region_csv, num in NOMBRES_CSV_A_NUM.items():
-            if nombre_str.lower() == region_csv.lower():
-                return num
-
-        # Búsqueda parcial
-        for region_csv, num in NOMBRES_CSV_A_NUM.items():
-            if region_csv.lower() in nombre_str.lower():
-                return num
-
-        print(f" ⚠ No se pudo mapear región: '{nombre_str}'")
-        return None
+        emitidos, blancos, nulos = (df[col].to_numpy() for col in ['emitidos_votos', 'blanco_votos', 'nulo_votos'])
+        validos = np.empty(len(df), dtype=np.result_type(emitidos, blancos, nulos))
+        np.subtract(emitidos, blancos, out=validos)
+        np.subtract(validos, nulos, out=validos)
+        df['validos_votos'] = validos
+
+    # Reducir conteos de votos a int32 cuando son enteros completos.
+    # Los porcentajes se mantienen en float64 para no alterar los umbrales de color.
+    limite_int32 = np.iinfo(np.int32).max
+    for col in ['jara_votos', 'kast_votos', 'blanco_votos', 'nulo_votos', 'emitidos_votos', 'validos_votos']:
+        if col in df.columns:
+            valores = df[col]
+            if valores.notna().all() and (valores % 1 == 0).all() and valores.abs().max() <= limite_int32:
+                df[col] = valores.astype(np.int32)
+
+    # Validar porcentajes (deben estar entre 0 y 100; los NaN no cuentan como inválidos)
+    porcentajes = df[['jara_pct', 'kast_pct']]
+    invalidos = ((porcentajes < 0) | (porcentajes > 100)).any(axis=1)
+    n_invalidos = int(invalidos.sum())
+    if n_invalidos:
+        print(f" ⚠ Filas con porcentajes inválidos (>100 o <0): {n_invalidos}")
+        df.loc[invalidos, ['jara_pct', 'kast_pct']] = np.nan
 
     # Mapear regiones del CSV
     if 'region' in df.columns:
         print("\n Mapeando regiones del CSV a números:")
-        regiones_unicas = df['region'].unique()
-        for region in regiones_unicas:
-            region_num = mapear_region(region)
-            print(f" '{region}' -> {region_num}")
+        df['REGION_NUM'] = mapear_regiones_csv(df['region'])
+
+        # Búsqueda parcial solo para las variantes no registradas
+        sin_mapear = df['REGION_NUM'].isna()
+        if sin_mapear.any():
+            df.loc[sin_mapear, 'REGION_NUM'] = df.loc[sin_mapear, 'region'].apply(mapear_region)
 
-        df['REGION_NUM'] = df['region'].apply(mapear_region)
+        for region, region_num in df.drop_duplicates('region')[['region', 'REGION_NUM']].itertuples(index=False):
+            print(f" '{region}' -> {None if pd.isna(region_num) else region_num}")
+
+        df['REGION_NUM'] = df['REGION_NUM'].astype(_REGION_DTYPE)
     else:
         df['REGION_NUM'] = None
 
     # Normalizar nombres de comunas para matching
-    df['NOM_COM_NORM'] = df['comuna'].apply(normalizar_nombre)
+    df['NOM_COM_NORM'] = normalizar_nombres_serie(df['comuna'])
 
     # Estadísticas del CSV
-    comunas_con_datos = df['diferencia_pct'].notna().sum()
+    jara_gana, kast_gana, empates = _contar_ganadores(df['diferencia_pct'])
+    comunas_con_datos = jara_gana + kast_gana + empates
     dif_promedio = df['diferencia_pct'].mean() if comunas_con_datos > 0 else 0
 
     print(f"\n 📈 ESTADÍSTICAS DEL CSV:")
     print(f" Total comunas: {len(df)}")
     print(f" Comunas con datos: {comunas_con_datos}")
     print(f" Diferencia promedio: {dif_promedio:.2f}%")
-    print(f" Jara gana en: {(df['diferencia_pct'] > 0).sum()} comunas")
-    print(f" Kast gana en: {(df['diferencia_pct'] < 0).sum()} comunas")
+    print(f" Jara gana en: {jara_gana} comunas")
+    print(f" Kast gana en: {kast_gana} comunas")
 
     print(f" Columnas disponibles: {list(df.columns)}")
 
     return df
 
 
-def unir_datos(comunas, df_electoral):
+def _emparejar_difuso(mapa_data, df_electoral, umbral=UMBRAL_EMPAREJAMIENTO_DIFUSO):
+    """
+    Completa con emparejamiento difuso las comunas que quedaron sin datos tras el merge.
+
+    Solo compara nombres dentro de la misma región y contra nombres electorales
+    aún no usados, con fuzz.ratio (similitud de la cadena completa, de modo que
+    "san pedro" no coincide con "san pedro de la paz"). Si dos comunas eligen el
+    mismo candidato electoral, ambas se descartan. Cada pareja aceptada se
+    informa por consola. Sin rapidfuzz instalado no hace nada.
+
+    Args:
+        mapa_data (GeoDataFrame): Resultado del merge por nombre normalizado.
+        df_electoral (DataFrame): Datos electorales procesados.
+        umbral (int): Puntaje mínimo (0-100) para aceptar un emparejamiento.
+
+    Returns:
+        GeoDataFrame: mapa_data con las comunas emparejadas completadas.
+    """
+    sin_datos = mapa_data['diferencia_pct'].isna().to_numpy()
+    if process is None or not sin_datos.any() or 'REGION_NUM' not in df_electoral.columns:
+        return mapa_data
+
+    usados = set(mapa_data.loc[~sin_datos, 'NOM_COM_NORM'].astype(str))
+    candidatos = df_electoral[~df_electoral['NOM_COM_NORM'].astype(str).isin(usados)]
+    if candidatos.empty:
+        return mapa_data
+
+    regiones_mapa = mapa_data['REGION_NUM'].to_numpy()
+    regiones_candidatos = pd.to_numeric(candidatos['REGION_NUM'], errors='coerce').to_numpy()
+    nombres_candidatos = candidatos['NOM_COM_NORM'].astype(str).to_numpy()
+
+    # Mejor candidato de cada comuna sin datos, buscando solo en su región
+    elegidos = {}
+    for region_num in pd.unique(regiones_mapa[sin_datos]):
+        filas = np.flatnonzero(sin_datos & (regiones_mapa == region_num))
+        opciones = np.flatnonzero(regiones_candidatos == region_num)
+        if opciones.size == 0:
+            continue
+
+        nombres = mapa_data['NOM_COM_NORM'].iloc[filas].astype(str).tolist()
+        puntajes = process.cdist(nombres, nombres_candidatos[opciones].tolist(), scorer=fuzz.ratio)
+        mejor = puntajes.argmax(axis=1)
+        for fila, columna, puntaje in zip(filas, mejor, puntajes[np.arange(len(filas)), mejor]):
+            if puntaje >= umbral:
+                elegidos[fila] = (opciones[columna], puntaje)
+
+    # Rechazar candidatos electorales elegidos por más de una comuna
+    veces = pd.Series([candidato for candidato, _ in elegidos.values()]).value_counts()
+    for fila, (candidato, _) in list(elegidos.items()):
+        if veces[candidato] > 1:
+            print(f" ⚠ Emparejamiento difuso ambiguo descartado: '{mapa_data['NOM_COM'].iloc[fila]}' "
+                  f"-> '{nombres_candidatos[candidato]}'")
+            del elegidos[fila]
+
+    if not elegidos:
+        return mapa_data
+
+    filas = np.fromiter(elegidos.keys(), dtype=np.intp)
+    indices = np.fromiter((candidato for candidato, _ in elegidos.values()), dtype=np.intp)
+    for fila, (candidato, puntaje) in elegidos.items():
+        print(f"   ~ '{mapa_data['NOM_COM'].iloc[fila]}' -> '{nombres_candidatos[candidato]}' "
+              f"(región {regiones_mapa[fila]}, similitud {puntaje:.0f})")
+
+    columnas = [c for c in df_electoral.columns if c not in ('NOM_COM_NORM', 'REGION_NUM') and c in mapa_data.columns]
+    valores = candidatos.iloc[indices][columnas]
+    for col in columnas:
+        mapa_data.iloc[filas, mapa_data.columns.get_loc(col)] = valores[col].to_numpy()
+
+    print(f" ✓ Emparejamiento difuso: {len(filas)} comunas adicionales con datos")
+    return mapa_data
+
+
+def unir_datos(comunas, df_electoral, emparejamiento_difuso=EMPAREJAMIENTO_DIFUSO):
     """
     Une datos geográficos con datos electorales.
 
     Args:
         comunas (GeoDataFrame): Datos geográficos de comunas.
         df_electoral (DataFrame): Datos electorales procesados.
+        emparejamiento_difuso (bool): Si True, intenta emparejar por similitud
+            de nombre (dentro de la región) las comunas sin coincidencia exacta.
 
     Returns:
         GeoDataFrame: Datos combinados con geometrías y resultados electorales.
     """
     print("\n🔄 UNIENDO DATOS GEOGRÁFICOS Y ELECTORALES...")
 
-    # Asegurar columna REGION_NUM en datos geográficos
+    # Asegurar columna REGION_NUM en datos geográficos (las columnas nuevas se
+    # agregan con assign para no modificar la capa del llamador)
     if 'REGION_NUM' not in comunas.columns and 'REGION' in comunas.columns:
-        comunas['REGION_NUM'] = comunas['REGION']
+        comunas = comunas.assign(REGION_NUM=comunas['REGION'])
 
-    # Normalizar nombres de comunas en ambos datasets
-    comunas['NOM_COM_NORM'] = comunas['NOM_COM'].apply(normalizar_nombre)
+    # Normalizar nombres de comunas (solo si la capa no los trae ya calculados)
+    if 'NOM_COM_NORM' in comunas.columns:
+        nombres_norm = comunas['NOM_COM_NORM'].astype(str)
+    else:
+        nombres_norm = normalizar_nombres_serie(comunas['NOM_COM']).astype(str)
+
+    # Claves categóricas con categorías comunes: el merge compara códigos enteros
+    tipo_nombres = pd.CategoricalDtype(pd.unique(np.concatenate([
+        nombres_norm.to_numpy(), df_electoral['NOM_COM_NORM'].astype(str).to_numpy()
+    ])))
+    comunas = comunas.assign(NOM_COM_NORM=nombres_norm.astype(tipo_nombres))
+    df_electoral = df_electoral.assign(NOM_COM_NORM=df_electoral['NOM_COM_NORM'].astype(str).astype(tipo_nombres))
 
     # Mostrar ejemplos de normalización para debugging
     print(" 🔍 Ejemplos de normalización (geográficas vs electorales):")
@@ -855,43 +1610,19 @@ def unir_datos(comunas, df_electoral):
         print(f" Geo: '{comunas.iloc[i]['NOM_COM']}' -> '{comunas.iloc[i]['NOM_COM_NORM']}'")
         print(f" CSV: '{df_electoral.iloc[i]['comuna']}' -> '{df_electoral.iloc[i]['NOM_COM_NORM']}'")
 
-    # Realizar merge por nombre normalizado y región
+    # Realizar merge por nombre normalizado y región (solo por nombre si la capa no trae región)
     print(" Realizando merge...")
-    mapa_data = comunas.merge(
-        df_electoral,
-        left_on=['NOM_COM_NORM', 'REGION_NUM'],
-        right_on=['NOM_COM_NORM', 'REGION_NUM'],
-        how='left'
-    )
+    claves = ['NOM_COM_NORM', 'REGION_NUM'] if 'REGION_NUM' in comunas.columns else ['NOM_COM_NORM']
 
-    # Si no hay REGION_NUM, intentar merge solo por nombre
-    if 'REGION_NUM' not in mapa_data.columns:
-        mapa_data = comunas.merge(
-            df_electoral,
-            left_on='NOM_COM_NORM',
-            right_on='NOM_COM_NORM',
-            how='left'
-        )
-
-    # Gestionar columnas de región duplicadas
-    if 'REGION_NUM_x' in mapa_data.columns:
-        mapa_data['REGION_NUM'] = mapa_data['REGION_NUM_x']
-    elif 'REGION_NUM_y' in mapa_data.columns:
-        mapa_data['REGION_NUM'] = mapa_data['REGION_NUM_y']
-    elif 'REGION_NUM' not in mapa_data.columns and 'REGION' in mapa_data.columns:
-        mapa_data['REGION_NUM'] = mapa_data['REGION']
+    # Solo las columnas electorales necesarias y que no existan ya en la capa geográfica
+    columnas_derecha = [c for c in df_electoral.columns
+                        if c in claves or (c not in comunas.columns and c not in COLUMNAS_ELECTORALES_NO_UNIDAS)]
+    mapa_data = comunas.merge(df_electoral[columnas_derecha], on=claves, how='left', suffixes=(False, False))
 
     # Si aún no hay REGION_NUM, intentar extraer de código de comuna
     if 'REGION_NUM' not in mapa_data.columns and 'COD_COM' in mapa_data.columns:
-        def extraer_region_de_codigo(codigo):
-            try:
-                cod_str = str(codigo)
-                if len(cod_str) >= 2:
-                    return int(cod_str[:2])
-            except:
-                return None
-
-        mapa_data['REGION_NUM'] = mapa_data['COD_COM'].apply(extraer_region_de_codigo)
+        codigos = mapa_data['COD_COM'].astype(str)
+        mapa_data['REGION_NUM'] = pd.to_numeric(codigos.str[:2].where(codigos.str.len() >= 2), errors='coerce')
 
     # Si todo falla, asignar Región Metropolitana como predeterminada
     if 'REGION_NUM' not in mapa_data.columns or mapa_data['REGION_NUM'].isna().all():
@@ -900,6 +1631,15 @@ def unir_datos(comunas, df_electoral):
     # Asegurar tipo numérico
     mapa_data['REGION_NUM'] = pd.to_numeric(mapa_data['REGION_NUM'], errors='coerce').fillna(13).astype(int)
 
+    # Emparejamiento difuso (opcional) para las comunas que no coincidieron por nombre
+    if emparejamiento_difuso:
+        mapa_data = _emparejar_difuso(mapa_data, df_electoral)
+
+    # Región y nombre como categóricas: los filtros por región comparan
+    # códigos de 1 byte y el agrupamiento reparte por código
+    mapa_data['REGION_NUM'] = mapa_data['REGION_NUM'].astype('category')
+    mapa_data['NOM_COM'] = mapa_data['NOM_COM'].astype('category')
+
     # Identificar comunas sin datos
     sin_datos = mapa_data[mapa_data['diferencia_pct'].isna()]['NOM_COM'].tolist()
     if sin_datos:
@@ -917,726 +1657,605 @@ def unir_datos(comunas, df_electoral):
 
     # Estadísticas de resultados si hay datos
     if comunas_con_datos > 0 and 'diferencia_pct' in mapa_data.columns:
-        jara_gana = (mapa_data['diferencia_pct'] > 0).sum()
-        kast_gana = (mapa_data['diferencia_pct'] < 0).sum()
-        empates = (mapa_data['diferencia_pct'] == 0).sum()
+        jara_gana, kast_gana, empates = _contar_ganadores(mapa_data['diferencia_pct'])
 
         print(f" Jara gana en: {jara_gana} comunas")
         print(f" Kast gana en: {kast_gana} comunas")
         print(f" Empates: {empates} comunas")
 
+    # Puntos de anclaje de etiquetas (_lx, _ly), calculados una sola vez por
+    # comuna; las funciones de etiquetado los leen en vez de recalcularlos
+    puntos = shapely.point_on_surface(np.asarray(mapa_data.geometry.values))
+    mapa_data['_lx'] = shapely.get_x(puntos)
+    mapa_data['_ly'] = shapely.get_y(puntos)
+
+    # Construir el índice espacial (STRtree) una sola vez; las consultas por
+    # límites de los mapas de islas lo reutilizan
+    mapa_data.sindex
+
     return mapa_data
 
 
 # ============================================================================
-# FUNCIONES PARA AGREGAR ETIQUETAS A MAPAS
+# FUNCIONES AUXILIARES DE DIBUJO
 # ============================================================================
 
-def agregar_nombres_comunas(ax, region_data, fontsize=7, exclude_comunas=None):
+def _ajustar_diseno(rect=(0, 0, 1, 1)):
     """
-    Agrega nombres de comunas a un mapa.
+    Aplica tight_layout a la figura actual sin el aviso de ejes incompatibles.
+
+    Las figuras con GridSpec anidados o colorbars en ejes propios generan
+    siempre ese UserWarning aunque el resultado sea correcto; solo se silencia
+    ese aviso, en esta llamada.
 
     Args:
-        ax (matplotlib.axes.Axes): Ejes donde dibujar.
-        region_data (GeoDataFrame): Datos de la región.
-        fontsize (int): Tamaño de fuente para etiquetas.
-        exclude_comunas (list): Lista de nombres de comunas a excluir.
+        rect (tuple): Rectángulo (izq, abajo, der, arriba) disponible para los ejes.
     """
-    print(f"  Agregando nombres de comunas (tamaño fuente: {fontsize})...")
+    with warnings.catch_warnings():
+        warnings.filterwarnings('ignore', category=UserWarning,
+                                message='This figure includes Axes that are not compatible with tight_layout')
+        plt.tight_layout(rect=rect)
 
-    if exclude_comunas is None:
-        exclude_comunas = []
 
-    nombres_agregados = 0
-    for idx, row in region_data.iterrows():
-        try:
-            if 'NOM_COM' in row and row['NOM_COM'] and 'geometry' in row and row['geometry']:
-                comuna_nombre = str(row['NOM_COM'])
-                if comuna_nombre in exclude_comunas:
-                    continue
-
-                point = row['geometry'].representative_point()
-
-                nombre_comuna = comuna_nombre
-
-                # Acortar nombres largos
-                max_length = 20 if fontsize <= 7 else 25
-
-                if len(nombre_comuna) > max_length:
-                    if "de la" in nombre_comuna:
-                        nombre_comuna = nombre_comuna.replace("de la ", "")
-                    elif "del " in nombre_comuna:
-                        nombre_comuna = nombre_comuna.replace("del ", "")
-                    elif "de " in nombre_comuna:
-                        nombre_comuna = nombre_comuna.replace("de ", "")
-                    elif "General " in nombre_comuna:
-                        nombre_comuna = nombre_comuna.replace("General ", "Gral. ")
-
-                # Determinar color de texto basado en color de fondo
-                if 'color' in row:
-                    color_hex = row['color']
-                    if color_hex.startswith('#'):
-                        r = int(color_hex[1:3], 16) / 255
-                        g = int(color_hex[3:5], 16) / 255
-                        b = int(color_hex[5:7], 16) / 255
-
-                        luminosidad = 0.299 * r + 0.587 * g + 0.114 * b
-
-                        text_color = 'white' if luminosidad < 0.5 else 'black'
-                    else:
-                        text_color = 'black'
-                else:
-                    text_color = 'black'
+def _coleccion_poligonos(gdf, colores, edgecolor='black', linewidth=0.5):
+    """
+    Construye una única colección de polígonos para todas las comunas.
 
-                bbox_alpha = 0.6 if fontsize <= 7 else 0.7
+    Extrae todas las coordenadas de una vez con shapely.to_ragged_array y arma
+    un trazado compuesto por comuna (anillos exteriores e interiores). Los
+    anillos se orientan antes (interiores en sentido contrario al exterior)
+    para que el relleno deje los huecos abiertos, como GeoDataFrame.plot.
 
-                # Agregar texto con fondo semitransparente
-                ax.text(point.x, point.y, nombre_comuna,
-                        fontsize=fontsize,
-                        ha='center', va='center',
-                        color=text_color,
-                        fontweight='normal',
-                        bbox=dict(boxstyle="round,pad=0.3",
-                                  facecolor='white' if text_color == 'black' else 'black',
-                                  edgecolor='none',
-                                  alpha=bbox_alpha))
-                nombres_agregados += 1
-        except Exception as e:
-            continue
+    Args:
+        gdf (GeoDataFrame): Comunas a dibujar.
+        colores (array-like): Color de relleno por fila de gdf.
+        edgecolor (str): Color de los bordes.
+        linewidth (float): Grosor de los bordes.
 
-    print(f"  ✓ Nombres de comunas agregados: {nombres_agregados}")
+    Returns:
+        PathCollection: Colección lista para ax.add_collection.
+    """
+    validas = ~(gdf.geometry.isna() | gdf.geometry.is_empty).to_numpy()
+    geometrias = gdf.geometry.values[validas]
+    colores = np.asarray(colores, dtype=str)[validas]
 
+    if len(geometrias) == 0:
+        return PathCollection([], edgecolors=edgecolor, linewidths=linewidth)
 
-def agregar_etiquetas_region_metropolitana(ax, region_data):
+    # Con la regla de relleno nonzero de Agg, un hueco orientado igual que su
+    # anillo exterior se pinta; orient_polygons requiere shapely >= 2.1
+    orientar = getattr(shapely, 'orient_polygons', shapely.normalize)
+    _, coords, offsets = shapely.to_ragged_array(orientar(geometrias))
+    anillos = offsets[0]
+
+    # Códigos de trazado: MOVETO al inicio de cada anillo, CLOSEPOLY al final
+    codigos = np.full(len(coords), mpath.Path.LINETO, dtype=mpath.Path.code_type)
+    codigos[anillos[:-1]] = mpath.Path.MOVETO
+    codigos[anillos[1:] - 1] = mpath.Path.CLOSEPOLY
+
+    # Límites de cada fila en el arreglo de coordenadas
+    limites = offsets[-1]
+    for nivel in reversed(offsets[:-1]):
+        limites = nivel[limites]
+
+    trazados = [mpath.Path(coords[inicio:fin], codigos[inicio:fin])
+                for inicio, fin in zip(limites[:-1], limites[1:])]
+
+    return PathCollection(trazados, facecolors=colores, edgecolors=edgecolor, linewidths=linewidth)
+
+
+def _coleccion_parches(gdf, colores, edgecolor='black', linewidth=0.5):
     """
-    Agrega etiquetas especiales para comunas de la Región Metropolitana.
+    Construye una PatchCollection simple con el anillo exterior de cada polígono.
 
-    Usa números para comunas pequeñas y nombres para otras.
+    Es el respaldo de _coleccion_poligonos: separa los MultiPolygon en sus
+    partes y dibuja todo como un único artista, sin huecos interiores.
 
     Args:
-        ax (matplotlib.axes.Axes): Ejes donde dibujar.
-        region_data (GeoDataFrame): Datos de la Región Metropolitana.
+        gdf (GeoDataFrame): Comunas a dibujar.
+        colores (array-like): Color de relleno por fila de gdf.
+        edgecolor (str): Color de los bordes.
+        linewidth (float): Grosor de los bordes.
+
+    Returns:
+        PatchCollection: Colección lista para ax.add_collection.
     """
-    print(f"  Agregando etiquetas especiales para Región Metropolitana...")
+    validas = ~(gdf.geometry.isna() | gdf.geometry.is_empty).to_numpy()
+    colores = np.asarray(colores, dtype=str)[validas]
 
-    nombres_agregados = 0
-    for idx, row in region_data.iterrows():
-        try:
-            if 'NOM_COM' in row and row['NOM_COM'] and 'geometry' in row and row['geometry']:
-                comuna_nombre = str(row['NOM_COM'])
-
-                point = row['geometry'].representative_point()
-
-                # Determinar tipo de etiqueta (número o texto)
-                if comuna_nombre in COMUNAS_NUMEROS_RM:
-                    etiqueta = COMUNAS_NUMEROS_RM[comuna_nombre]
-                    fontsize = TAMANOS_FUENTE_AREAS_METROPOLITANAS['region_metropolitana_numeros']
-                    fontweight = 'normal'
-                elif comuna_nombre in COMUNAS_ETIQUETAS_RM:
-                    etiqueta = comuna_nombre
-                    if len(etiqueta) > 15:
-                        etiqueta = etiqueta[:12] + '...'
-                    fontsize = TAMANOS_FUENTE_AREAS_METROPOLITANAS['region_metropolitana_etiquetas']
-                    fontweight = 'normal'
-                else:
-                    continue
-
-                # Determinar color de texto
-                if 'color' in row:
-                    color_hex = row['color']
-                    if color_hex.startswith('#'):
-                        r = int(color_hex[1:3], 16) / 255
-                        g = int(color_hex[3:5], 16) / 255
-                        b = int(color_hex[5:7], 16) / 255
-                        luminosidad = 0.299 * r + 0.587 * g + 0.114 * b
-                        text_color = 'white' if luminosidad < 0.5 else 'black'
-                    else:
-                        text_color = 'black'
-                else:
-                    text_color = 'black'
-
-                # Ajustes de posición para comunas específicas
-                offset_x = 0
-                offset_y = 0
-
-                if comuna_nombre == "Lo Barnechea":
-                    offset_y = 0.01
-                elif comuna_nombre == "Colina":
-                    offset_x = 0.005
-                elif comuna_nombre == "Lampa":
-                    offset_y = -0.005
-                elif comuna_nombre == "Curacaví":
-                    offset_x = -0.008
-                elif comuna_nombre == "María Pinto":
-                    offset_y = 0.008
-                elif comuna_nombre == "Melipilla":
-                    offset_x = 0.01
-                elif comuna_nombre == "San José de Maipo":
-                    offset_x = -0.01
-
-                # Agregar etiqueta
-                ax.text(point.x + offset_x, point.y + offset_y, etiqueta,
-                        fontsize=fontsize,
-                        ha='center', va='center',
-                        color=text_color,
-                        fontweight=fontweight,
-                        bbox=dict(boxstyle="round,pad=0.3",
-                                  facecolor='white' if text_color == 'black' else 'black',
-                                  edgecolor='none',
-                                  alpha=0.7))
-                nombres_agregados += 1
-        except Exception as e:
-            continue
+    partes, indices = shapely.get_parts(gdf.geometry.values[validas], return_index=True)
+    exteriores = shapely.get_exterior_ring(partes)
+    con_anillo = ~shapely.is_missing(exteriores)
 
-    print(f"  ✓ Etiquetas especiales para Región Metropolitana agregadas: {nombres_agregados}")
+    parches = [MplPolygon(shapely.get_coordinates(anillo), closed=True)
+               for anillo in exteriores[con_anillo]]
+    return PatchCollection(parches, facecolors=colores[indices[con_anillo]],
+                           edgecolors=edgecolor, linewidths=linewidth)
 
 
-def agregar_etiquetas_gran_santiago(ax, region_data, usar_numeros=True):
+def _dibujar_leyenda_diferencias(ax, titulo, fontsize=9, title_fontsize=11):
     """
-    Agrega etiquetas especiales para el Gran Santiago.
+    Dibuja la simbología de diferencias en unos ejes dedicados.
+
+    Todos los recuadros de color se dibujan como una sola PolyCollection,
+    más una etiqueta de texto por entrada.
 
     Args:
-        ax (matplotlib.axes.Axes): Ejes donde dibujar.
-        region_data (GeoDataFrame): Datos del Gran Santiago.
-        usar_numeros (bool): Si True, usa números en lugar de nombres.
+        ax (matplotlib.axes.Axes): Ejes dedicados a la simbología.
+        titulo (str): Título de la simbología.
+        fontsize (int): Tamaño de fuente de las etiquetas.
+        title_fontsize (int): Tamaño de fuente del título.
     """
-    print(f"  Agregando etiquetas especiales para Gran Santiago...")
+    n = len(LEYENDA_DIFERENCIA)
 
-    nombres_agregados = 0
-    for idx, row in region_data.iterrows():
-        try:
-            if 'NOM_COM' in row and row['NOM_COM'] and 'geometry' in row and row['geometry']:
-                comuna_nombre = str(row['NOM_COM'])
+    ax.add_collection(PolyCollection(_LEYENDA_VERTICES, facecolors=_LEYENDA_COLORES,
+                                     edgecolors='none'))
 
-                point = row['geometry'].representative_point()
+    for i, (_, etiqueta) in enumerate(LEYENDA_DIFERENCIA):
+        ax.text(1.6, -i - 0.35, etiqueta, ha='left', va='center', fontsize=fontsize)
 
-                # Determinar etiqueta (número o texto)
-                if usar_numeros and comuna_nombre in MAQUEO_COMUNAS_NUMEROS:
-                    etiqueta = MAQUEO_COMUNAS_NUMEROS[comuna_nombre]
-                    fontsize = 15
-                else:
-                    etiqueta = comuna_nombre
-                    if len(etiqueta) > 15:
-                        etiqueta = etiqueta[:12] + '...'
-                    fontsize = 15
-
-                # Determinar color de texto
-                if 'color' in row:
-                    color_hex = row['color']
-                    if color_hex.startswith('#'):
-                        r = int(color_hex[1:3], 16) / 255
-                        g = int(color_hex[3:5], 16) / 255
-                        b = int(color_hex[5:7], 16) / 255
-                        luminosidad = 0.299 * r + 0.587 * g + 0.114 * b
-                        text_color = 'white' if luminosidad < 0.5 else 'black'
-                    else:
-                        text_color = 'black'
-                else:
-                    text_color = 'black'
+    ax.text(0, 1.0, titulo, ha='left', va='center', fontsize=title_fontsize)
 
-                # Agregar etiqueta
-                ax.text(point.x, point.y, etiqueta,
-                        fontsize=fontsize,
-                        ha='center', va='center',
-                        color=text_color,
-                        fontweight='normal',
-                        bbox=dict(boxstyle="round,pad=0.3",
-                                  facecolor='white' if text_color == 'black' else 'black',
-                                  edgecolor='none',
-                                  alpha=0.7))
-                nombres_agregados += 1
-        except Exception as e:
-            continue
+    ax.set_xlim(-0.4, 10)
+    ax.set_ylim(-n - 0.3, 1.8)
+    ax.set_axis_off()
 
-    print(f"  ✓ Etiquetas especiales agregadas: {nombres_agregados}")
 
+def _dibujar_columna_simbologia(ax, x, y, lineas, paso, fontsize):
+    """
+    Dibuja una columna de la simbología como un único texto multilínea.
+
+    El interlineado se calcula a partir de la altura de los ejes para que
+    cada línea quede centrada en y, y - paso, y - 2*paso, ... igual que al
+    dibujar un texto por línea.
 
-def agregar_etiquetas_region_5_valparaiso(ax, region_data):
+    Args:
+        ax (matplotlib.axes.Axes): Ejes de la simbología.
+        x (float): Posición horizontal (fracción de los ejes).
+        y (float): Centro vertical de la primera línea (fracción de los ejes).
+        lineas (list): Textos de la columna, de arriba hacia abajo.
+        paso (float): Distancia entre líneas (fracción de la altura de los ejes).
+        fontsize (int): Tamaño de fuente.
     """
-    Agrega etiquetas especiales para comunas de la Región de Valparaíso.
+    if not lineas:
+        return
+
+    alto_pt = ax.bbox.height * 72 / ax.figure.dpi
+    # Subir media línea para anclar el bloque por arriba en el centro de la primera
+    media_linea = ScaledTranslation(0, fontsize / 144, ax.figure.dpi_scale_trans)
+    ax.text(x, y, '\n'.join(lineas),
+            ha='left', va='top',
+            fontsize=fontsize, linespacing=paso * alto_pt / fontsize,
+            transform=ax.transAxes + media_linea)
+
+
+def _dibujar_escala_diferencia(fig, ax_escala):
+    """
+    Dibuja la barra de colores horizontal de diferencias de un panel de estadísticas.
+
+    La normalización y las marcas son constantes del módulo; solo el
+    ScalarMappable se crea por figura, porque la barra de colores queda
+    conectada a él.
 
     Args:
-        ax (matplotlib.axes.Axes): Ejes donde dibujar.
-        region_data (GeoDataFrame): Datos de la Región de Valparaíso.
+        fig (matplotlib.figure.Figure): Figura que contiene los ejes.
+        ax_escala (matplotlib.axes.Axes): Ejes donde se dibuja la barra.
+
+    Returns:
+        matplotlib.colorbar.Colorbar: Barra de colores creada.
     """
-    print(f"  Agregando etiquetas especiales para Región 5 (Valparaíso)...")
+    sm = ScalarMappable(cmap=cmap_continuo, norm=_NORMA_DIFERENCIA)
+    sm.set_array([])
 
-    nombres_agregados = 0
-    for idx, row in region_data.iterrows():
-        try:
-            if 'NOM_COM' in row and row['NOM_COM'] and 'geometry' in row and row['geometry']:
-                comuna_nombre = str(row['NOM_COM'])
+    cbar = fig.colorbar(sm, cax=ax_escala, orientation='horizontal', fraction=0.9)
+    cbar.set_label('Diferencia (Jara% - Kast%)', fontsize=8, fontweight='bold', labelpad=3)
 
-                point = row['geometry'].representative_point()
+    cbar.set_ticks(_MARCAS_DIFERENCIA)
+    cbar.set_ticklabels(_ETIQUETAS_MARCAS_DIFERENCIA)
+    cbar.ax.tick_params(labelsize=6)
+    return cbar
 
-                # Determinar tipo de etiqueta
-                if comuna_nombre in COMUNAS_NUMEROS_REGION_5:
-                    etiqueta = COMUNAS_NUMEROS_REGION_5[comuna_nombre]
-                    fontsize = 9
-                    fontweight = 'normal'
-                else:
-                    etiqueta = comuna_nombre
-                    if len(etiqueta) > 15:
-                        etiqueta = etiqueta[:12] + '...'
-                    fontsize = 9
-                    fontweight = 'normal'
-
-                # Determinar color de texto
-                if 'color' in row:
-                    color_hex = row['color']
-                    if color_hex.startswith('#'):
-                        r = int(color_hex[1:3], 16) / 255
-                        g = int(color_hex[3:5], 16) / 255
-                        b = int(color_hex[5:7], 16) / 255
-                        luminosidad = 0.299 * r + 0.587 * g + 0.114 * b
-                        text_color = 'white' if luminosidad < 0.5 else 'black'
-                    else:
-                        text_color = 'black'
-                else:
-                    text_color = 'black'
 
-                # Agregar etiqueta
-                ax.text(point.x, point.y, etiqueta,
-                        fontsize=fontsize,
-                        ha='center', va='center',
-                        color=text_color,
-                        fontweight=fontweight,
-                        bbox=dict(boxstyle="round,pad=0.3",
-                                  facecolor='white' if text_color == 'black' else 'black',
-                                  edgecolor='none',
-                                  alpha=0.7))
-                nombres_agregados += 1
-        except Exception as e:
-            continue
+# ============================================================================
+# FUNCIONES PARA AGREGAR ETIQUETAS A MAPAS
+# ============================================================================
+
+# Área mínima (grados², caja envolvente) para etiquetar una comuna; 0 etiqueta
+# todas. Por defecto no se omite ninguna: las comunas pequeñas llevan número y
+# la simbología de cada mapa las referencia.
+AREA_MINIMA_ETIQUETA = 0.0
 
-    print(f"  ✓ Etiquetas especiales para Región 5 (Valparaíso) agregadas: {nombres_agregados}")
+# Reglas para acortar nombres largos, en orden de prioridad: se aplica solo
+# la primera regla cuyo token aparezca en el nombre.
+_REGLAS_ACORTAR_NOMBRE = (
+    ("de la ", ""), ("del ", ""), ("de ", ""), ("General ", "Gral. ")
+)
+_PATRON_ACORTAR_NOMBRE = re.compile("|".join(re.escape(token) for token, _ in _REGLAS_ACORTAR_NOMBRE))
 
 
-def agregar_etiquetas_region_6_ohiggins(ax, region_data):
+def _acortar_nombre(nombre, max_length):
     """
-    Agrega etiquetas especiales para comunas de la Región de O'Higgins.
+    Acorta un nombre de comuna que supera el largo máximo de etiqueta.
+
+    Un solo escaneo con la expresión precompilada detecta qué tokens aparecen;
+    luego se reemplaza el de mayor prioridad.
 
     Args:
-        ax (matplotlib.axes.Axes): Ejes donde dibujar.
-        region_data (GeoDataFrame): Datos de la Región de O'Higgins.
+        nombre (str): Nombre de la comuna.
+        max_length (int): Largo a partir del cual se acorta.
+
+    Returns:
+        str: Nombre acortado (o el original si no excede el largo).
     """
-    print(f"  Agregando etiquetas especiales para Región 6 (O'Higgins)...")
+    if len(nombre) <= max_length:
+        return nombre
 
-    nombres_agregados = 0
-    for idx, row in region_data.iterrows():
-        try:
-            if 'NOM_COM' in row and row['NOM_COM'] and 'geometry' in row and row['geometry']:
-                comuna_nombre = str(row['NOM_COM'])
+    encontrados = set(_PATRON_ACORTAR_NOMBRE.findall(nombre))
+    for token, reemplazo in _REGLAS_ACORTAR_NOMBRE:
+        if token in encontrados:
+            return nombre.replace(token, reemplazo)
+    return nombre
 
-                point = row['geometry'].representative_point()
 
-                # Determinar tipo de etiqueta
-                if comuna_nombre in COMUNAS_NUMEROS_REGION_6:
-                    etiqueta = COMUNAS_NUMEROS_REGION_6[comuna_nombre]
-                    fontsize = 9
-                    fontweight = 'normal'
-                else:
-                    etiqueta = comuna_nombre
-                    if len(etiqueta) > 15:
-                        etiqueta = etiqueta[:12] + '...'
-                    fontsize = 9
-                    fontweight = 'normal'
-
-                # Determinar color de texto
-                if 'color' in row:
-                    color_hex = row['color']
-                    if color_hex.startswith('#'):
-                        r = int(color_hex[1:3], 16) / 255
-                        g = int(color_hex[3:5], 16) / 255
-                        b = int(color_hex[5:7], 16) / 255
-                        luminosidad = 0.299 * r + 0.587 * g + 0.114 * b
-                        text_color = 'white' if luminosidad < 0.5 else 'black'
-                    else:
-                        text_color = 'black'
-                else:
-                    text_color = 'black'
+def _puntos_etiqueta(region_data):
+    """
+    Calcula los puntos de anclaje de etiquetas para todas las comunas.
 
-                # Agregar etiqueta
-                ax.text(point.x, point.y, etiqueta,
-                        fontsize=fontsize,
-                        ha='center', va='center',
-                        color=text_color,
-                        fontweight=fontweight,
-                        bbox=dict(boxstyle="round,pad=0.3",
-                                  facecolor='white' if text_color == 'black' else 'black',
-                                  edgecolor='none',
-                                  alpha=0.7))
-                nombres_agregados += 1
-        except Exception as e:
-            continue
+    Reutiliza las columnas _lx/_ly precalculadas en unir_datos. Si no están
+    (p. ej. datos del Gran Santiago cargados aparte), usa
+    shapely.point_on_surface (el equivalente vectorizado de
+    representative_point) sobre el arreglo de geometrías, en una sola pasada
+    por GEOS.
 
-    print(f"  ✓ Etiquetas especiales para Región 6 (O'Higgins) agregadas: {nombres_agregados}")
+    Args:
+        region_data (GeoDataFrame): Datos de las comunas a etiquetar.
+
+    Returns:
+        tuple: Arreglos numpy (xs, ys) alineados con las filas de region_data.
+    """
+    if '_lx' in region_data.columns and '_ly' in region_data.columns:
+        return region_data['_lx'].to_numpy(), region_data['_ly'].to_numpy()
+
+    puntos = shapely.point_on_surface(np.asarray(region_data.geometry.values))
+    return shapely.get_x(puntos), shapely.get_y(puntos)
 
 
-def agregar_etiquetas_region_7_maule(ax, region_data):
+# Formato válido de color de relleno para calcular la luminosidad
+_PATRON_COLOR_HEX = re.compile(r'#[0-9A-Fa-f]{6}')
+
+
+@functools.lru_cache(maxsize=512)
+def _color_texto_para(color):
     """
-    Agrega etiquetas especiales para comunas de la Región del Maule.
+    Decide el color de texto (blanco o negro) para un color de relleno.
+
+    La paleta de los mapas tiene pocos colores distintos, así que el resultado
+    se memoiza y se reutiliza entre regiones.
 
     Args:
-        ax (matplotlib.axes.Axes): Ejes donde dibujar.
-        region_data (GeoDataFrame): Datos de la Región del Maule.
+        color (str): Color de relleno en formato #RRGGBB (ya validado).
+
+    Returns:
+        str: 'white' si el fondo es oscuro, 'black' en otro caso.
     """
-    print(f"  Agregando etiquetas especiales para Región 7 (Maule)...")
+    valor = int(color[1:7], 16)
+    r = ((valor >> 16) & 0xFF) / 255
+    g = ((valor >> 8) & 0xFF) / 255
+    b = (valor & 0xFF) / 255
+    luminosidad = 0.299 * r + 0.587 * g + 0.114 * b
+    return 'white' if luminosidad < 0.5 else 'black'
 
-    nombres_agregados = 0
-    for idx, row in region_data.iterrows():
-        try:
-            if 'NOM_COM' in row and row['NOM_COM'] and 'geometry' in row and row['geometry']:
-                comuna_nombre = str(row['NOM_COM'])
 
-                point = row['geometry'].representative_point()
+def _colores_texto(region_data):
+    """
+    Calcula el color de texto (blanco o negro) de cada comuna según su relleno.
 
-                # Determinar tipo de etiqueta
-                if comuna_nombre in COMUNAS_NUMEROS_REGION_7:
-                    etiqueta = COMUNAS_NUMEROS_REGION_7[comuna_nombre]
-                    fontsize = 9
-                    fontweight = 'normal'
-                else:
-                    etiqueta = comuna_nombre
-                    if len(etiqueta) > 15:
-                        etiqueta = etiqueta[:12] + '...'
-                    fontsize = 9
-                    fontweight = 'normal'
-
-                # Determinar color de texto
-                if 'color' in row:
-                    color_hex = row['color']
-                    if color_hex.startswith('#'):
-                        r = int(color_hex[1:3], 16) / 255
-                        g = int(color_hex[3:5], 16) / 255
-                        b = int(color_hex[5:7], 16) / 255
-                        luminosidad = 0.299 * r + 0.587 * g + 0.114 * b
-                        text_color = 'white' if luminosidad < 0.5 else 'black'
-                    else:
-                        text_color = 'black'
-                else:
-                    text_color = 'black'
+    La validez del formato #RRGGBB se comprueba de una vez para todos los
+    colores distintos; la luminosidad (0.299R + 0.587G + 0.114B) se evalúa
+    solo para los válidos mediante _color_texto_para. Los demás quedan en negro.
 
-                # Agregar etiqueta
-                ax.text(point.x, point.y, etiqueta,
-                        fontsize=fontsize,
-                        ha='center', va='center',
-                        color=text_color,
-                        fontweight=fontweight,
-                        bbox=dict(boxstyle="round,pad=0.3",
-                                  facecolor='white' if text_color == 'black' else 'black',
-                                  edgecolor='none',
-                                  alpha=0.7))
-                nombres_agregados += 1
-        except Exception as e:
-            continue
+    Args:
+        region_data (GeoDataFrame): Datos de las comunas (columna 'color' en #RRGGBB).
+
+    Returns:
+        ndarray: 'white' o 'black' por fila de region_data.
+    """
+    # Reutilizar el color de texto calculado al asignar los colores del mapa
+    if '_text_color' in region_data.columns:
+        return region_data['_text_color'].to_numpy(dtype=object)
+
+    if 'color' not in region_data.columns:
+        return np.full(len(region_data), 'black', dtype=object)
 
-    print(f"  ✓ Etiquetas especiales para Región 7 (Maule) agregadas: {nombres_agregados}")
+    unicos, inversa = np.unique(region_data['color'].astype(str).to_numpy(), return_inverse=True)
+    validos = pd.Series(unicos).str.fullmatch(_PATRON_COLOR_HEX).to_numpy(dtype=bool)
 
+    colores = np.full(len(unicos), 'black', dtype=object)
+    colores[validos] = [_color_texto_para(c) for c in unicos[validos]]
+    return colores[inversa]
 
-def agregar_etiquetas_region_8_biobio(ax, region_data):
+
+def _numeros_etiqueta(region_data, region_num):
     """
-    Agrega etiquetas especiales para comunas de la Región del Biobío.
+    Busca de una vez el número de etiqueta de cada comuna de una región.
 
     Args:
-        ax (matplotlib.axes.Axes): Ejes donde dibujar.
-        region_data (GeoDataFrame): Datos de la Región del Biobío.
-    """
-    print(f"  Agregando etiquetas especiales para Región 8 (Biobío)...")
+        region_data (GeoDataFrame): Datos de las comunas de la región.
+        region_num (int): Número de región.
 
-    nombres_agregados = 0
-    for idx, row in region_data.iterrows():
-        try:
-            if 'NOM_COM' in row and row['NOM_COM'] and 'geometry' in row and row['geometry']:
-                comuna_nombre = str(row['NOM_COM'])
+    Returns:
+        ndarray: Número (str) por fila de region_data, o None si la comuna no lleva número.
+    """
+    claves = pd.MultiIndex.from_arrays([np.full(len(region_data), region_num),
+                                        region_data['NOM_COM'].astype(str).to_numpy()])
+    numeros = _ETIQUETAS_NUMERO.reindex(claves)
+    return numeros.where(numeros.notna(), None).to_numpy(dtype=object)
 
-                point = row['geometry'].representative_point()
 
-                # Determinar tipo de etiqueta
-                if comuna_nombre in COMUNAS_NUMEROS_REGION_8:
-                    etiqueta = COMUNAS_NUMEROS_REGION_8[comuna_nombre]
-                    fontsize = 9
-                    fontweight = 'normal'
-                else:
-                    etiqueta = comuna_nombre
-                    if len(etiqueta) > 15:
-                        etiqueta = etiqueta[:12] + '...'
-                    fontsize = 9
-                    fontweight = 'normal'
-
-                # Determinar color de texto
-                if 'color' in row:
-                    color_hex = row['color']
-                    if color_hex.startswith('#'):
-                        r = int(color_hex[1:3], 16) / 255
-                        g = int(color_hex[3:5], 16) / 255
-                        b = int(color_hex[5:7], 16) / 255
-                        luminosidad = 0.299 * r + 0.587 * g + 0.114 * b
-                        text_color = 'white' if luminosidad < 0.5 else 'black'
-                    else:
-                        text_color = 'black'
-                else:
-                    text_color = 'black'
+def _nombres_cortos(region_data, max_length=15, largo_corte=12):
+    """
+    Trunca de una vez los nombres de comunas largos para usarlos como etiqueta.
 
-                # Agregar etiqueta
-                ax.text(point.x, point.y, etiqueta,
-                        fontsize=fontsize,
-                        ha='center', va='center',
-                        color=text_color,
-                        fontweight=fontweight,
-                        bbox=dict(boxstyle="round,pad=0.3",
-                                  facecolor='white' if text_color == 'black' else 'black',
-                                  edgecolor='none',
-                                  alpha=0.7))
-                nombres_agregados += 1
-        except Exception as e:
-            continue
+    Args:
+        region_data (GeoDataFrame): Datos de las comunas.
+        max_length (int): Largo a partir del cual se trunca el nombre.
+        largo_corte (int): Caracteres que se conservan antes de '...'.
 
-    print(f"  ✓ Etiquetas especiales para Región 8 (Biobío) agregadas: {nombres_agregados}")
+    Returns:
+        ndarray: Nombre (posiblemente truncado) por fila de region_data.
+    """
+    nombres = region_data['NOM_COM'].astype(str)
+    return np.where(nombres.str.len() > max_length,
+                    nombres.str.slice(0, largo_corte) + '...', nombres).astype(object)
 
 
-def agregar_etiquetas_region_9_araucania(ax, region_data):
+def _filas_etiquetables(region_data):
     """
-    Agrega etiquetas especiales para comunas de la Región de la Araucanía.
+    Filtra una sola vez las comunas que pueden llevar etiqueta.
+
+    Reemplaza la validación fila por fila (y el try/except) dentro de los
+    bucles de etiquetado: descarta comunas sin nombre o sin geometría.
 
     Args:
-        ax (matplotlib.axes.Axes): Ejes donde dibujar.
-        region_data (GeoDataFrame): Datos de la Región de la Araucanía.
+        region_data (GeoDataFrame): Datos de las comunas.
+
+    Returns:
+        GeoDataFrame: Filas con NOM_COM no vacío y geometría no vacía (y, si
+            AREA_MINIMA_ETIQUETA > 0, con caja envolvente de al menos esa área).
     """
-    print(f"  Agregando etiquetas especiales para Región 9 (Araucanía)...")
+    if 'NOM_COM' not in region_data.columns or 'geometry' not in region_data.columns:
+        return region_data.iloc[0:0]
 
-    nombres_agregados = 0
-    for idx, row in region_data.iterrows():
-        try:
-            if 'NOM_COM' in row and row['NOM_COM'] and 'geometry' in row and row['geometry']:
-                comuna_nombre = str(row['NOM_COM'])
+    nombres = region_data['NOM_COM']
+    geometrias = region_data.geometry
+    mascara = (nombres.notna() & (nombres.astype(str) != '')
+               & geometrias.notna() & ~geometrias.is_empty)
 
-                point = row['geometry'].representative_point()
+    if AREA_MINIMA_ETIQUETA > 0:
+        limites = shapely.bounds(np.asarray(geometrias.values))
+        area_caja = (limites[:, 2] - limites[:, 0]) * (limites[:, 3] - limites[:, 1])
+        mascara &= ~(area_caja < AREA_MINIMA_ETIQUETA)
 
-                # Determinar tipo de etiqueta
-                if comuna_nombre in COMUNAS_NUMEROS_REGION_9:
-                    etiqueta = COMUNAS_NUMEROS_REGION_9[comuna_nombre]
-                    fontsize = 9
-                    fontweight = 'normal'
-                else:
-                    etiqueta = comuna_nombre
-                    if len(etiqueta) > 15:
-                        etiqueta = etiqueta[:12] + '...'
-                    fontsize = 9
-                    fontweight = 'normal'
-
-                # Determinar color de texto
-                if 'color' in row:
-                    color_hex = row['color']
-                    if color_hex.startswith('#'):
-                        r = int(color_hex[1:3], 16) / 255
-                        g = int(color_hex[3:5], 16) / 255
-                        b = int(color_hex[5:7], 16) / 255
-                        luminosidad = 0.299 * r + 0.587 * g + 0.114 * b
-                        text_color = 'white' if luminosidad < 0.5 else 'black'
-                    else:
-                        text_color = 'black'
-                else:
-                    text_color = 'black'
+    return region_data[mascara]
 
-                # Agregar etiqueta
-                ax.text(point.x, point.y, etiqueta,
-                        fontsize=fontsize,
-                        ha='center', va='center',
-                        color=text_color,
-                        fontweight=fontweight,
-                        bbox=dict(boxstyle="round,pad=0.3",
-                                  facecolor='white' if text_color == 'black' else 'black',
-                                  edgecolor='none',
-                                  alpha=0.7))
-                nombres_agregados += 1
-        except Exception as e:
-            continue
 
-    print(f"  ✓ Etiquetas especiales para Región 9 (Araucanía) agregadas: {nombres_agregados}")
+@functools.lru_cache(maxsize=None)
+def _fuente_etiqueta(fontsize, fontweight):
+    """
+    Devuelve la FontProperties compartida para un tamaño y grosor de etiqueta.
 
+    Args:
+        fontsize (float): Tamaño de fuente en puntos.
+        fontweight (str): Grosor de la fuente ('normal', 'bold', ...).
 
-def agregar_etiquetas_region_10_loslagos(ax, region_data):
+    Returns:
+        FontProperties: Propiedades de fuente (no modificar: se comparten).
     """
-    Agrega etiquetas especiales para comunas de la Región de Los Lagos.
+    return FontProperties(size=fontsize, weight=fontweight)
+
+
+def _dibujar_etiquetas(ax, etiquetas):
+    """
+    Dibuja en bloque las etiquetas de comunas acumuladas durante el recorrido.
+
+    Crea los objetos Text directamente y los agrega con add_artist, evitando
+    el procesamiento de argumentos de ax.text por cada comuna.
 
     Args:
         ax (matplotlib.axes.Axes): Ejes donde dibujar.
-        region_data (GeoDataFrame): Datos de la Región de Los Lagos.
+        etiquetas (list): Tuplas (x, y, texto, fontsize, fontweight, text_color, bbox_alpha).
+
+    Returns:
+        int: Número de etiquetas agregadas.
     """
-    print(f"  Agregando etiquetas especiales para Región 10 (Los Lagos)...")
+    # Prototipos de fondo por (color de texto, alpha); Text.set_bbox copia
+    # el diccionario, así que pueden compartirse entre etiquetas
+    bboxes = {}
+
+    for x, y, texto, fontsize, fontweight, text_color, bbox_alpha in etiquetas:
+        bbox = bboxes.get((text_color, bbox_alpha))
+        if bbox is None:
+            bbox = bboxes[(text_color, bbox_alpha)] = dict(
+                boxstyle="round,pad=0.3",
+                facecolor='white' if text_color == 'black' else 'black',
+                edgecolor='none',
+                alpha=bbox_alpha)
+
+        ax.add_artist(Text(x, y, texto,
+                           fontproperties=_fuente_etiqueta(fontsize, fontweight),
+                           ha='center', va='center',
+                           color=text_color,
+                           clip_on=False,
+                           in_layout=False,
+                           bbox=bbox))
+    return len(etiquetas)
 
-    nombres_agregados = 0
-    for idx, row in region_data.iterrows():
-        try:
-            if 'NOM_COM' in row and row['NOM_COM'] and 'geometry' in row and row['geometry']:
-                comuna_nombre = str(row['NOM_COM'])
 
-                point = row['geometry'].representative_point()
+def agregar_nombres_comunas(ax, region_data, fontsize=7, exclude_comunas=None):
+    """
+    Agrega nombres de comunas a un mapa.
 
-                # Determinar tipo de etiqueta
-                if comuna_nombre in COMUNAS_NUMEROS_REGION_10:
-                    etiqueta = COMUNAS_NUMEROS_REGION_10[comuna_nombre]
-                    fontsize = 9
-                    fontweight = 'normal'
-                else:
-                    etiqueta = comuna_nombre
-                    if len(etiqueta) > 15:
-                        etiqueta = etiqueta[:12] + '...'
-                    fontsize = 9
-                    fontweight = 'normal'
-
-                # Determinar color de texto
-                if 'color' in row:
-                    color_hex = row['color']
-                    if color_hex.startswith('#'):
-                        r = int(color_hex[1:3], 16) / 255
-                        g = int(color_hex[3:5], 16) / 255
-                        b = int(color_hex[5:7], 16) / 255
-                        luminosidad = 0.299 * r + 0.587 * g + 0.114 * b
-                        text_color = 'white' if luminosidad < 0.5 else 'black'
-                    else:
-                        text_color = 'black'
-                else:
-                    text_color = 'black'
+    Args:
+        ax (matplotlib.axes.Axes): Ejes donde dibujar.
+        region_data (GeoDataFrame): Datos de la región.
+        fontsize (int): Tamaño de fuente para etiquetas.
+        exclude_comunas (list): Lista de nombres de comunas a excluir.
+    """
+    print(f"  Agregando nombres de comunas (tamaño fuente: {fontsize})...")
 
-                # Agregar etiqueta
-                ax.text(point.x, point.y, etiqueta,
-                        fontsize=fontsize,
-                        ha='center', va='center',
-                        color=text_color,
-                        fontweight=fontweight,
-                        bbox=dict(boxstyle="round,pad=0.3",
-                                  facecolor='white' if text_color == 'black' else 'black',
-                                  edgecolor='none',
-                                  alpha=0.7))
-                nombres_agregados += 1
-        except Exception as e:
+    if exclude_comunas is None:
+        exclude_comunas = []
+
+    region_data = _filas_etiquetables(region_data)
+
+    etiquetas = []
+    xs, ys = _puntos_etiqueta(region_data)
+    colores_texto = _colores_texto(region_data)
+    for row, x, y, text_color in zip(region_data.itertuples(index=False), xs, ys, colores_texto):
+        comuna_nombre = str(row.NOM_COM)
+        if comuna_nombre in exclude_comunas:
             continue
 
-    print(f"  ✓ Etiquetas especiales para Región 10 (Los Lagos) agregadas: {nombres_agregados}")
+        # Acortar nombres largos
+        max_length = 20 if fontsize <= 7 else 25
+        nombre_comuna = _acortar_nombre(comuna_nombre, max_length)
+
+        bbox_alpha = 0.6 if fontsize <= 7 else 0.7
 
+        # Texto con fondo semitransparente
+        etiquetas.append((x, y, nombre_comuna, fontsize, 'normal', text_color, bbox_alpha))
+
+    nombres_agregados = _dibujar_etiquetas(ax, etiquetas)
+    print(f"  ✓ Nombres de comunas agregados: {nombres_agregados}")
 
-def agregar_etiquetas_region_12_magallanes(ax, region_data):
+
+def agregar_etiquetas_region_metropolitana(ax, region_data):
     """
-    Agrega etiquetas especiales para comunas de la Región de Magallanes.
+    Agrega etiquetas especiales para comunas de la Región Metropolitana.
+
+    Usa números para comunas pequeñas y nombres para otras.
 
     Args:
         ax (matplotlib.axes.Axes): Ejes donde dibujar.
-        region_data (GeoDataFrame): Datos de la Región de Magallanes.
+        region_data (GeoDataFrame): Datos de la Región Metropolitana.
     """
-    print(f"  Agregando etiquetas especiales para Región 12 (Magallanes)...")
+    print("  Agregando etiquetas especiales para Región Metropolitana...")
+
+    region_data = _filas_etiquetables(region_data)
+
+    # Quedarse solo con las comunas que llevan etiqueta (número o nombre)
+    numeros = _numeros_etiqueta(region_data, 13)
+    mascara = pd.notna(numeros) | region_data['NOM_COM'].astype(str).isin(_RM_ETIQUETAS_SET).to_numpy()
+    region_data = region_data[mascara]
+    numeros = numeros[mascara]
+
+    etiquetas = []
+    xs, ys = _puntos_etiqueta(region_data)
+    colores_texto = _colores_texto(region_data)
+    nombres_cortos = _nombres_cortos(region_data)
+    for row, x, y, numero, nombre_corto, text_color in zip(region_data.itertuples(index=False), xs, ys,
+                                                           numeros, nombres_cortos, colores_texto):
+        comuna_nombre = str(row.NOM_COM)
+
+        # Determinar tipo de etiqueta (número o texto)
+        if numero is not None:
+            etiqueta = numero
+            fontsize = TAMANOS_FUENTE_AREAS_METROPOLITANAS['region_metropolitana_numeros']
+            fontweight = 'normal'
+        elif comuna_nombre in _RM_ETIQUETAS_SET:
+            etiqueta = nombre_corto
+            fontsize = TAMANOS_FUENTE_AREAS_METROPOLITANAS['region_metropolitana_etiquetas']
+            fontweight = 'normal'
+        else:
+            continue
 
-    nombres_agregados = 0
-    for idx, row in region_data.iterrows():
-        try:
-            if 'NOM_COM' in row and row['NOM_COM'] and 'geometry' in row and row['geometry']:
-                comuna_nombre = str(row['NOM_COM'])
+        # Ajustes de posición para comunas específicas
+        offset_x, offset_y = OFFSETS_RM.get(comuna_nombre, (0, 0))
 
-                point = row['geometry'].representative_point()
+        etiquetas.append((x + offset_x, y + offset_y, etiqueta, fontsize, fontweight, text_color, 0.7))
 
-                # Determinar tipo de etiqueta
-                if comuna_nombre in COMUNAS_NUMEROS_REGION_12:
-                    etiqueta = COMUNAS_NUMEROS_REGION_12[comuna_nombre]
-                    fontsize = 9
-                    fontweight = 'normal'
-                else:
-                    etiqueta = comuna_nombre
-                    if len(etiqueta) > 15:
-                        etiqueta = etiqueta[:12] + '...'
-                    fontsize = 9
-                    fontweight = 'normal'
-
-                # Determinar color de texto
-                if 'color' in row:
-                    color_hex = row['color']
-                    if color_hex.startswith('#'):
-                        r = int(color_hex[1:3], 16) / 255
-                        g = int(color_hex[3:5], 16) / 255
-                        b = int(color_hex[5:7], 16) / 255
-                        luminosidad = 0.299 * r + 0.587 * g + 0.114 * b
-                        text_color = 'white' if luminosidad < 0.5 else 'black'
-                    else:
-                        text_color = 'black'
-                else:
-                    text_color = 'black'
+    nombres_agregados = _dibujar_etiquetas(ax, etiquetas)
+    print(f"  ✓ Etiquetas especiales para Región Metropolitana agregadas: {nombres_agregados}")
 
-                # Agregar etiqueta
-                ax.text(point.x, point.y, etiqueta,
-                        fontsize=fontsize,
-                        ha='center', va='center',
-                        color=text_color,
-                        fontweight=fontweight,
-                        bbox=dict(boxstyle="round,pad=0.3",
-                                  facecolor='white' if text_color == 'black' else 'black',
-                                  edgecolor='none',
-                                  alpha=0.7))
-                nombres_agregados += 1
-        except Exception as e:
-            continue
 
-    print(f"  ✓ Etiquetas especiales para Región 12 (Magallanes) agregadas: {nombres_agregados}")
+def agregar_etiquetas_gran_santiago(ax, region_data, usar_numeros=True):
+    """
+    Agrega etiquetas especiales para el Gran Santiago.
 
+    Args:
+        ax (matplotlib.axes.Axes): Ejes donde dibujar.
+        region_data (GeoDataFrame): Datos del Gran Santiago.
+        usar_numeros (bool): Si True, usa números en lugar de nombres.
+    """
+    print("  Agregando etiquetas especiales para Gran Santiago...")
+
+    region_data = _filas_etiquetables(region_data)
+
+    # Determinar etiquetas (número o texto) para todas las comunas de una vez
+    etiquetas = _nombres_cortos(region_data)
+    if usar_numeros:
+        numeros = region_data['NOM_COM'].astype(str).map(_MAQUEO_SERIES)
+        etiquetas = np.where(numeros.notna(), numeros, etiquetas)
+    fontsize = 15
+
+    xs, ys = _puntos_etiqueta(region_data)
+    colores_texto = _colores_texto(region_data)
+    etiquetas_dibujo = [(x, y, etiqueta, fontsize, 'normal', text_color, 0.7)
+                        for x, y, etiqueta, text_color in zip(xs, ys, etiquetas, colores_texto)]
 
-def agregar_etiquetas_region_16_nuble(ax, region_data):
+    nombres_agregados = _dibujar_etiquetas(ax, etiquetas_dibujo)
+    print(f"  ✓ Etiquetas especiales agregadas: {nombres_agregados}")
+
+
+def agregar_etiquetas_region(ax, region_data, region_num, fontsize=9):
     """
-    Agrega etiquetas especiales para comunas de la Región de Ñuble.
+    Agrega etiquetas especiales para las comunas de una región con simbología numerada.
+
+    Las comunas con número en _ETIQUETAS_NUMERO se rotulan con su número y el
+    resto con su nombre (acortado si es largo). Sirve para todas las regiones
+    de ETIQUETAS_REGIONES_NUMERADAS.
 
     Args:
         ax (matplotlib.axes.Axes): Ejes donde dibujar.
-        region_data (GeoDataFrame): Datos de la Región de Ñuble.
+        region_data (GeoDataFrame): Datos de la región.
+        region_num (int): Número de región.
+        fontsize (int): Tamaño de fuente de las etiquetas.
     """
-    print(f"  Agregando etiquetas especiales para Región 16 (Ñuble)...")
+    region_etiqueta = f"Región {region_num} ({ETIQUETAS_REGIONES_NUMERADAS.get(region_num, region_num)})"
+    print(f"  Agregando etiquetas especiales para {region_etiqueta}...")
 
-    nombres_agregados = 0
-    for idx, row in region_data.iterrows():
-        try:
-            if 'NOM_COM' in row and row['NOM_COM'] and 'geometry' in row and row['geometry']:
-                comuna_nombre = str(row['NOM_COM'])
+    region_data = _filas_etiquetables(region_data)
 
-                point = row['geometry'].representative_point()
+    xs, ys = _puntos_etiqueta(region_data)
+    colores_texto = _colores_texto(region_data)
 
-                # Determinar tipo de etiqueta
-                if comuna_nombre in COMUNAS_NUMEROS_REGION_16:
-                    etiqueta = COMUNAS_NUMEROS_REGION_16[comuna_nombre]
-                    fontsize = 9
-                    fontweight = 'normal'
-                else:
-                    etiqueta = comuna_nombre
-                    if len(etiqueta) > 15:
-                        etiqueta = etiqueta[:12] + '...'
-                    fontsize = 9
-                    fontweight = 'normal'
-
-                # Determinar color de texto
-                if 'color' in row:
-                    color_hex = row['color']
-                    if color_hex.startswith('#'):
-                        r = int(color_hex[1:3], 16) / 255
-                        g = int(color_hex[3:5], 16) / 255
-                        b = int(color_hex[5:7], 16) / 255
-                        luminosidad = 0.299 * r + 0.587 * g + 0.114 * b
-                        text_color = 'white' if luminosidad < 0.5 else 'black'
-                    else:
-                        text_color = 'black'
-                else:
-                    text_color = 'black'
+    # Etiqueta: número si la comuna lo tiene, si no el nombre (truncado si es largo)
+    numeros = _numeros_etiqueta(region_data, region_num)
+    textos = np.where(pd.notna(numeros), numeros, _nombres_cortos(region_data))
 
-                # Agregar etiqueta
-                ax.text(point.x, point.y, etiqueta,
-                        fontsize=fontsize,
-                        ha='center', va='center',
-                        color=text_color,
-                        fontweight=fontweight,
-                        bbox=dict(boxstyle="round,pad=0.3",
-                                  facecolor='white' if text_color == 'black' else 'black',
-                                  edgecolor='none',
-                                  alpha=0.7))
-                nombres_agregados += 1
-        except Exception as e:
-            continue
+    etiquetas = [(x, y, etiqueta, fontsize, 'normal', text_color, 0.7)
+                 for x, y, etiqueta, text_color in zip(xs, ys, textos, colores_texto)]
 
-    print(f"  ✓ Etiquetas especiales para Región 16 (Ñuble) agregadas: {nombres_agregados}")
+    nombres_agregados = _dibujar_etiquetas(ax, etiquetas)
+    print(f"  ✓ Etiquetas especiales para {region_etiqueta} agregadas: {nombres_agregados}")
+
+
+def _contar_ganadores(diferencias):
+    """
+    Cuenta las comunas donde gana cada candidato y los empates.
+
+    Args:
+        diferencias (Series): Diferencia porcentual Jara - Kast por comuna.
+
+    Returns:
+        tuple: (jara_gana, kast_gana, empates). Los valores NaN no cuentan.
+    """
+    valores = diferencias.to_numpy(dtype=np.float64, na_value=np.nan)
+    valores = valores[~np.isnan(valores)]
+    # Un solo histograma sobre el signo: índice 0 = Kast, 1 = empate, 2 = Jara
+    kast_gana, empates, jara_gana = np.bincount(
+        np.sign(valores).astype(np.int8) + 1, minlength=3)
+    return int(jara_gana), int(kast_gana), int(empates)
 
 
 def calcular_promedio_regional_correcto(region_data):
@@ -1654,11 +2273,9 @@ def calcular_promedio_regional_correcto(region_data):
     if all(col in region_data.columns for col in columnas_necesarias):
         print("  Calculando promedio regional usando votos válidos...")
 
-        total_jara = region_data['jara_votos'].sum()
-        total_kast = region_data['kast_votos'].sum()
-        total_emitidos = region_data['emitidos_votos'].sum()
-        total_blanco = region_data['blanco_votos'].sum()
-        total_nulo = region_data['nulo_votos'].sum()
+        # Una sola reducción sobre las cinco columnas de votos
+        totales = np.nansum(region_data[columnas_necesarias].to_numpy(dtype=np.float64), axis=0)
+        total_jara, total_kast, total_emitidos, total_blanco, total_nulo = totales
 
         total_validos = total_emitidos - total_blanco - total_nulo
 
@@ -1675,9 +2292,12 @@ def calcular_promedio_regional_correcto(region_data):
 
     print("  Usando promedio simple de porcentajes (datos de votos incompletos)")
     if 'jara_pct' in region_data.columns and 'kast_pct' in region_data.columns:
-        jara_promedio = region_data['jara_pct'].mean()
-        kast_promedio = region_data['kast_pct'].mean()
-        return jara_promedio, kast_promedio
+        porcentajes = region_data[['jara_pct', 'kast_pct']].to_numpy(dtype=np.float64, na_value=np.nan)
+        # Una región sin ningún porcentaje da NaN, igual que Series.mean()
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', category=RuntimeWarning)
+            jara_promedio, kast_promedio = np.nanmean(porcentajes, axis=0)
+        return float(jara_promedio), float(kast_promedio)
 
     return 0, 0
 
@@ -1686,7 +2306,128 @@ def calcular_promedio_regional_correcto(region_data):
 # FUNCIONES PARA CREAR MAPAS REGIONALES
 # ============================================================================
 
-def crear_mapa_regional_completo(region_num, mapa_data, output_dir):
+# Regiones cuyo mapa incluye simbología de comunas con número
+REGIONES_CON_SIMBOLOGIA = (5, 6, 7, 8, 9, 10, 12, 13, 16)
+
+# Figuras reutilizables para los mapas regionales (una por diseño)
+_ESQUELETOS_REGIONALES = {}
+
+
+def _obtener_esqueleto_regional(con_simbologia):
+    """
+    Obtiene (o crea una sola vez) la figura base de los mapas regionales.
+
+    La figura, la grilla, los ejes y la barra de colores se construyen una vez
+    por diseño y se reutilizan entre regiones; cada mapa solo limpia y vuelve a
+    dibujar el contenido de los ejes.
+
+    Args:
+        con_simbologia (bool): Si True, usa el diseño con panel de simbología.
+
+    Returns:
+        dict: Figura ('fig') y ejes del mapa regional.
+    """
+    esqueleto = _ESQUELETOS_REGIONALES.get(con_simbologia)
+    if esqueleto is not None:
+        return esqueleto
+
+    # Configurar tamaño de figura según diseño
+    if con_simbologia:
+        fig = plt.figure(figsize=(18, 16))
+        gs = GridSpec(4, 2, figure=fig, height_ratios=[0.05, 0.75, 0.15, 0.05],
+                      width_ratios=[0.65, 0.35], hspace=0.12, wspace=0.08)
+    else:
+        fig = plt.figure(figsize=(18, 14))
+        gs = GridSpec(3, 2, figure=fig, height_ratios=[0.05, 0.90, 0.05],
+                      width_ratios=[0.65, 0.35], hspace=0.08, wspace=0.08)
+
+    ax_titulo = fig.add_subplot(gs[0, :])
+    ax_mapa = fig.add_subplot(gs[1, 0])
+
+    # Panel de estadísticas
+    ax_stats_container = fig.add_subplot(gs[1, 1])
+    ax_stats_container.set_axis_off()
+
+    stats_gs = GridSpecFromSubplotSpec(4, 1, subplot_spec=gs[1, 1],
+                                       height_ratios=[0.50, 0.25, 0.15, 0.10], hspace=0.15)
+
+    ax_barras = fig.add_subplot(stats_gs[0])
+    ax_comunas = fig.add_subplot(stats_gs[1])
+    ax_diferencia = fig.add_subplot(stats_gs[2])
+
+    # Escala de colores (igual para todas las regiones)
+    ax_escala = fig.add_subplot(stats_gs[3])
+
+    _dibujar_escala_diferencia(fig, ax_escala)
+
+    # Simbología y pie de página
+    if con_simbologia:
+        ax_simbologia = fig.add_subplot(gs[2, :])
+        ax_fondo = fig.add_subplot(gs[3, :])
+    else:
+        ax_simbologia = None
+        ax_fondo = fig.add_subplot(gs[2, :])
+
+    # Márgenes fijos de la figura (reemplazan tight_layout + bbox_inches='tight')
+    fig.subplots_adjust(left=0.02, right=0.98, top=0.98, bottom=0.02)
+
+    # Título y pie de página persistentes: entre regiones solo cambia su texto
+    ax_titulo.set_axis_off()
+    texto_titulo = ax_titulo.text(0.5, 0.5, '', ha='center', va='center',
+                                  fontsize=22, fontweight='bold', transform=ax_titulo.transAxes)
+    ax_fondo.set_axis_off()
+    texto_fondo = ax_fondo.text(0.5, 0.5, '', ha='center', va='center',
+                                fontsize=8, color='gray', transform=ax_fondo.transAxes)
+
+    esqueleto = {
+        'fig': fig,
+        'texto_titulo': texto_titulo,
+        'texto_fondo': texto_fondo,
+        'titulo': ax_titulo,
+        'mapa': ax_mapa,
+        'barras': ax_barras,
+        'comunas': ax_comunas,
+        'diferencia': ax_diferencia,
+        'simbologia': ax_simbologia,
+        'fondo': ax_fondo,
+    }
+    _ESQUELETOS_REGIONALES[con_simbologia] = esqueleto
+    return esqueleto
+
+
+def _cerrar_esqueletos_regionales():
+    """Cierra las figuras reutilizables de los mapas regionales."""
+    for esqueleto in _ESQUELETOS_REGIONALES.values():
+        plt.close(esqueleto['fig'])
+    _ESQUELETOS_REGIONALES.clear()
+
+
+def _guardar_png_opaco(fig, output_path, dpi=300):
+    """
+    Guarda una figura con fondo opaco como PNG RGB, sin canal alfa.
+
+    Matplotlib siempre escribe PNG RGBA; en figuras sin transparencia el canal
+    alfa es constante y solo encarece la compresión. Se dibuja la figura como
+    RGBA crudo y PIL la guarda en RGB (mismo contenido, archivo más pequeño y
+    escritura más rápida).
+
+    Args:
+        fig (matplotlib.figure.Figure): Figura a guardar (fondo opaco).
+        output_path (str or Path): Ruta del PNG.
+        dpi (int): Resolución de salida.
+    """
+    buffer = BytesIO()
+    fig.savefig(buffer, dpi=dpi, format='rgba')
+    crudo = buffer.getbuffer()
+
+    ancho = int(round(fig.get_figwidth() * dpi))
+    alto = len(crudo) // (4 * ancho)
+
+    imagen = Image.frombuffer('RGBA', (ancho, alto), crudo, 'raw', 'RGBA', 0, 1)
+    imagen.convert('RGB').save(output_path, format='png', dpi=(dpi, dpi))
+
+
+def crear_mapa_regional_completo(region_num, mapa_data, output_dir, region_data=None):
     """
     Crea un mapa regional completo con estadísticas.
 
@@ -1694,19 +2435,31 @@ def crear_mapa_regional_completo(region_num, mapa_data, output_dir):
         region_num (int): Número de región (1-16).
         mapa_data (GeoDataFrame): Datos combinados de toda Chile.
         output_dir (str): Directorio para guardar el mapa.
+        region_data (GeoDataFrame or None): Comunas de la región ya separadas
+            (ver _agrupar_por_region); si es None se filtran desde mapa_data.
 
     Returns:
         str or None: Ruta del archivo guardado o None si falla.
     """
-    region_nombre = REGIONES_NOMBRES_TITULOS.get(region_num, f"Región {region_num}")
+    if region_num in _REGION_TABLE.index:
+        region_info = _REGION_TABLE.loc[region_num]
+        region_nombre = region_info['titulo']
+        region_nombre_corto = region_info['nombre']
+        fontsize_regional = int(region_info['fuente'])
+    else:
+        region_nombre = f"Región {region_num}"
+        region_nombre_corto = f"Region_{region_num}"
+        fontsize_regional = 7
     print(f" 🗺️ Generando mapa para {region_nombre}")
 
     if 'REGION_NUM' not in mapa_data.columns:
         print(f" ❌ ERROR: No hay columna REGION_NUM en los datos")
         return None
 
-    # Filtrar datos de la región
-    region_data = mapa_data[mapa_data['REGION_NUM'] == region_num].copy()
+    # Filtrar datos de la región (o usar el grupo ya separado por el llamador)
+    if region_data is None:
+        region_data = mapa_data[mapa_data['REGION_NUM'] == region_num]
+    region_data = region_data.copy()
 
     if region_data.empty:
         print(f" ⚠ No hay datos para {region_nombre}")
@@ -1715,107 +2468,80 @@ def crear_mapa_regional_completo(region_num, mapa_data, output_dir):
     # Excluir islas de la Región de Valparaíso
     islas_note = ""
     if region_num == 5:
-        islands = ['Juan Fernández', 'Isla de Pascua', 'Rapa Nui', 'Easter Island']
-        region_data = region_data[~region_data['NOM_COM'].str.contains('|'.join(islands), case=False, na=False)]
+        region_data = region_data[~region_data['NOM_COM'].str.contains(_PATRON_ISLAS_VALPARAISO, na=False)]
         islas_note = " (Islas excluidas, ver mapa separado)"
 
+    # Simplificar al detalle que se alcanza a ver en el mapa de la región
+    if SIMPLIFICAR_GEOMETRIAS and not region_data.empty:
+        minx, miny, maxx, maxy = region_data.total_bounds
+        tolerancia = max(maxx - minx, maxy - miny) / FACTOR_TOLERANCIA_REGIONAL
+        region_data.geometry = shapely.simplify(region_data.geometry.values, tolerancia, preserve_topology=True)
+
     # Verificar datos electorales
-    comunas_con_datos = 0
+    # Ganadores y comunas con datos en una sola pasada (los NaN no cuentan)
+    jara_gana = kast_gana = empates = 0
     if 'diferencia_pct' in region_data.columns:
-        comunas_con_datos = region_data['diferencia_pct'].notna().sum()
+        jara_gana, kast_gana, empates = _contar_ganadores(region_data['diferencia_pct'])
+    comunas_con_datos = jara_gana + kast_gana + empates
 
     if comunas_con_datos == 0:
         print(f" ⚠ No hay datos electorales para {region_nombre}")
 
-    # Configurar tamaño de figura según región
-    if region_num in [5, 6, 7, 8, 9, 10, 12, 13, 16]:
-        fig = plt.figure(figsize=(18, 16))
-        gs = GridSpec(4, 2, figure=fig, height_ratios=[0.05, 0.75, 0.15, 0.05],
-                      width_ratios=[0.65, 0.35], hspace=0.12, wspace=0.08)
-    else:
-        fig = plt.figure(figsize=(18, 14))
-        gs = GridSpec(3, 2, figure=fig, height_ratios=[0.05, 0.90, 0.05],
-                      width_ratios=[0.65, 0.35], hspace=0.08, wspace=0.08)
+    # Reutilizar la figura según diseño y limpiar el contenido anterior
+    con_simbologia = region_num in REGIONES_CON_SIMBOLOGIA
+    esqueleto = _obtener_esqueleto_regional(con_simbologia)
+    fig = esqueleto['fig']
+    for clave in ('mapa', 'barras', 'comunas', 'diferencia', 'simbologia'):
+        if esqueleto[clave] is not None:
+            esqueleto[clave].clear()
 
     # Título
-    ax_titulo = fig.add_subplot(gs[0, :])
-    ax_titulo.set_axis_off()
-    titulo_texto = f'{region_nombre}{islas_note}'
-    ax_titulo.text(0.5, 0.5, titulo_texto, ha='center', va='center',
-                   fontsize=22, fontweight='bold', transform=ax_titulo.transAxes)
+    esqueleto['texto_titulo'].set_text(f'{region_nombre}{islas_note}')
 
     # Mapa
-    ax_mapa = fig.add_subplot(gs[1, 0])
+    ax_mapa = esqueleto['mapa']
 
     # Asignar colores según diferencia
     if 'diferencia_pct' in region_data.columns:
-        region_data['color'] = region_data['diferencia_pct'].apply(asignar_color_diferencia)
+        region_data['color'] = colorizar(region_data['diferencia_pct'])
     else:
         region_data['color'] = '#D3D3D3'
+    region_data['_text_color'] = _colores_texto(region_data)
 
     # Dibujar mapa
     try:
-        region_data.plot(ax=ax_mapa, color=region_data['color'], edgecolor='black', linewidth=0.5)
+        ax_mapa.add_collection(_coleccion_poligonos(region_data, region_data['color'], linewidth=0.5))
+        ax_mapa.autoscale_view()
     except Exception as e:
         print(f" ⚠ Error dibujando mapa: {e}")
-        # Dibujar comunas individualmente si falla el plot colectivo
-        for idx, row in region_data.iterrows():
-            if hasattr(row, 'geometry') and row.geometry is not None:
-                try:
-                    gpd.GeoSeries([row.geometry]).plot(ax=ax_mapa, color=row['color'],
-                                                       edgecolor='black', linewidth=0.5)
-                except:
-                    continue
+        # Si falla la colección de trazados, dibujar una PatchCollection simple
+        try:
+            ax_mapa.add_collection(_coleccion_parches(region_data, region_data['color'], linewidth=0.5))
+            ax_mapa.autoscale_view()
+        except Exception as e:
+            print(f" ⚠ Error en el dibujo alternativo: {e}")
 
     # Agregar etiquetas según región
-    fontsize_regional = TAMANOS_FUENTE_REGION.get(region_num, 7)
-
     if region_num == 13:
         agregar_etiquetas_region_metropolitana(ax_mapa, region_data)
-    elif region_num == 5:
-        agregar_etiquetas_region_5_valparaiso(ax_mapa, region_data)
-    elif region_num == 6:
-        agregar_etiquetas_region_6_ohiggins(ax_mapa, region_data)
-    elif region_num == 7:
-        agregar_etiquetas_region_7_maule(ax_mapa, region_data)
-    elif region_num == 8:
-        agregar_etiquetas_region_8_biobio(ax_mapa, region_data)
-    elif region_num == 9:
-        agregar_etiquetas_region_9_araucania(ax_mapa, region_data)
-    elif region_num == 10:
-        agregar_etiquetas_region_10_loslagos(ax_mapa, region_data)
-    elif region_num == 12:
-        agregar_etiquetas_region_12_magallanes(ax_mapa, region_data)
-    elif region_num == 16:
-        agregar_etiquetas_region_16_nuble(ax_mapa, region_data)
+    elif region_num in ETIQUETAS_REGIONES_NUMERADAS:
+        agregar_etiquetas_region(ax_mapa, region_data, region_num)
     else:
         agregar_nombres_comunas(ax_mapa, region_data, fontsize=fontsize_regional)
 
     ax_mapa.set_axis_off()
     ax_mapa.set_aspect('equal')
 
-    # Panel de estadísticas
-    ax_stats_container = fig.add_subplot(gs[1, 1])
-    ax_stats_container.set_axis_off()
-
-    stats_gs = GridSpecFromSubplotSpec(4, 1, subplot_spec=gs[1, 1],
-                                       height_ratios=[0.50, 0.25, 0.15, 0.10], hspace=0.15)
-
     # Calcular estadísticas
     jara_promedio = kast_promedio = 0
-    jara_gana = kast_gana = empates = 0
     dif_promedio = 0
 
     if comunas_con_datos > 0:
         jara_promedio, kast_promedio = calcular_promedio_regional_correcto(region_data)
         dif_promedio = jara_promedio - kast_promedio
 
-        jara_gana = (region_data['diferencia_pct'] > 0).sum()
-        kast_gana = (region_data['diferencia_pct'] < 0).sum()
-        empates = (region_data['diferencia_pct'] == 0).sum()
-
     # Gráfico de barras
-    ax_barras = fig.add_subplot(stats_gs[0])
+    ax_barras = esqueleto['barras']
 
     if comunas_con_datos > 0:
         candidatos = ['JARA', 'KAST']
@@ -1831,7 +2557,7 @@ def crear_mapa_regional_completo(region_num, mapa_data, output_dir):
         fontsize_ticks = 10
 
         ax_barras.set_ylabel('Porcentaje (%)', fontsize=fontsize_ylabel, fontweight='bold')
-        ax_barras.set_title('PROMEDIO REGIONAL', fontsize=fontsize_title, fontweight='bold', pad=10)
+        ax_barras.set_title('PROMEDIO REGIONAL', fontproperties=_FP_TITULO, fontsize=fontsize_title, pad=10)
 
         max_porcentaje = max(porcentajes) if len(porcentajes) > 0 else 100
         ax_barras.set_ylim(0, max_porcentaje * 1.25)
@@ -1851,13 +2577,13 @@ def crear_mapa_regional_completo(region_num, mapa_data, output_dir):
                        transform=ax_barras.transAxes,
                        fontsize=14, fontweight='bold',
                        color='gray')
-        ax_barras.set_title('PROMEDIO REGIONAL', fontsize=13, fontweight='bold', pad=10)
+        ax_barras.set_title('PROMEDIO REGIONAL', fontproperties=_FP_TITULO, fontsize=13, pad=10)
 
     ax_barras.grid(axis='y', alpha=0.3)
     ax_barras.tick_params(axis='both', labelsize=10)
 
     # Estadísticas de comunas
-    ax_comunas = fig.add_subplot(stats_gs[1])
+    ax_comunas = esqueleto['comunas']
     ax_comunas.set_axis_off()
 
     if comunas_con_datos > 0:
@@ -1887,7 +2613,7 @@ def crear_mapa_regional_completo(region_num, mapa_data, output_dir):
                         color='gray')
 
     # Diferencia promedio
-    ax_diferencia = fig.add_subplot(stats_gs[2])
+    ax_diferencia = esqueleto['diferencia']
     ax_diferencia.set_axis_off()
 
     if comunas_con_datos > 0:
@@ -1918,26 +2644,9 @@ def crear_mapa_regional_completo(region_num, mapa_data, output_dir):
                            color='gray',
                            transform=ax_diferencia.transAxes)
 
-    # Escala de colores
-    ax_escala = fig.add_subplot(stats_gs[3])
-
-    norm = plt.Normalize(-100, 100)
-    sm = ScalarMappable(cmap=cmap_continuo, norm=norm)
-    sm.set_array([])
-
-    cbar = fig.colorbar(sm, cax=ax_escala, orientation='horizontal', fraction=0.9)
-    cbar.set_label('Diferencia (Jara% - Kast%)', fontsize=8, fontweight='bold', labelpad=3)
-
-    ticks = [-100, -50, -10, 0, 10, 50, 100]
-    tick_labels = ['-100', '-50', '-10', '0', '10', '50', '+100']
-
-    cbar.set_ticks(ticks)
-    cbar.set_ticklabels(tick_labels)
-    cbar.ax.tick_params(labelsize=6)
-
     # Simbología para regiones con números
-    if region_num in [5, 6, 7, 8, 9, 10, 12, 13, 16]:
-        ax_simbologia = fig.add_subplot(gs[2, :])
+    if con_simbologia:
+        ax_simbologia = esqueleto['simbologia']
         ax_simbologia.set_axis_off()
 
         ax_simbologia.text(0.5, 0.85, 'Simbología - Comunas con número',
@@ -1945,46 +2654,14 @@ def crear_mapa_regional_completo(region_num, mapa_data, output_dir):
                            fontsize=14, fontweight='bold',
                            transform=ax_simbologia.transAxes)
 
-        # Seleccionar diccionario de comunas según región
-        if region_num == 5:
-            comunas_dict = COMUNAS_NUMEROS_REGION_5
-        elif region_num == 6:
-            comunas_dict = COMUNAS_NUMEROS_REGION_6
-        elif region_num == 7:
-            comunas_dict = COMUNAS_NUMEROS_REGION_7
-        elif region_num == 8:
-            comunas_dict = COMUNAS_NUMEROS_REGION_8
-        elif region_num == 9:
-            comunas_dict = COMUNAS_NUMEROS_REGION_9
-        elif region_num == 10:
-            comunas_dict = COMUNAS_NUMEROS_REGION_10
-        elif region_num == 12:
-            comunas_dict = COMUNAS_NUMEROS_REGION_12
-        elif region_num == 13:
-            comunas_dict = COMUNAS_NUMEROS_RM
-        elif region_num == 16:
-            comunas_dict = COMUNAS_NUMEROS_REGION_16
-        else:
-            comunas_dict = {}
-
         # Mostrar simbología en dos columnas
-        items = list(comunas_dict.items())
+        items = list(COMUNAS_NUMEROS_POR_REGION.get(region_num, {}).items())
         if items:
             mitad = len(items) // 2 + len(items) % 2
+            lineas = [f'{numero}. {comuna}' for comuna, numero in items]
 
-            for i, (comuna, numero) in enumerate(items[:mitad]):
-                y_pos = 0.70 - i * 0.08
-                ax_simbologia.text(0.25, y_pos, f'{numero}. {comuna}',
-                                   ha='left', va='center',
-                                   fontsize=11,
-                                   transform=ax_simbologia.transAxes)
-
-            for i, (comuna, numero) in enumerate(items[mitad:]):
-                y_pos = 0.70 - i * 0.08
-                ax_simbologia.text(0.65, y_pos, f'{numero}. {comuna}',
-                                   ha='left', va='center',
-                                   fontsize=11,
-                                   transform=ax_simbologia.transAxes)
+            _dibujar_columna_simbologia(ax_simbologia, 0.25, 0.70, lineas[:mitad], 0.08, 11)
+            _dibujar_columna_simbologia(ax_simbologia, 0.65, 0.70, lineas[mitad:], 0.08, 11)
 
         ax_simbologia.text(0.5, 0.20,
                            'Nota: Las comunas con números son demasiado pequeñas para mostrar su nombre completo.',
@@ -1993,347 +2670,350 @@ def crear_mapa_regional_completo(region_num, mapa_data, output_dir):
                            transform=ax_simbologia.transAxes)
 
     # Pie de página
-    if region_num in [5, 6, 7, 8, 9, 10, 12, 13, 16]:
-        ax_fondo = fig.add_subplot(gs[3, :])
-    else:
-        ax_fondo = fig.add_subplot(gs[2, :])
-
-    ax_fondo.set_axis_off()
-
-    fecha = datetime.now().strftime("%d/%m/%Y")
-    info_text = f"Análisis Segunda Vuelta Presidencial Chile 2025 - Jara vs Kast | {region_nombre} | Generado: {fecha}"
-    ax_fondo.text(0.5, 0.5, info_text,
-                  ha='center', va='center',
-                  fontsize=8, color='gray',
-                  transform=ax_fondo.transAxes)
-
-    plt.tight_layout(rect=[0.02, 0.02, 0.98, 0.98])
+    esqueleto['texto_fondo'].set_text(_texto_pie(region_nombre))
 
     # Guardar archivo
-    region_num_str = str(region_num).zfill(2)
-    region_nombre_safe = REGIONES_ANTIGUAS_NUM.get(region_num, f"Region_{region_num}").replace(' ', '_').replace('á',
-                                                                                                                 'a').replace(
-        'é', 'e').replace('í', 'i').replace('ó', 'o').replace('ú', 'u').replace('ñ', 'n').replace('Ñ', 'N').replace("'",
-                                                                                                                    '').replace(
-        '"', '').replace("'", '').replace('O\'', 'O_')
-
-    output_path = os.path.join(output_dir, f"REGION_{region_num_str}_{region_nombre_safe}_COMPLETO.png")
+    output_path = _rutas_salida(output_dir)['regiones'].get(region_num)
+    if output_path is None:
+        output_path = Path(output_dir) / f"REGION_{region_num:02d}_{_nombre_archivo_region(region_nombre_corto)}_COMPLETO.png"
 
-    plt.savefig(output_path, dpi=300, bbox_inches='tight', pad_inches=0.2)
-    plt.close(fig)
+    # Sin bbox_inches='tight': los márgenes quedan fijos en el esqueleto y se
+    # evita una segunda pasada de dibujo solo para medir el contenido
+    _guardar_png_opaco(fig, output_path, dpi=300)
 
     print(f" ✓ Mapa guardado: {output_path}")
     return output_path
 
 
-# ============================================================================
-# FUNCIONES PARA MAPAS DE ISLAS
-# ============================================================================
-
-def crear_mapa_isla_pascua(mapa_data, output_dir):
+def _agrupar_por_region(mapa_data):
     """
-    Crea mapa separado para Isla de Pascua (Rapa Nui).
+    Separa los datos combinados por región en una sola pasada.
 
     Args:
         mapa_data (GeoDataFrame): Datos combinados de toda Chile.
-        output_dir (str): Directorio para guardar el mapa.
 
     Returns:
-        str or None: Ruta del archivo guardado o None si falla.
+        dict: {REGION_NUM: GeoDataFrame}; vacío si no hay columna REGION_NUM.
     """
-    print(f" 🗺️ Generando mapa separado para Isla de Pascua (Rapa Nui) - SOLO ISLA PRINCIPAL")
+    if 'REGION_NUM' not in mapa_data.columns:
+        return {}
+    return dict(list(mapa_data.groupby('REGION_NUM', sort=False, observed=True)))
 
-    islands_data = mapa_data[
-        mapa_data['NOM_COM'].str.contains('Isla de Pascua|Rapa Nui', case=False, na=False)].copy()
 
-    if islands_data.empty:
-        print(f" ⚠ No hay datos para Isla de Pascua")
-        return None
+# Datos combinados de cada proceso de mapas regionales y sus grupos por
+# región (se fijan al iniciarlo)
+_MAPA_DATA_PROCESO = None
+_REGIONES_PROCESO = {}
 
-    # Límites geográficos para Isla de Pascua
-    rapa_nui_bounds = {
-        'minx': -109.5,
-        'miny': -27.2,
-        'maxx': -109.2,
-        'maxy': -27.0
-    }
 
-    # Verificar datos electorales
-    comunas_con_datos = 0
-    if 'diferencia_pct' in islands_data.columns:
-        comunas_con_datos = islands_data['diferencia_pct'].notna().sum()
+def _iniciar_proceso_regional(mapa_data):
+    """Guarda los datos combinados en el proceso para no reenviarlos por región."""
+    global _MAPA_DATA_PROCESO, _REGIONES_PROCESO
+    _MAPA_DATA_PROCESO = mapa_data
+    _REGIONES_PROCESO = _agrupar_por_region(mapa_data)
 
-    if comunas_con_datos == 0:
-        print(f" ⚠ No hay datos electorales para Isla de Pascua")
 
-    # Configurar figura
-    fig = plt.figure(figsize=(14, 10))
+def _generar_mapa_region_proceso(region_num, output_dir):
+    """
+    Genera un mapa regional dentro de un proceso del pool.
 
-    gs = GridSpec(3, 2, figure=fig, height_ratios=[0.05, 0.90, 0.05],
-                  width_ratios=[0.70, 0.30], hspace=0.08, wspace=0.08)
+    Args:
+        region_num (int): Número de región.
+        output_dir (str): Directorio para guardar el mapa.
 
-    # Título
-    ax_titulo = fig.add_subplot(gs[0, :])
-    ax_titulo.set_axis_off()
-    ax_titulo.text(0.5, 0.5, 'Isla de Pascua (Rapa Nui) - Comuna de Isla de Pascua',
-                   ha='center', va='center', fontsize=18, fontweight='bold',
-                   transform=ax_titulo.transAxes)
+    Returns:
+        str or None: Ruta del mapa generado o None si falla.
+    """
+    try:
+        return crear_mapa_regional_completo(region_num, _MAPA_DATA_PROCESO, output_dir,
+                                            region_data=_REGIONES_PROCESO.get(region_num))
+    except Exception as e:
+        print(f" ✗ Error generando mapa Región {region_num}: {e}")
+        return None
 
-    # Mapa
-    ax_mapa = fig.add_subplot(gs[1, 0])
 
-    if 'diferencia_pct' in islands_data.columns:
-        islands_data['color'] = islands_data['diferencia_pct'].apply(asignar_color_diferencia)
-    else:
-        islands_data['color'] = '#D3D3D3'
+def generar_mapas_regionales(mapa_data, output_dir, regions=None, procesos=None):
+    """
+    Genera los mapas regionales, en paralelo cuando hay varios núcleos.
 
-    # Dibujar mapa con límites específicos
-    try:
-        islands_data.plot(ax=ax_mapa, color=islands_data['color'], edgecolor='black', linewidth=0.5)
+    Cada región es independiente, así que se reparten entre procesos; cada
+    proceso reutiliza sus propias figuras base entre las regiones que le tocan.
+    Con un solo proceso se generan en secuencia en el proceso actual.
 
-        ax_mapa.set_xlim(rapa_nui_bounds['minx'], rapa_nui_bounds['maxx'])
-        ax_mapa.set_ylim(rapa_nui_bounds['miny'], rapa_nui_bounds['maxy'])
+    Args:
+        mapa_data (GeoDataFrame): Datos combinados de toda Chile.
+        output_dir (str): Directorio para guardar los mapas.
+        regions (iterable or None): Regiones a generar, o None para todas.
+        procesos (int or None): Número de procesos; None usa los núcleos disponibles (máx. 8).
 
-    except Exception as e:
-        print(f" ⚠ Error dibujando mapa de Isla de Pascua: {e}")
-        for idx, row in islands_data.iterrows():
-            if hasattr(row, 'geometry') and row.geometry is not None:
-                try:
-                    gpd.GeoSeries([row.geometry]).plot(ax=ax_mapa, color=row['color'],
-                                                       edgecolor='black', linewidth=0.5)
-                except:
-                    continue
+    Returns:
+        list: Rutas de los mapas generados.
+    """
+    if regions is None:
+        regions = _REGION_TABLE.index
+    regions = list(regions)
+
+    if procesos is None:
+        procesos = min(len(regions), os.cpu_count() or 1, 8)
+
+    mapas_generados = []
+    if procesos > 1:
+        with ProcessPoolExecutor(max_workers=procesos, initializer=_iniciar_proceso_regional,
+                                 initargs=(mapa_data,)) as pool:
+            for mapa_path in pool.map(_generar_mapa_region_proceso, regions,
+                                      [output_dir] * len(regions)):
+                if mapa_path:
+                    mapas_generados.append(mapa_path)
+        return mapas_generados
 
-    # Agregar nombres
-    agregar_nombres_comunas(ax_mapa, islands_data, fontsize=12)
+    # Separar las regiones una sola vez en vez de filtrar el país completo por región
+    grupos = _agrupar_por_region(mapa_data)
+    try:
+        for region_num in regions:
+            try:
+                mapa_path = crear_mapa_regional_completo(region_num, mapa_data, output_dir,
+                                                         region_data=grupos.get(region_num))
+                if mapa_path:
+                    mapas_generados.append(mapa_path)
+            except Exception as e:
+                print(f" ✗ Error generando mapa Región {region_num}: {e}")
+    finally:
+        _cerrar_esqueletos_regionales()
 
-    ax_mapa.set_axis_off()
-    ax_mapa.set_aspect('equal')
+    return mapas_generados
 
-    # Panel de estadísticas
-    ax_stats_container = fig.add_subplot(gs[1, 1])
-    ax_stats_container.set_axis_off()
 
-    stats_gs = GridSpecFromSubplotSpec(4, 1, subplot_spec=gs[1, 1],
-                                       height_ratios=[0.5, 0.25, 0.15, 0.10], hspace=0.15)
+# ============================================================================
+# FUNCIONES PARA MAPAS DE ISLAS
+# ============================================================================
 
-    # Calcular estadísticas
-    jara_promedio = kast_promedio = 0
-    jara_gana = kast_gana = empates = 0
-    dif_promedio = 0
+def _caja_preparada(limites):
+    """
+    Construye el rectángulo de unos límites y lo prepara para consultas repetidas.
 
-    if comunas_con_datos > 0:
-        jara_promedio, kast_promedio = calcular_promedio_regional_correcto(islands_data)
-        dif_promedio = jara_promedio - kast_promedio
+    Args:
+        limites (dict): Rectángulo con claves 'minx', 'miny', 'maxx', 'maxy'.
 
-        jara_gana = (islands_data['diferencia_pct'] > 0).sum()
-        kast_gana = (islands_data['diferencia_pct'] < 0).sum()
-        empates = (islands_data['diferencia_pct'] == 0).sum()
+    Returns:
+        shapely.Polygon: Rectángulo preparado.
+    """
+    caja = box(limites['minx'], limites['miny'], limites['maxx'], limites['maxy'])
+    shapely.prepare(caja)
+    return caja
 
-    # Gráfico de barras
-    ax_barras = fig.add_subplot(stats_gs[0])
 
-    if comunas_con_datos > 0:
-        candidatos = ['JARA', 'KAST']
-        porcentajes = [jara_promedio, kast_promedio]
-        colores_barras = ['#E54540', '#2D426C']
+# Rectángulos preparados de las islas (se preparan una sola vez)
+_CAJA_ISLA_PASCUA = _caja_preparada(LIMITES_ISLA_PASCUA)
+_CAJA_JUAN_FERNANDEZ = _caja_preparada(LIMITES_JUAN_FERNANDEZ)
 
-        bars = ax_barras.bar(candidatos, porcentajes, color=colores_barras,
-                             edgecolor='black', width=0.6)
 
-        ax_barras.set_ylabel('Porcentaje (%)', fontsize=11, fontweight='bold')
-        ax_barras.set_title('RESULTADO ISLA DE PASCUA', fontsize=13, fontweight='bold', pad=10)
+def _seleccionar_por_limites(mapa_data, caja):
+    """
+    Selecciona las comunas que intersectan un rectángulo geográfico.
 
-        max_porcentaje = max(porcentajes) if len(porcentajes) > 0 else 100
-        ax_barras.set_ylim(0, max_porcentaje * 1.25)
+    Consulta el índice espacial (R-tree) de mapa_data, que se construye una
+    sola vez y queda asociado al GeoDataFrame, en lugar de recorrer las filas.
 
-        ax_barras.axhline(y=50, color='gray', linestyle='--', alpha=0.5, linewidth=1)
+    Args:
+        mapa_data (GeoDataFrame): Datos combinados de toda Chile.
+        caja (shapely.Polygon): Rectángulo (preparado) a consultar.
 
-        for bar in bars:
-            height = bar.get_height()
-            ax_barras.text(bar.get_x() + bar.get_width() / 2.,
-                           height + (max_porcentaje * 0.02),
-                           f'{height:.1f}%',
-                           ha='center', va='bottom',
-                           fontsize=11, fontweight='bold')
-    else:
-        ax_barras.text(0.5, 0.5, 'SIN DATOS',
-                       ha='center', va='center',
-                       transform=ax_barras.transAxes,
-                       fontsize=14, fontweight='bold',
-                       color='gray')
-        ax_barras.set_title('RESULTADO ISLA DE PASCUA', fontsize=13, fontweight='bold', pad=10)
+    Returns:
+        GeoDataFrame: Copia de las comunas que intersectan el rectángulo.
+    """
+    indices = mapa_data.sindex.query(caja, predicate='intersects')
+    return mapa_data.iloc[np.sort(indices)].copy()
 
-    ax_barras.grid(axis='y', alpha=0.3)
-    ax_barras.tick_params(axis='both', labelsize=10)
 
-    # Estadísticas de comunas
-    ax_comunas = fig.add_subplot(stats_gs[1])
-    ax_comunas.set_axis_off()
+@dataclass(frozen=True)
+class IslaConfig:
+    """
+    Parámetros de un mapa de isla oceánica (ver _crear_mapa_isla).
+
+    Attributes:
+        nombre (str): Nombre corto para títulos, mensajes y pie de página.
+        nombre_largo (str): Nombre usado en los avisos de falta de datos.
+        descripcion (str): Texto del mensaje de inicio.
+        titulo (str): Título de la figura.
+        limites (dict): Límites geográficos (minx, miny, maxx, maxy) del mapa.
+        caja (shapely.Polygon): Rectángulo preparado de los límites.
+        patron_nombre (re.Pattern): Comunas a usar si no hay nada dentro de los límites.
+        clave_salida (str): Clave del archivo de salida en _rutas_salida.
+    """
+    nombre: str
+    nombre_largo: str
+    descripcion: str
+    titulo: str
+    limites: dict
+    caja: object
+    patron_nombre: object
+    clave_salida: str
+
+
+ISLA_PASCUA = IslaConfig(
+    nombre='Isla de Pascua',
+    nombre_largo='Isla de Pascua',
+    descripcion='Isla de Pascua (Rapa Nui) - SOLO ISLA PRINCIPAL',
+    titulo='Isla de Pascua (Rapa Nui) - Comuna de Isla de Pascua',
+    limites=LIMITES_ISLA_PASCUA,
+    caja=_CAJA_ISLA_PASCUA,
+    patron_nombre=re.compile('Isla de Pascua|Rapa Nui', re.IGNORECASE),
+    clave_salida='isla_pascua'
+)
 
-    if comunas_con_datos > 0:
-        total_comunas = len(islands_data)
-        sin_datos = total_comunas - comunas_con_datos
+JUAN_FERNANDEZ = IslaConfig(
+    nombre='Juan Fernández',
+    nombre_largo='Archipiélago Juan Fernández',
+    descripcion='Archipiélago Juan Fernández',
+    titulo='Comuna de Juan Fernández - Islas Robinson Crusoe y Santa Clara',
+    limites=LIMITES_JUAN_FERNANDEZ,
+    caja=_CAJA_JUAN_FERNANDEZ,
+    patron_nombre=re.compile('Juan Fernández', re.IGNORECASE),
+    clave_salida='juan_fernandez'
+)
 
-        stats_text = (f"COMUNAS CON DATOS: {comunas_con_datos}/{total_comunas}\n\n"
-                      f"JARA gana en: {jara_gana} comunas\n"
-                      f"KAST gana en: {kast_gana} comunas\n"
-                      f"Empates: {empates} comunas")
 
-        if sin_datos > 0:
-            stats_text += f"\nSin datos: {sin_datos} comunas"
+# Figura reutilizable de los mapas de islas (se crea al dibujar la primera isla)
+_ESQUELETO_ISLA = {}
 
-        ax_comunas.text(0.05, 0.9, stats_text,
-                        ha='left', va='top',
-                        fontsize=10,
-                        transform=ax_comunas.transAxes,
-                        linespacing=1.5)
-    else:
-        ax_comunas.text(0.5, 0.5, 'NO HAY DATOS ELECTORALES\nPARA ISLA DE PASCUA',
-                        ha='center', va='center',
-                        fontsize=11, fontweight='bold',
-                        transform=ax_comunas.transAxes,
-                        color='gray')
 
-    # Diferencia
-    ax_diferencia = fig.add_subplot(stats_gs[2])
-    ax_diferencia.set_axis_off()
+def _obtener_esqueleto_isla():
+    """
+    Obtiene (o crea una sola vez) la figura base de los mapas de islas.
 
-    if comunas_con_datos > 0:
-        color_dif = '#E54540' if dif_promedio > 0 else '#2D426C' if dif_promedio < 0 else 'gray'
+    Igual que en los mapas regionales, la figura, la grilla, los ejes y la
+    barra de colores se construyen una vez; cada isla solo limpia y vuelve a
+    dibujar el contenido de los ejes.
 
-        dif_text = (f"DIFERENCIA\n"
-                    f"{dif_promedio:+.1f}%")
+    Returns:
+        dict: Figura ('fig') y ejes del mapa de islas.
+    """
+    if _ESQUELETO_ISLA:
+        return _ESQUELETO_ISLA
 
-        ax_diferencia.text(0.5, 0.7, dif_text,
-                           ha='center', va='center',
-                           fontsize=12, fontweight='bold',
-                           color=color_dif,
-                           transform=ax_diferencia.transAxes)
+    fig = plt.figure(figsize=(14, 10))
 
-        info_text = f"Jara {jara_promedio:.1f}% - Kast {kast_promedio:.1f}%"
-        ax_diferencia.text(0.5, 0.3, info_text,
-                           ha='center', va='center',
-                           fontsize=9,
-                           color='gray',
-                           transform=ax_diferencia.transAxes)
-    else:
-        ax_diferencia.text(0.5, 0.7, 'DIFERENCIA\nN/A',
-                           ha='center', va='center',
-                           fontsize=12, fontweight='bold',
-                           color='gray',
-                           transform=ax_diferencia.transAxes)
+    gs = GridSpec(3, 2, figure=fig, height_ratios=[0.05, 0.90, 0.05],
+                  width_ratios=[0.70, 0.30], hspace=0.08, wspace=0.08,
+                  left=0.02, right=0.98, top=0.98, bottom=0.02)
 
-    # Escala de colores
-    ax_escala = fig.add_subplot(stats_gs[3])
+    ax_titulo = fig.add_subplot(gs[0, :])
+    ax_mapa = fig.add_subplot(gs[1, 0])
 
-    norm = plt.Normalize(-100, 100)
-    sm = ScalarMappable(cmap=cmap_continuo, norm=norm)
-    sm.set_array([])
+    # Panel de estadísticas
+    ax_stats_container = fig.add_subplot(gs[1, 1])
+    ax_stats_container.set_axis_off()
 
-    cbar = fig.colorbar(sm, cax=ax_escala, orientation='horizontal', fraction=0.9)
-    cbar.set_label('Diferencia (Jara% - Kast%)', fontsize=8, fontweight='bold', labelpad=3)
+    stats_gs = GridSpecFromSubplotSpec(4, 1, subplot_spec=gs[1, 1],
+                                       height_ratios=[0.5, 0.25, 0.15, 0.10], hspace=0.15)
 
-    ticks = [-100, -50, -10, 0, 10, 50, 100]
-    tick_labels = ['-100', '-50', '-10', '0', '10', '50', '+100']
+    ax_barras = fig.add_subplot(stats_gs[0])
+    ax_comunas = fig.add_subplot(stats_gs[1])
+    ax_diferencia = fig.add_subplot(stats_gs[2])
 
-    cbar.set_ticks(ticks)
-    cbar.set_ticklabels(tick_labels)
-    cbar.ax.tick_params(labelsize=6)
+    # Escala de colores (igual para todas las islas)
+    ax_escala = fig.add_subplot(stats_gs[3])
+    _dibujar_escala_diferencia(fig, ax_escala)
 
-    # Pie de página
     ax_fondo = fig.add_subplot(gs[2, :])
+
+    # Título y pie de página persistentes: entre islas solo cambia su texto
+    ax_titulo.set_axis_off()
+    texto_titulo = ax_titulo.text(0.5, 0.5, '', ha='center', va='center',
+                                  fontsize=18, fontweight='bold', transform=ax_titulo.transAxes)
     ax_fondo.set_axis_off()
+    texto_fondo = ax_fondo.text(0.5, 0.5, '', ha='center', va='center',
+                                fontsize=8, color='gray', transform=ax_fondo.transAxes)
 
-    fecha = datetime.now().strftime("%d/%m/%Y")
-    info_text = f"Análisis Segunda Vuelta Presidencial Chile 2025 - Jara vs Kast | Isla de Pascua | Generado: {fecha}"
-    ax_fondo.text(0.5, 0.5, info_text,
-                  ha='center', va='center',
-                  fontsize=8, color='gray',
-                  transform=ax_fondo.transAxes)
+    _ESQUELETO_ISLA.update({
+        'fig': fig,
+        'texto_titulo': texto_titulo,
+        'texto_fondo': texto_fondo,
+        'mapa': ax_mapa,
+        'barras': ax_barras,
+        'comunas': ax_comunas,
+        'diferencia': ax_diferencia,
+    })
+    return _ESQUELETO_ISLA
 
-    plt.tight_layout(rect=[0.02, 0.02, 0.98, 0.98])
-    output_path = os.path.join(output_dir, "ISLA_DE_PASCUA_RAPA_NUI.png")
-    plt.savefig(output_path, dpi=300, bbox_inches='tight', pad_inches=0.2)
-    plt.close(fig)
 
-    print(f" ✓ Mapa de Isla de Pascua guardado: {output_path}")
-    return output_path
+def _cerrar_esqueleto_isla():
+    """Cierra la figura reutilizable de los mapas de islas."""
+    if _ESQUELETO_ISLA:
+        plt.close(_ESQUELETO_ISLA['fig'])
+        _ESQUELETO_ISLA.clear()
 
 
-def crear_mapa_juan_fernandez(mapa_data, output_dir):
+# Cerrar la figura al terminar aunque las funciones de islas se usen sueltas
+atexit.register(_cerrar_esqueleto_isla)
+
+
+def _crear_mapa_isla(mapa_data, output_dir, cfg):
     """
-    Crea mapa separado para Archipiélago Juan Fernández.
+    Crea el mapa separado de una isla oceánica con su panel de estadísticas.
 
     Args:
         mapa_data (GeoDataFrame): Datos combinados de toda Chile.
         output_dir (str): Directorio para guardar el mapa.
+        cfg (IslaConfig): Parámetros de la isla.
 
     Returns:
         str or None: Ruta del archivo guardado o None si falla.
     """
-    print(f" 🗺️ Generando mapa separado para Archipiélago Juan Fernández")
+    print(f" 🗺️ Generando mapa separado para {cfg.descripcion}")
 
-    islands_data = mapa_data[
-        mapa_data['NOM_COM'].str.contains('Juan Fernández', case=False, na=False)].copy()
+    islands_data = _seleccionar_por_limites(mapa_data, cfg.caja)
+    if islands_data.empty:
+        islands_data = mapa_data[mapa_data['NOM_COM'].str.contains(cfg.patron_nombre, na=False)].copy()
 
     if islands_data.empty:
-        print(f" ⚠ No hay datos para Archipiélago Juan Fernández")
+        print(f" ⚠ No hay datos para {cfg.nombre_largo}")
         return None
 
-    # Límites geográficos para Juan Fernández
-    juan_fernandez_bounds = {
-        'minx': -79.0,
-        'miny': -33.8,
-        'maxx': -78.7,
-        'maxy': -33.6
-    }
-
     # Verificar datos electorales
-    comunas_con_datos = 0
+    # Ganadores y comunas con datos en una sola pasada (los NaN no cuentan)
+    jara_gana = kast_gana = empates = 0
     if 'diferencia_pct' in islands_data.columns:
-        comunas_con_datos = islands_data['diferencia_pct'].notna().sum()
+        jara_gana, kast_gana, empates = _contar_ganadores(islands_data['diferencia_pct'])
+    comunas_con_datos = jara_gana + kast_gana + empates
 
     if comunas_con_datos == 0:
-        print(f" ⚠ No hay datos electorales para Archipiélago Juan Fernández")
-
-    # Configurar figura
-    fig = plt.figure(figsize=(14, 10))
+        print(f" ⚠ No hay datos electorales para {cfg.nombre_largo}")
 
-    gs = GridSpec(3, 2, figure=fig, height_ratios=[0.05, 0.90, 0.05],
-                  width_ratios=[0.70, 0.30], hspace=0.08, wspace=0.08)
+    # Reutilizar la figura de las islas y limpiar el contenido anterior
+    esqueleto = _obtener_esqueleto_isla()
+    fig = esqueleto['fig']
+    for clave in ('mapa', 'barras', 'comunas', 'diferencia'):
+        esqueleto[clave].clear()
 
     # Título
-    ax_titulo = fig.add_subplot(gs[0, :])
-    ax_titulo.set_axis_off()
-    ax_titulo.text(0.5, 0.5, 'Comuna de Juan Fernández - Islas Robinson Crusoe y Santa Clara',
-                   ha='center', va='center', fontsize=18, fontweight='bold',
-                   transform=ax_titulo.transAxes)
+    esqueleto['texto_titulo'].set_text(cfg.titulo)
 
     # Mapa
-    ax_mapa = fig.add_subplot(gs[1, 0])
+    ax_mapa = esqueleto['mapa']
 
     if 'diferencia_pct' in islands_data.columns:
-        islands_data['color'] = islands_data['diferencia_pct'].apply(asignar_color_diferencia)
+        islands_data['color'] = colorizar(islands_data['diferencia_pct'])
     else:
         islands_data['color'] = '#D3D3D3'
+    islands_data['_text_color'] = _colores_texto(islands_data)
 
     # Dibujar mapa con límites específicos
     try:
-        islands_data.plot(ax=ax_mapa, color=islands_data['color'], edgecolor='black', linewidth=0.5)
+        ax_mapa.add_collection(_coleccion_poligonos(islands_data, islands_data['color'], linewidth=0.5))
+        ax_mapa.autoscale_view()
 
-        ax_mapa.set_xlim(juan_fernandez_bounds['minx'], juan_fernandez_bounds['maxx'])
-        ax_mapa.set_ylim(juan_fernandez_bounds['miny'], juan_fernandez_bounds['maxy'])
+        ax_mapa.set_xlim(cfg.limites['minx'], cfg.limites['maxx'])
+        ax_mapa.set_ylim(cfg.limites['miny'], cfg.limites['maxy'])
 
     except Exception as e:
-        print(f" ⚠ Error dibujando mapa de Juan Fernández: {e}")
-        for idx, row in islands_data.iterrows():
-            if hasattr(row, 'geometry') and row.geometry is not None:
-                try:
-                    gpd.GeoSeries([row.geometry]).plot(ax=ax_mapa, color=row['color'],
-                                                       edgecolor='black', linewidth=0.5)
-                except:
-                    continue
+        print(f" ⚠ Error dibujando mapa de {cfg.nombre}: {e}")
+        # Si falla la colección de trazados, dibujar una PatchCollection simple
+        try:
+            ax_mapa.add_collection(_coleccion_parches(islands_data, islands_data['color'], linewidth=0.5))
+            ax_mapa.autoscale_view()
+        except Exception as e:
+            print(f" ⚠ Error en el dibujo alternativo: {e}")
 
     # Agregar nombres
     agregar_nombres_comunas(ax_mapa, islands_data, fontsize=12)
@@ -2341,28 +3021,17 @@ def crear_mapa_juan_fernandez(mapa_data, output_dir):
     ax_mapa.set_axis_off()
     ax_mapa.set_aspect('equal')
 
-    # Panel de estadísticas
-    ax_stats_container = fig.add_subplot(gs[1, 1])
-    ax_stats_container.set_axis_off()
-
-    stats_gs = GridSpecFromSubplotSpec(4, 1, subplot_spec=gs[1, 1],
-                                       height_ratios=[0.5, 0.25, 0.15, 0.10], hspace=0.15)
-
     # Calcular estadísticas
+    titulo_resultado = f'RESULTADO {cfg.nombre.upper()}'
     jara_promedio = kast_promedio = 0
-    jara_gana = kast_gana = empates = 0
     dif_promedio = 0
 
     if comunas_con_datos > 0:
         jara_promedio, kast_promedio = calcular_promedio_regional_correcto(islands_data)
         dif_promedio = jara_promedio - kast_promedio
 
-        jara_gana = (islands_data['diferencia_pct'] > 0).sum()
-        kast_gana = (islands_data['diferencia_pct'] < 0).sum()
-        empates = (islands_data['diferencia_pct'] == 0).sum()
-
     # Gráfico de barras
-    ax_barras = fig.add_subplot(stats_gs[0])
+    ax_barras = esqueleto['barras']
 
     if comunas_con_datos > 0:
         candidatos = ['JARA', 'KAST']
@@ -2373,7 +3042,7 @@ def crear_mapa_juan_fernandez(mapa_data, output_dir):
                              edgecolor='black', width=0.6)
 
         ax_barras.set_ylabel('Porcentaje (%)', fontsize=11, fontweight='bold')
-        ax_barras.set_title('RESULTADO JUAN FERNÁNDEZ', fontsize=13, fontweight='bold', pad=10)
+        ax_barras.set_title(titulo_resultado, fontproperties=_FP_TITULO, fontsize=13, pad=10)
 
         max_porcentaje = max(porcentajes) if len(porcentajes) > 0 else 100
         ax_barras.set_ylim(0, max_porcentaje * 1.25)
@@ -2393,13 +3062,13 @@ def crear_mapa_juan_fernandez(mapa_data, output_dir):
                        transform=ax_barras.transAxes,
                        fontsize=14, fontweight='bold',
                        color='gray')
-        ax_barras.set_title('RESULTADO JUAN FERNÁNDEZ', fontsize=13, fontweight='bold', pad=10)
+        ax_barras.set_title(titulo_resultado, fontproperties=_FP_TITULO, fontsize=13, pad=10)
 
     ax_barras.grid(axis='y', alpha=0.3)
     ax_barras.tick_params(axis='both', labelsize=10)
 
     # Estadísticas de comunas
-    ax_comunas = fig.add_subplot(stats_gs[1])
+    ax_comunas = esqueleto['comunas']
     ax_comunas.set_axis_off()
 
     if comunas_con_datos > 0:
@@ -2420,14 +3089,14 @@ def crear_mapa_juan_fernandez(mapa_data, output_dir):
                         transform=ax_comunas.transAxes,
                         linespacing=1.5)
     else:
-        ax_comunas.text(0.5, 0.5, 'NO HAY DATOS ELECTORALES\nPARA JUAN FERNÁNDEZ',
+        ax_comunas.text(0.5, 0.5, f'NO HAY DATOS ELECTORALES\nPARA {cfg.nombre.upper()}',
                         ha='center', va='center',
                         fontsize=11, fontweight='bold',
                         transform=ax_comunas.transAxes,
                         color='gray')
 
     # Diferencia
-    ax_diferencia = fig.add_subplot(stats_gs[2])
+    ax_diferencia = esqueleto['diferencia']
     ax_diferencia.set_axis_off()
 
     if comunas_con_datos > 0:
@@ -2455,41 +3124,44 @@ def crear_mapa_juan_fernandez(mapa_data, output_dir):
                            color='gray',
                            transform=ax_diferencia.transAxes)
 
-    # Escala de colores
-    ax_escala = fig.add_subplot(stats_gs[3])
+    # Pie de página
+    esqueleto['texto_fondo'].set_text(_texto_pie(cfg.nombre))
 
-    norm = plt.Normalize(-100, 100)
-    sm = ScalarMappable(cmap=cmap_continuo, norm=norm)
-    sm.set_array([])
+    # Márgenes fijos en el GridSpec: sin tight_layout ni bbox_inches='tight',
+    # que obligan a dibujar la figura una vez más solo para medirla
+    output_path = _rutas_salida(output_dir)[cfg.clave_salida]
+    _guardar_png_opaco(fig, output_path, dpi=300)
 
-    cbar = fig.colorbar(sm, cax=ax_escala, orientation='horizontal', fraction=0.9)
-    cbar.set_label('Diferencia (Jara% - Kast%)', fontsize=8, fontweight='bold', labelpad=3)
+    print(f" ✓ Mapa de {cfg.nombre} guardado: {output_path}")
+    return output_path
 
-    ticks = [-100, -50, -10, 0, 10, 50, 100]
-    tick_labels = ['-100', '-50', '-10', '0', '10', '50', '+100']
 
-    cbar.set_ticks(ticks)
-    cbar.set_ticklabels(tick_labels)
-    cbar.ax.tick_params(labelsize=6)
+def crear_mapa_isla_pascua(mapa_data, output_dir):
+    """
+    Crea mapa separado para Isla de Pascua (Rapa Nui).
 
-    # Pie de página
-    ax_fondo = fig.add_subplot(gs[2, :])
-    ax_fondo.set_axis_off()
+    Args:
+        mapa_data (GeoDataFrame): Datos combinados de toda Chile.
+        output_dir (str): Directorio para guardar el mapa.
 
-    fecha = datetime.now().strftime("%d/%m/%Y")
-    info_text = f"Análisis Segunda Vuelta Presidencial Chile 2025 - Jara vs Kast | Juan Fernández | Generado: {fecha}"
-    ax_fondo.text(0.5, 0.5, info_text,
-                  ha='center', va='center',
-                  fontsize=8, color='gray',
-                  transform=ax_fondo.transAxes)
+    Returns:
+        str or None: Ruta del archivo guardado o None si falla.
+    """
+    return _crear_mapa_isla(mapa_data, output_dir, ISLA_PASCUA)
 
-    plt.tight_layout(rect=[0.02, 0.02, 0.98, 0.98])
-    output_path = os.path.join(output_dir, "ARCHIPIELAGO_JUAN_FERNANDEZ.png")
-    plt.savefig(output_path, dpi=300, bbox_inches='tight', pad_inches=0.2)
-    plt.close(fig)
 
-    print(f" ✓ Mapa de Juan Fernández guardado: {output_path}")
-    return output_path
+def crear_mapa_juan_fernandez(mapa_data, output_dir):
+    """
+    Crea mapa separado para Archipiélago Juan Fernández.
+
+    Args:
+        mapa_data (GeoDataFrame): Datos combinados de toda Chile.
+        output_dir (str): Directorio para guardar el mapa.
+
+    Returns:
+        str or None: Ruta del archivo guardado o None si falla.
+    """
+    return _crear_mapa_isla(mapa_data, output_dir, JUAN_FERNANDEZ)
 
 
 # ============================================================================
@@ -2509,13 +3181,10 @@ def crear_mapa_gran_valparaiso(mapa_data, output_dir):
     """
     print(f" 🗺️ Generando mapa separado para Gran Valparaíso")
 
-    # Normalizar nombres de comunas del Gran Valparaíso
-    gran_valparaiso_norm = [normalizar_nombre(comuna) for comuna in GRAN_VALPARAISO]
-
     # Filtrar datos del Gran Valparaíso
     gran_valparaiso_data = mapa_data[
         (mapa_data['REGION_NUM'] == 5) &
-        (mapa_data['NOM_COM_NORM'].isin(gran_valparaiso_norm))
+        (mapa_data['NOM_COM_NORM'].isin(_GRAN_VALPO_SET))
         ].copy()
 
     if gran_valparaiso_data.empty:
@@ -2523,9 +3192,11 @@ def crear_mapa_gran_valparaiso(mapa_data, output_dir):
         return None
 
     # Verificar datos electorales
-    comunas_con_datos = 0
+    # Ganadores y comunas con datos en una sola pasada (los NaN no cuentan)
+    jara_gana = kast_gana = empates = 0
     if 'diferencia_pct' in gran_valparaiso_data.columns:
-        comunas_con_datos = gran_valparaiso_data['diferencia_pct'].notna().sum()
+        jara_gana, kast_gana, empates = _contar_ganadores(gran_valparaiso_data['diferencia_pct'])
+    comunas_con_datos = jara_gana + kast_gana + empates
 
     if comunas_con_datos == 0:
         print(f" ⚠ No hay datos electorales para Gran Valparaíso")
@@ -2548,25 +3219,22 @@ def crear_mapa_gran_valparaiso(mapa_data, output_dir):
 
     # Calcular estadísticas
     jara_promedio = kast_promedio = 0
-    jara_gana = kast_gana = empates = 0
     dif_promedio = 0
 
     if comunas_con_datos > 0:
-        gran_valparaiso_data['color'] = gran_valparaiso_data['diferencia_pct'].apply(asignar_color_diferencia)
+        gran_valparaiso_data['color'] = colorizar(gran_valparaiso_data['diferencia_pct'])
         jara_promedio, kast_promedio = calcular_promedio_regional_correcto(gran_valparaiso_data)
         dif_promedio = jara_promedio - kast_promedio
-
-        jara_gana = (gran_valparaiso_data['diferencia_pct'] > 0).sum()
-        kast_gana = (gran_valparaiso_data['diferencia_pct'] < 0).sum()
-        empates = (gran_valparaiso_data['diferencia_pct'] == 0).sum()
     else:
         gran_valparaiso_data['color'] = '#D3D3D3'
+    gran_valparaiso_data['_text_color'] = _colores_texto(gran_valparaiso_data)
 
     # Dibujar mapa
     try:
         if 'geometry' in gran_valparaiso_data.columns and not gran_valparaiso_data.geometry.isna().all():
-            gran_valparaiso_data.plot(ax=ax_mapa, color=gran_valparaiso_data['color'],
-                                      edgecolor='black', linewidth=0.8)
+            ax_mapa.add_collection(_coleccion_poligonos(gran_valparaiso_data, gran_valparaiso_data['color'],
+                                                     linewidth=0.8))
+            ax_mapa.autoscale_view()
 
             agregar_nombres_comunas(ax_mapa, gran_valparaiso_data,
                                     fontsize=TAMANOS_FUENTE_AREAS_METROPOLITANAS['gran_valparaiso'])
@@ -2605,7 +3273,7 @@ def crear_mapa_gran_valparaiso(mapa_data, output_dir):
                              edgecolor='black', width=0.6)
 
         ax_barras.set_ylabel('Porcentaje (%)', fontsize=11, fontweight='bold')
-        ax_barras.set_title('PROMEDIO GRAN VALPARAÍSO', fontsize=13, fontweight='bold', pad=10)
+        ax_barras.set_title('PROMEDIO GRAN VALPARAÍSO', fontproperties=_FP_TITULO, fontsize=13, pad=10)
 
         max_porcentaje = max(porcentajes) if len(porcentajes) > 0 else 100
         ax_barras.set_ylim(0, max_porcentaje * 1.25)
@@ -2625,7 +3293,7 @@ def crear_mapa_gran_valparaiso(mapa_data, output_dir):
                        transform=ax_barras.transAxes,
                        fontsize=14, fontweight='bold',
                        color='gray')
-        ax_barras.set_title('PROMEDIO GRAN VALPARAÍSO', fontsize=13, fontweight='bold', pad=10)
+        ax_barras.set_title('PROMEDIO GRAN VALPARAÍSO', fontproperties=_FP_TITULO, fontsize=13, pad=10)
 
     ax_barras.grid(axis='y', alpha=0.3)
     ax_barras.tick_params(axis='both', labelsize=10)
@@ -2695,33 +3363,20 @@ def crear_mapa_gran_valparaiso(mapa_data, output_dir):
     # Escala de colores
     ax_escala = fig.add_subplot(stats_gs[3])
 
-    norm = plt.Normalize(-100, 100)
-    sm = ScalarMappable(cmap=cmap_continuo, norm=norm)
-    sm.set_array([])
-
-    cbar = fig.colorbar(sm, cax=ax_escala, orientation='horizontal', fraction=0.9)
-    cbar.set_label('Diferencia (Jara% - Kast%)', fontsize=8, fontweight='bold', labelpad=3)
-
-    ticks = [-100, -50, -10, 0, 10, 50, 100]
-    tick_labels = ['-100', '-50', '-10', '0', '10', '50', '+100']
-
-    cbar.set_ticks(ticks)
-    cbar.set_ticklabels(tick_labels)
-    cbar.ax.tick_params(labelsize=6)
+    _dibujar_escala_diferencia(fig, ax_escala)
 
     # Pie de página
     ax_fondo = fig.add_subplot(gs[2, :])
     ax_fondo.set_axis_off()
 
-    fecha = datetime.now().strftime("%d/%m/%Y")
-    info_text = f"Análisis Segunda Vuelta Presidencial Chile 2025 - Jara vs Kast | Gran Valparaíso | Generado: {fecha}"
+    info_text = _texto_pie('Gran Valparaíso')
     ax_fondo.text(0.5, 0.5, info_text,
                   ha='center', va='center',
                   fontsize=8, color='gray',
                   transform=ax_fondo.transAxes)
 
-    plt.tight_layout(rect=[0.02, 0.02, 0.98, 0.98])
-    output_path = os.path.join(output_dir, "GRAN_VALPARAISO_METROPOLITANO.png")
+    _ajustar_diseno([0.02, 0.02, 0.98, 0.98])
+    output_path = _rutas_salida(output_dir)['gran_valparaiso']
     plt.savefig(output_path, dpi=300, bbox_inches='tight', pad_inches=0.2)
     plt.close(fig)
 
@@ -2742,13 +3397,10 @@ def crear_mapa_gran_concepcion(mapa_data, output_dir):
     """
     print(f" 🗺️ Generando mapa separado para Gran Concepción")
 
-    # Normalizar nombres de comunas del Gran Concepción
-    gran_concepcion_norm = [normalizar_nombre(comuna) for comuna in GRAN_CONCEPCION]
-
     # Filtrar datos del Gran Concepción
     gran_concepcion_data = mapa_data[
         (mapa_data['REGION_NUM'] == 8) &
-        (mapa_data['NOM_COM_NORM'].isin(gran_concepcion_norm))
+        (mapa_data['NOM_COM_NORM'].isin(_GRAN_CONCE_SET))
         ].copy()
 
     if gran_concepcion_data.empty:
@@ -2756,9 +3408,11 @@ def crear_mapa_gran_concepcion(mapa_data, output_dir):
         return None
 
     # Verificar datos electorales
-    comunas_con_datos = 0
+    # Ganadores y comunas con datos en una sola pasada (los NaN no cuentan)
+    jara_gana = kast_gana = empates = 0
     if 'diferencia_pct' in gran_concepcion_data.columns:
-        comunas_con_datos = gran_concepcion_data['diferencia_pct'].notna().sum()
+        jara_gana, kast_gana, empates = _contar_ganadores(gran_concepcion_data['diferencia_pct'])
+    comunas_con_datos = jara_gana + kast_gana + empates
 
     if comunas_con_datos == 0:
         print(f" ⚠ No hay datos electorales para Gran Concepción")
@@ -2781,25 +3435,22 @@ def crear_mapa_gran_concepcion(mapa_data, output_dir):
 
     # Calcular estadísticas
     jara_promedio = kast_promedio = 0
-    jara_gana = kast_gana = empates = 0
     dif_promedio = 0
 
     if comunas_con_datos > 0:
-        gran_concepcion_data['color'] = gran_concepcion_data['diferencia_pct'].apply(asignar_color_diferencia)
+        gran_concepcion_data['color'] = colorizar(gran_concepcion_data['diferencia_pct'])
         jara_promedio, kast_promedio = calcular_promedio_regional_correcto(gran_concepcion_data)
         dif_promedio = jara_promedio - kast_promedio
-
-        jara_gana = (gran_concepcion_data['diferencia_pct'] > 0).sum()
-        kast_gana = (gran_concepcion_data['diferencia_pct'] < 0).sum()
-        empates = (gran_concepcion_data['diferencia_pct'] == 0).sum()
     else:
         gran_concepcion_data['color'] = '#D3D3D3'
+    gran_concepcion_data['_text_color'] = _colores_texto(gran_concepcion_data)
 
     # Dibujar mapa
     try:
         if 'geometry' in gran_concepcion_data.columns and not gran_concepcion_data.geometry.isna().all():
-            gran_concepcion_data.plot(ax=ax_mapa, color=gran_concepcion_data['color'],
-                                      edgecolor='black', linewidth=0.8)
+            ax_mapa.add_collection(_coleccion_poligonos(gran_concepcion_data, gran_concepcion_data['color'],
+                                                     linewidth=0.8))
+            ax_mapa.autoscale_view()
 
             agregar_nombres_comunas(ax_mapa, gran_concepcion_data,
                                     fontsize=TAMANOS_FUENTE_AREAS_METROPOLITANAS['gran_concepcion'])
@@ -2838,7 +3489,7 @@ def crear_mapa_gran_concepcion(mapa_data, output_dir):
                              edgecolor='black', width=0.6)
 
         ax_barras.set_ylabel('Porcentaje (%)', fontsize=11, fontweight='bold')
-        ax_barras.set_title('PROMEDIO GRAN CONCEPCIÓN', fontsize=13, fontweight='bold', pad=10)
+        ax_barras.set_title('PROMEDIO GRAN CONCEPCIÓN', fontproperties=_FP_TITULO, fontsize=13, pad=10)
 
         max_porcentaje = max(porcentajes) if len(porcentajes) > 0 else 100
         ax_barras.set_ylim(0, max_porcentaje * 1.25)
@@ -2858,7 +3509,7 @@ def crear_mapa_gran_concepcion(mapa_data, output_dir):
                        transform=ax_barras.transAxes,
                        fontsize=14, fontweight='bold',
                        color='gray')
-        ax_barras.set_title('PROMEDIO GRAN CONCEPCIÓN', fontsize=13, fontweight='bold', pad=10)
+        ax_barras.set_title('PROMEDIO GRAN CONCEPCIÓN', fontproperties=_FP_TITULO, fontsize=13, pad=10)
 
     ax_barras.grid(axis='y', alpha=0.3)
     ax_barras.tick_params(axis='both', labelsize=10)
@@ -2928,33 +3579,20 @@ def crear_mapa_gran_concepcion(mapa_data, output_dir):
     # Escala de colores
     ax_escala = fig.add_subplot(stats_gs[3])
 
-    norm = plt.Normalize(-100, 100)
-    sm = ScalarMappable(cmap=cmap_continuo, norm=norm)
-    sm.set_array([])
-
-    cbar = fig.colorbar(sm, cax=ax_escala, orientation='horizontal', fraction=0.9)
-    cbar.set_label('Diferencia (Jara% - Kast%)', fontsize=8, fontweight='bold', labelpad=3)
-
-    ticks = [-100, -50, -10, 0, 10, 50, 100]
-    tick_labels = ['-100', '-50', '-10', '0', '10', '50', '+100']
-
-    cbar.set_ticks(ticks)
-    cbar.set_ticklabels(tick_labels)
-    cbar.ax.tick_params(labelsize=6)
+    _dibujar_escala_diferencia(fig, ax_escala)
 
     # Pie de página
     ax_fondo = fig.add_subplot(gs[2, :])
     ax_fondo.set_axis_off()
 
-    fecha = datetime.now().strftime("%d/%m/%Y")
-    info_text = f"Análisis Segunda Vuelta Presidencial Chile 2025 - Jara vs Kast | Gran Concepción | Generado: {fecha}"
+    info_text = _texto_pie('Gran Concepción')
     ax_fondo.text(0.5, 0.5, info_text,
                   ha='center', va='center',
                   fontsize=8, color='gray',
                   transform=ax_fondo.transAxes)
 
-    plt.tight_layout(rect=[0.02, 0.02, 0.98, 0.98])
-    output_path = os.path.join(output_dir, "GRAN_CONCEPCION_METROPOLITANO.png")
+    _ajustar_diseno([0.02, 0.02, 0.98, 0.98])
+    output_path = _rutas_salida(output_dir)['gran_concepcion']
     plt.savefig(output_path, dpi=300, bbox_inches='tight', pad_inches=0.2)
     plt.close(fig)
 
@@ -2979,10 +3617,9 @@ def crear_mapa_conurbacion_santiago(mapa_data, output_dir):
     gran_santiago_gdf = cargar_gran_santiago_geojson()
 
     # Filtrar datos de la conurbación de Santiago
-    conurbacion_norm = [normalizar_nombre(comuna) for comuna in CONURBACION_SANTIAGO]
     conurb_data = mapa_data[
         (mapa_data['REGION_NUM'] == 13) &
-        (mapa_data['NOM_COM_NORM'].isin(conurbacion_norm))
+        (mapa_data['NOM_COM_NORM'].isin(_CONURB_STGO_SET))
         ].copy()
 
     if conurb_data.empty:
@@ -3055,14 +3692,16 @@ def crear_mapa_conurbacion_santiago(mapa_data, output_dir):
     ax_mapa = fig.add_subplot(gs[2])
 
     if comunas_con_datos > 0:
-        conurb_data['color'] = conurb_data['diferencia_pct'].apply(asignar_color_diferencia)
+        conurb_data['color'] = colorizar(conurb_data['diferencia_pct'])
     else:
         conurb_data['color'] = '#D3D3D3'
+    conurb_data['_text_color'] = _colores_texto(conurb_data)
 
     # Dibujar mapa
     try:
         if 'geometry' in conurb_data.columns and not conurb_data.geometry.isna().all():
-            conurb_data.plot(ax=ax_mapa, color=conurb_data['color'], edgecolor='black', linewidth=1.2)
+            ax_mapa.add_collection(_coleccion_poligonos(conurb_data, conurb_data['color'], linewidth=1.2))
+            ax_mapa.autoscale_view()
 
             agregar_etiquetas_gran_santiago(ax_mapa, conurb_data, usar_numeros=True)
 
@@ -3115,8 +3754,7 @@ def crear_mapa_conurbacion_santiago(mapa_data, output_dir):
     # Escala de colores
     ax_escala = fig.add_subplot(gs[4])
 
-    norm = plt.Normalize(-100, 100)
-    sm = ScalarMappable(cmap=cmap_continuo, norm=norm)
+    sm = ScalarMappable(cmap=cmap_continuo, norm=_NORMA_DIFERENCIA)
     sm.set_array([])
 
     cbar = fig.colorbar(sm, cax=ax_escala, orientation='horizontal', fraction=0.9)
@@ -3130,13 +3768,13 @@ def crear_mapa_conurbacion_santiago(mapa_data, output_dir):
     cbar.set_ticklabels(tick_labels)
     cbar.ax.tick_params(labelsize=16)
 
-    plt.tight_layout(rect=[0.01, 0.01, 0.99, 0.99])
+    _ajustar_diseno([0.01, 0.01, 0.99, 0.99])
 
     # Guardar archivo
     if gran_santiago_gdf is not None:
-        output_path = os.path.join(output_dir, "GRAN_SANTIAGO_METROPOLITANO.png")
+        output_path = _rutas_salida(output_dir)['gran_santiago']
     else:
-        output_path = os.path.join(output_dir, "CONURBACION_SANTIAGO_.png")
+        output_path = _rutas_salida(output_dir)['conurbacion_santiago']
 
     plt.savefig(output_path, dpi=400, bbox_inches='tight', pad_inches=0.1)
     plt.close(fig)
@@ -3170,8 +3808,7 @@ def crear_mapa_chile_tres_partes(mapa_data, output_dir):
         return None
 
     # Excluir islas
-    datos_chile = datos_chile[~datos_chile['NOM_COM'].str.contains('Isla de Pascua|Rapa Nui|Juan Fernández',
-                                                                   case=False, na=False)]
+    datos_chile = datos_chile[~datos_chile['NOM_COM'].str.contains(_PATRON_ISLAS_VALPARAISO, na=False)]
 
     # Dividir en zonas
     norte_data = datos_chile[datos_chile['REGION_NUM'].isin([15, 1, 2, 3, 4])].copy()
@@ -3195,9 +3832,7 @@ def crear_mapa_chile_tres_partes(mapa_data, output_dir):
         jara_pct, kast_pct = calcular_promedio_regional_correcto(zona_data)
         dif_pct = jara_pct - kast_pct
 
-        jara_gana = (zona_data['diferencia_pct'] > 0).sum()
-        kast_gana = (zona_data['diferencia_pct'] < 0).sum()
-        empates = (zona_data['diferencia_pct'] == 0).sum()
+        jara_gana, kast_gana, empates = _contar_ganadores(zona_data['diferencia_pct'])
 
         return {
             'nombre': nombre_zona,
@@ -3234,17 +3869,18 @@ def crear_mapa_chile_tres_partes(mapa_data, output_dir):
     ax_norte = fig.add_subplot(gs[1, 0])
 
     if not norte_data.empty:
-        norte_data['color'] = norte_data['diferencia_pct'].apply(asignar_color_diferencia)
-        norte_data.plot(ax=ax_norte, color=norte_data['color'], edgecolor='black', linewidth=0.5)
+        norte_data['color'] = colorizar(norte_data['diferencia_pct'])
+        ax_norte.add_collection(_coleccion_poligonos(norte_data, norte_data['color'], linewidth=0.5))
+        ax_norte.autoscale_view()
 
         ax_norte.set_title('ZONA NORTE\n(Arica y Parinacota a Coquimbo)',
-                           fontsize=16, fontweight='bold', pad=10)
+                           fontproperties=_FP_TITULO, fontsize=16, pad=10)
     else:
         ax_norte.text(0.5, 0.5, 'SIN DATOS\nPARA ZONA NORTE',
                       ha='center', va='center',
                       fontsize=14, fontweight='bold',
                       color='gray')
-        ax_norte.set_title('ZONA NORTE', fontsize=16, fontweight='bold', pad=10)
+        ax_norte.set_title('ZONA NORTE', fontproperties=_FP_TITULO, fontsize=16, pad=10)
 
     ax_norte.set_axis_off()
     ax_norte.set_aspect('equal')
@@ -3253,17 +3889,18 @@ def crear_mapa_chile_tres_partes(mapa_data, output_dir):
     ax_centro = fig.add_subplot(gs[1, 1])
 
     if not centro_data.empty:
-        centro_data['color'] = centro_data['diferencia_pct'].apply(asignar_color_diferencia)
-        centro_data.plot(ax=ax_centro, color=centro_data['color'], edgecolor='black', linewidth=0.5)
+        centro_data['color'] = colorizar(centro_data['diferencia_pct'])
+        ax_centro.add_collection(_coleccion_poligonos(centro_data, centro_data['color'], linewidth=0.5))
+        ax_centro.autoscale_view()
 
         ax_centro.set_title('ZONA CENTRO\n(Valparaíso a Biobío + RM)',
-                            fontsize=16, fontweight='bold', pad=10)
+                            fontproperties=_FP_TITULO, fontsize=16, pad=10)
     else:
         ax_centro.text(0.5, 0.5, 'SIN DATOS\nPARA ZONA CENTRO',
                        ha='center', va='center',
                        fontsize=14, fontweight='bold',
                        color='gray')
-        ax_centro.set_title('ZONA CENTRO', fontsize=16, fontweight='bold', pad=10)
+        ax_centro.set_title('ZONA CENTRO', fontproperties=_FP_TITULO, fontsize=16, pad=10)
 
     ax_centro.set_axis_off()
     ax_centro.set_aspect('equal')
@@ -3272,17 +3909,18 @@ def crear_mapa_chile_tres_partes(mapa_data, output_dir):
     ax_sur = fig.add_subplot(gs[1, 2])
 
     if not sur_data.empty:
-        sur_data['color'] = sur_data['diferencia_pct'].apply(asignar_color_diferencia)
-        sur_data.plot(ax=ax_sur, color=sur_data['color'], edgecolor='black', linewidth=0.5)
+        sur_data['color'] = colorizar(sur_data['diferencia_pct'])
+        ax_sur.add_collection(_coleccion_poligonos(sur_data, sur_data['color'], linewidth=0.5))
+        ax_sur.autoscale_view()
 
         ax_sur.set_title('ZONA SUR\n(Araucanía a Magallanes)',
-                         fontsize=16, fontweight='bold', pad=10)
+                         fontproperties=_FP_TITULO, fontsize=16, pad=10)
     else:
         ax_sur.text(0.5, 0.5, 'SIN DATOS\nPARA ZONA SUR',
                     ha='center', va='center',
                     fontsize=14, fontweight='bold',
                     color='gray')
-        ax_sur.set_title('ZONA SUR', fontsize=16, fontweight='bold', pad=10)
+        ax_sur.set_title('ZONA SUR', fontproperties=_FP_TITULO, fontsize=16, pad=10)
 
     ax_sur.set_axis_off()
     ax_sur.set_aspect('equal')
@@ -3296,30 +3934,8 @@ def crear_mapa_chile_tres_partes(mapa_data, output_dir):
                     fontsize=18, fontweight='bold',
                     transform=ax_leyenda.transAxes)
 
-    # Elementos de la leyenda
-    leyenda_elementos = [
-        mpatches.Patch(color='#B91C1C', label='Jara +50% o más'),
-        mpatches.Patch(color='#C92A2A', label='Jara +40% a +50%'),
-        mpatches.Patch(color='#DA4A4A', label='Jara +30% a +40%'),
-        mpatches.Patch(color='#E86969', label='Jara +20% a +30%'),
-        mpatches.Patch(color='#F28787', label='Jara +10% a +20%'),
-        mpatches.Patch(color='#F8A0A0', label='Jara +1% a +10%'),
-        mpatches.Patch(color='#9CA3AF', label='Empate técnico'),
-        mpatches.Patch(color='#8BB2F0', label='Kast +1% a +10%'),
-        mpatches.Patch(color='#5E91E8', label='Kast +10% a +20%'),
-        mpatches.Patch(color='#3D76D1', label='Kast +20% a +30%'),
-        mpatches.Patch(color='#2A58A6', label='Kast +30% a +40%'),
-        mpatches.Patch(color='#1A3D7C', label='Kast +40% a +50%'),
-        mpatches.Patch(color='#0F2D5C', label='Kast +50% o más'),
-        mpatches.Patch(color='#D3D3D3', label='Sin datos'),
-    ]
-
-    ax_leyenda.legend(handles=leyenda_elementos,
-                      loc='center',
-                      fontsize=9,
-                      title='Diferencia (Jara% - Kast%)',
-                      title_fontsize=11,
-                      framealpha=0.9)
+    _dibujar_leyenda_diferencias(ax_leyenda.inset_axes([0.15, 0.3, 0.7, 0.4]),
+                                 'Diferencia (Jara% - Kast%)', fontsize=9, title_fontsize=11)
 
     # Gráfico de barras comparativo
     ax_estadisticas = fig.add_subplot(gs[2, :3])
@@ -3342,7 +3958,7 @@ def crear_mapa_chile_tres_partes(mapa_data, output_dir):
     ax_estadisticas.set_xlabel('Zona', fontsize=14, fontweight='bold')
     ax_estadisticas.set_ylabel('Porcentaje (%)', fontsize=14, fontweight='bold')
     ax_estadisticas.set_title('COMPARATIVA POR ZONAS - RESULTADOS PROMEDIO',
-                              fontsize=16, fontweight='bold', pad=15)
+                              fontproperties=_FP_TITULO, fontsize=16, pad=15)
     ax_estadisticas.set_xticks(x)
     ax_estadisticas.set_xticklabels(zonas, fontsize=12)
     ax_estadisticas.legend(fontsize=12)
@@ -3392,15 +4008,14 @@ def crear_mapa_chile_tres_partes(mapa_data, output_dir):
     ax_pie = fig.add_axes([0.1, 0.02, 0.8, 0.03])
     ax_pie.set_axis_off()
 
-    fecha = datetime.now().strftime("%d/%m/%Y")
-    info_text = f"Análisis Segunda Vuelta Presidencial Chile 2025 - Jara vs Kast | Chile mapa completo | Generado: {fecha} | Nota: Islas (Pascua y Juan Fernández) no incluidas"
+    info_text = _texto_pie('Chile mapa completo') + " | Nota: Islas (Pascua y Juan Fernández) no incluidas"
     ax_pie.text(0.5, 0.5, info_text,
                 ha='center', va='center',
                 fontsize=10, color='gray',
                 transform=ax_pie.transAxes)
 
-    plt.tight_layout(rect=[0.02, 0.05, 0.98, 0.98])
-    output_path = os.path.join(output_dir, "CHILE_MAP_COMPLETO.png")
+    _ajustar_diseno([0.02, 0.05, 0.98, 0.98])
+    output_path = _rutas_salida(output_dir)['chile_tres_partes']
     plt.savefig(output_path, dpi=300, bbox_inches='tight', pad_inches=0.2)
     plt.close(fig)
 
@@ -3449,9 +4064,7 @@ def crear_reporte_nacional_completo(mapa_data, output_dir):
 
     # Estadísticas por comuna
     total_comunas = len(datos_nacionales)
-    jara_gana = (datos_nacionales['diferencia_pct'] > 0).sum()
-    kast_gana = (datos_nacionales['diferencia_pct'] < 0).sum()
-    empates = (datos_nacionales['diferencia_pct'] == 0).sum()
+    jara_gana, kast_gana, empates = _contar_ganadores(datos_nacionales['diferencia_pct'])
 
     # Top 5 comunas por candidato
     comunas_jara_top = datos_nacionales.sort_values('jara_pct', ascending=False).head(5)
@@ -3570,7 +4183,7 @@ def crear_reporte_nacional_completo(mapa_data, output_dir):
         ax_top_kast.set_yticks(range(len(comunas_nombres_short)))
         ax_top_kast.set_yticklabels(comunas_nombres_short, fontsize=12)
         ax_top_kast.set_xlabel('Porcentaje de Kast (%)', fontsize=14, fontweight='bold')
-        ax_top_kast.set_title('TOP 5 COMUNAS - KAST GANA', fontsize=16, fontweight='bold', pad=10)
+        ax_top_kast.set_title('TOP 5 COMUNAS - KAST GANA', fontproperties=_FP_TITULO, fontsize=16, pad=10)
 
         # Agregar valores en barras
         for i, bar in enumerate(bars):
@@ -3588,7 +4201,7 @@ def crear_reporte_nacional_completo(mapa_data, output_dir):
                          transform=ax_top_kast.transAxes,
                          fontsize=14, fontweight='bold',
                          color='gray')
-        ax_top_kast.set_title('TOP 5 COMUNAS - KAST GANA', fontsize=16, fontweight='bold', pad=10)
+        ax_top_kast.set_title('TOP 5 COMUNAS - KAST GANA', fontproperties=_FP_TITULO, fontsize=16, pad=10)
         ax_top_kast.set_axis_off()
 
     # Top 5 comunas Jara
@@ -3611,7 +4224,7 @@ def crear_reporte_nacional_completo(mapa_data, output_dir):
         ax_top_jara.set_yticks(range(len(comunas_nombres_short)))
         ax_top_jara.set_yticklabels(comunas_nombres_short, fontsize=12)
         ax_top_jara.set_xlabel('Porcentaje de Jara (%)', fontsize=14, fontweight='bold')
-        ax_top_jara.set_title('TOP 5 COMUNAS - JARA GANA', fontsize=16, fontweight='bold', pad=10)
+        ax_top_jara.set_title('TOP 5 COMUNAS - JARA GANA', fontproperties=_FP_TITULO, fontsize=16, pad=10)
 
         # Agregar valores en barras
         for i, bar in enumerate(bars):
@@ -3629,7 +4242,7 @@ def crear_reporte_nacional_completo(mapa_data, output_dir):
                          transform=ax_top_jara.transAxes,
                          fontsize=14, fontweight='bold',
                          color='gray')
-        ax_top_jara.set_title('TOP 5 COMUNAS - JARA GANA', fontsize=16, fontweight='bold', pad=10)
+        ax_top_jara.set_title('TOP 5 COMUNAS - JARA GANA', fontproperties=_FP_TITULO, fontsize=16, pad=10)
         ax_top_jara.set_axis_off()
 
     # Estadísticas de votos
@@ -3663,15 +4276,14 @@ def crear_reporte_nacional_completo(mapa_data, output_dir):
     ax_fondo = fig.add_subplot(gs[3, :])
     ax_fondo.set_axis_off()
 
-    fecha = datetime.now().strftime("%d/%m/%Y %H:%M")
-    info_text = f"Análisis Segunda Vuelta Presidencial Chile 2025 - Jara vs Kast | Reporte Nacional | Generado: {fecha}"
+    info_text = _texto_pie('Reporte Nacional', _FECHA_HORA)
     ax_fondo.text(0.5, 0.5, info_text,
                   ha='center', va='center',
                   fontsize=12, color='gray',
                   transform=ax_fondo.transAxes)
 
-    plt.tight_layout(rect=[0.02, 0.02, 0.98, 0.98])
-    output_path = os.path.join(output_dir, "REPORTE_NACIONAL_COMPLETO.png")
+    _ajustar_diseno([0.02, 0.02, 0.98, 0.98])
+    output_path = _rutas_salida(output_dir)['reporte_nacional']
     plt.savefig(output_path, dpi=300, bbox_inches='tight', pad_inches=0.2)
     plt.close(fig)
 
@@ -3717,11 +4329,10 @@ def crear_tabla_capitales_regionales(mapa_data, output_dir):
         region_num = capital_info["region_num"]
         capital_nombre = capital_info["capital"]
 
-        # Buscar datos de la capital
-        capital_data = mapa_data[
-            (mapa_data['REGION_NUM'] == region_num) &
-            (mapa_data['NOM_COM'].str.contains(capital_nombre, case=False, na=False))
-            ].copy()
+        # Buscar datos de la capital (nombre literal, solo dentro de su región)
+        en_region = mapa_data[mapa_data['REGION_NUM'] == region_num]
+        capital_data = en_region[en_region['NOM_COM'].str.contains(capital_nombre, case=False,
+                                                                   regex=False, na=False)]
 
         if not capital_data.empty:
             capital_row = capital_data.iloc[0]
@@ -3780,16 +4391,10 @@ def crear_tabla_capitales_regionales(mapa_data, output_dir):
     ax_tabla.set_axis_off()
 
     # Preparar datos para tabla
-    tabla_data = []
-    for i, row in df_capitales.iterrows():
-        tabla_data.append([
-            row['Región'],
-            row['Capital'],
-            f"{row['Jara (%)']:.1f}%",
-            f"{row['Kast (%)']:.1f}%",
-            f"{row['Diferencia']:+.1f}%",
-            row['Ganador']
-        ])
+    tabla_data = [[region, capital, f"{jara:.1f}%", f"{kast:.1f}%", f"{diferencia:+.1f}%", ganador]
+                  for region, capital, jara, kast, diferencia, ganador in zip(
+                      df_capitales['Región'], df_capitales['Capital'], df_capitales['Jara (%)'],
+                      df_capitales['Kast (%)'], df_capitales['Diferencia'], df_capitales['Ganador'])]
 
     column_labels = ['Región', 'Capital', 'Jara (%)', 'Kast (%)', 'Diferencia', 'Ganador']
 
@@ -3861,21 +4466,20 @@ def crear_tabla_capitales_regionales(mapa_data, output_dir):
                     ha='center', va='center', fontsize=14, fontweight='bold',
                     transform=ax_resumen.transAxes)
 
-    fecha = datetime.now().strftime("%d/%m/%Y %H:%M")
-    nota_text = f"Análisis Segunda Vuelta Presidencial Chile 2025 - Jara vs Kast | Capitales Regionales | Generado: {fecha}"
+    nota_text = _texto_pie('Capitales Regionales', _FECHA_HORA)
     ax_resumen.text(0.5, 0.3, nota_text,
                     ha='center', va='center', fontsize=10, color='gray',
                     transform=ax_resumen.transAxes)
 
-    plt.tight_layout(rect=[0.02, 0.02, 0.98, 0.98])
-    output_path = os.path.join(output_dir, "TABLA_CAPITALES_REGIONALES.png")
+    _ajustar_diseno([0.02, 0.02, 0.98, 0.98])
+    output_path = _rutas_salida(output_dir)['tabla_capitales']
     plt.savefig(output_path, dpi=300, bbox_inches='tight', pad_inches=0.2)
     plt.close(fig)
 
     print(f" ✓ Tabla de capitales regionales guardada: {output_path}")
 
     # Guardar también como CSV
-    csv_path = os.path.join(output_dir, "TABLA_CAPITALES_REGIONALES.csv")
+    csv_path = _rutas_salida(output_dir)['tabla_capitales_csv']
     df_capitales.to_csv(csv_path, index=False, encoding='utf-8-sig')
     print(f" ✓ Datos de capitales regionales guardados como CSV: {csv_path}")
 
@@ -3896,10 +4500,9 @@ def crear_reporte_gran_santiago_completo(mapa_data, output_dir):
     print(f" 📊 Generando reporte completo para Gran Santiago")
 
     # Filtrar datos del Gran Santiago
-    conurbacion_norm = [normalizar_nombre(comuna) for comuna in CONURBACION_SANTIAGO]
     gran_santiago_data = mapa_data[
         (mapa_data['REGION_NUM'] == 13) &
-        (mapa_data['NOM_COM_NORM'].isin(conurbacion_norm)) &
+        (mapa_data['NOM_COM_NORM'].isin(_CONURB_STGO_SET)) &
         (mapa_data['diferencia_pct'].notna())
         ].copy()
 
@@ -3919,58 +4522,29 @@ def crear_reporte_gran_santiago_completo(mapa_data, output_dir):
     comunas_jara_top = comunas_jara.sort_values('jara_pct', ascending=False).head(5)
     comunas_kast_top = comunas_kast.sort_values('kast_pct', ascending=False).head(5)
 
-    # URLs de fotos de candidatos
-    jara_foto_urls = [
-        "https://upload.wikimedia.org/wikipedia/commons/2/2d/Live_Especial_Mujeres_Comit%C3%A9_Pol%C3%ADtico%2C_Ministra_Jannette_Jara_%28cropped%29.jpg",
-        "https://www.latercera.com/resizer/v2/W4LV4DZTLVG2JLA4FSNXGSZ53U.jpg?auth=ac72355711cd6ba404761233d4e8c5db88b09d7e1383330b23f44f6fe4c4da02&smart=true&width=800&height=533&quality=70",
-        "https://media.biobiochile.cl/wp-content/uploads/2022/03/Jannette-Jara-1-1200x800.jpg"
-    ]
-
-    kast_foto_urls = [
-        "https://upload.wikimedia.org/wikipedia/commons/thumb/1/19/Jos%C3%A9_Antonio_Kast_en_2025_%28cropped%29.jpg/960px-Jos%C3%A9_Antonio_Kast_en_2025_%28cropped%29.jpg",
-        "https://www.latercera.com/resizer/v2/CHVAFJVR7FCPJNPW2WSY7O3GEE.jpg?auth=4283b658dda7f5ed3f2e4e014eefc4fa4cf096e36131ed2620338bd73bf0b73a&smart=true&width=800&height=533&quality=70",
-        "https://media.biobiochile.cl/wp-content/uploads/2021/11/kast-1-1200x800.jpg"
-    ]
-
     def descargar_imagen(urls, nombre_candidato):
-        """Descarga imagen de candidato desde URLs alternativas."""
+        """Obtiene la imagen de un candidato desde la primera URL disponible."""
         for url in urls:
+            contenido = descargas.get(url)
+            if contenido is None:
+                print(f"  ⚠ Sin respuesta desde {url[:60]}")
+                continue
             try:
-                print(f"  Intentando descargar imagen de {nombre_candidato} desde: {url[:60]}...")
-
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                    'Accept': 'image/webp,image/apng,image/*,*/*;q=0.8',
-                    'Accept-Language': 'es-ES,es;q=0.9',
-                    'Referer': 'https://www.google.com/'
-                }
-
-                response = requests.get(url, headers=headers, timeout=10, stream=True)
-
-                if response.status_code == 200:
-                    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.jpg')
-                    with open(temp_file.name, 'wb') as f:
-                        for chunk in response.iter_content(chunk_size=8192):
-                            f.write(chunk)
-
-                    img = Image.open(temp_file.name)
-
-                    os.unlink(temp_file.name)
-
-                    print(f"  ✓ Imagen de {nombre_candidato} descargada correctamente")
-                    return img
-
+                img = Image.open(BytesIO(contenido))
+                img.load()
+                print(f"  ✓ Imagen de {nombre_candidato} descargada correctamente")
+                return img
             except Exception as e:
                 print(f"  ⚠ Error con URL {url[:60]}: {e}")
-                continue
 
         print(f"  ✗ No se pudo descargar imagen de {nombre_candidato}, usando placeholder")
         return None
 
-    # Descargar imágenes
+    # Descargar imágenes (todas las URLs en paralelo)
     print(" 📷 Descargando imágenes de candidatos...")
-    jara_img = descargar_imagen(jara_foto_urls, "Jeannette Jara")
-    kast_img = descargar_imagen(kast_foto_urls, "José Antonio Kast")
+    descargas = _precargar_urls(FOTOS_JARA_URLS + FOTOS_KAST_URLS, headers=CABECERAS_IMAGENES)
+    jara_img = descargar_imagen(FOTOS_JARA_URLS, "Jeannette Jara")
+    kast_img = descargar_imagen(FOTOS_KAST_URLS, "José Antonio Kast")
 
     # Configurar figura
     fig = plt.figure(figsize=(28, 20))
@@ -4094,7 +4668,7 @@ def crear_reporte_gran_santiago_completo(mapa_data, output_dir):
         ax_top_kast.set_yticks(range(len(comunas_nombres_short)))
         ax_top_kast.set_yticklabels(comunas_nombres_short, fontsize=12)
         ax_top_kast.set_xlabel('Porcentaje de Kast (%)', fontsize=14, fontweight='bold')
-        ax_top_kast.set_title('TOP 5 COMUNAS - KAST GANA', fontsize=16, fontweight='bold', pad=10)
+        ax_top_kast.set_title('TOP 5 COMUNAS - KAST GANA', fontproperties=_FP_TITULO, fontsize=16, pad=10)
 
         # Agregar valores en barras
         for i, bar in enumerate(bars):
@@ -4112,7 +4686,7 @@ def crear_reporte_gran_santiago_completo(mapa_data, output_dir):
                          transform=ax_top_kast.transAxes,
                          fontsize=14, fontweight='bold',
                          color='gray')
-        ax_top_kast.set_title('TOP 5 COMUNAS - KAST GANA', fontsize=16, fontweight='bold', pad=10)
+        ax_top_kast.set_title('TOP 5 COMUNAS - KAST GANA', fontproperties=_FP_TITULO, fontsize=16, pad=10)
         ax_top_kast.set_axis_off()
 
     # Top 5 comunas Jara
@@ -4135,7 +4709,7 @@ def crear_reporte_gran_santiago_completo(mapa_data, output_dir):
         ax_top_jara.set_yticks(range(len(comunas_nombres_short)))
         ax_top_jara.set_yticklabels(comunas_nombres_short, fontsize=12)
         ax_top_jara.set_xlabel('Porcentaje de Jara (%)', fontsize=14, fontweight='bold')
-        ax_top_jara.set_title('TOP 5 COMUNAS - JARA GANA', fontsize=16, fontweight='bold', pad=10)
+        ax_top_jara.set_title('TOP 5 COMUNAS - JARA GANA', fontproperties=_FP_TITULO, fontsize=16, pad=10)
 
         # Agregar valores en barras
         for i, bar in enumerate(bars):
@@ -4153,7 +4727,7 @@ def crear_reporte_gran_santiago_completo(mapa_data, output_dir):
                          transform=ax_top_jara.transAxes,
                          fontsize=14, fontweight='bold',
                          color='gray')
-        ax_top_jara.set_title('TOP 5 COMUNAS - JARA GANA', fontsize=16, fontweight='bold', pad=10)
+        ax_top_jara.set_title('TOP 5 COMUNAS - JARA GANA', fontproperties=_FP_TITULO, fontsize=16, pad=10)
         ax_top_jara.set_axis_off()
 
     # Estadísticas generales
@@ -4176,15 +4750,14 @@ def crear_reporte_gran_santiago_completo(mapa_data, output_dir):
     ax_fondo = fig.add_subplot(gs[3, :])
     ax_fondo.set_axis_off()
 
-    fecha = datetime.now().strftime("%d/%m/%Y %H:%M")
-    info_text = f"Análisis Segunda Vuelta Presidencial Chile 2025 - Jara vs Kast | Reporte Gran Santiago | Generado: {fecha}"
+    info_text = _texto_pie('Reporte Gran Santiago', _FECHA_HORA)
     ax_fondo.text(0.5, 0.5, info_text,
                   ha='center', va='center',
                   fontsize=12, color='gray',
                   transform=ax_fondo.transAxes)
 
-    plt.tight_layout(rect=[0.02, 0.02, 0.98, 0.98])
-    output_path = os.path.join(output_dir, "REPORTE_GRAN_SANTIAGO_COMPLETO.png")
+    _ajustar_diseno([0.02, 0.02, 0.98, 0.98])
+    output_path = _rutas_salida(output_dir)['reporte_gran_santiago']
     plt.savefig(output_path, dpi=300, bbox_inches='tight', pad_inches=0.2)
     plt.close(fig)
 
@@ -4204,7 +4777,7 @@ def generar_reporte_final(mapa_data, output_dir):
         mapa_data (GeoDataFrame): Datos combinados de toda Chile.
         output_dir (str): Directorio para guardar el reporte.
     """
-    reporte_path = os.path.join(output_dir, "REPORTE_FINAL.txt")
+    reporte_path = _rutas_salida(output_dir)['reporte_final']
 
     print(f"\n📋 Generando reporte final...")
 
@@ -4213,7 +4786,7 @@ def generar_reporte_final(mapa_data, output_dir):
         f.write("REPORTE FINAL - ANÁLISIS SEGUNDA VUELTA PRESIDENCIAL CHILE 2025 - JARA vs KAST\n")
         f.write("=" * 100 + "\n\n")
 
-        fecha_actual = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
+        fecha_actual = _FECHA_HORA_SEGUNDOS
         f.write(f"Fecha de generación: {fecha_actual}\n")
         f.write(f"Total de comunas procesadas: {len(mapa_data)}\n\n")
 
@@ -4237,9 +4810,7 @@ def generar_reporte_final(mapa_data, output_dir):
 
             if comunas_con_datos > 0:
                 dif_promedio = mapa_data['diferencia_pct'].mean()
-                jara_gana = (mapa_data['diferencia_pct'] > 0).sum()
-                kast_gana = (mapa_data['diferencia_pct'] < 0).sum()
-                empates = (mapa_data['diferencia_pct'] == 0).sum()
+                jara_gana, kast_gana, empates = _contar_ganadores(mapa_data['diferencia_pct'])
 
                 f.write(f"Diferencia promedio nacional: {dif_promedio:+.2f}%\n")
                 f.write(f"Jara gana en: {jara_gana} comunas ({jara_gana / comunas_con_datos * 100:.1f}%)\n")
@@ -4271,55 +4842,34 @@ def generar_mapa_nacional(mapa_data, output_dir):
 
     # Asignar colores
     if 'diferencia_pct' in mapa_data.columns:
-        mapa_data['color'] = mapa_data['diferencia_pct'].apply(asignar_color_diferencia)
+        mapa_data['color'] = colorizar(mapa_data['diferencia_pct'])
     else:
         mapa_data['color'] = '#D3D3D3'
 
     # Dibujar mapa
     try:
-        mapa_data.plot(ax=ax, color=mapa_data['color'], edgecolor='black', linewidth=0.3)
+        ax.add_collection(_coleccion_poligonos(mapa_data, mapa_data['color'], linewidth=0.3))
+        ax.autoscale_view()
     except:
-        # Fallback: dibujar comunas individualmente
-        for idx, row in mapa_data.iterrows():
-            if hasattr(row, 'geometry') and row.geometry is not None:
-                try:
-                    gpd.GeoSeries([row.geometry]).plot(ax=ax, color=row['color'], edgecolor='black', linewidth=0.3)
-                except:
-                    continue
-
-    ax.set_title('ANÁLISIS SEGUNDA VELTA PRESIDENCIAL CHILE 2025 - DIFERENCIA JARA vs KAST', fontsize=24,
-                 fontweight='bold', pad=20)
+        # Fallback: una PatchCollection simple con todas las comunas
+        try:
+            ax.add_collection(_coleccion_parches(mapa_data, mapa_data['color'], linewidth=0.3))
+            ax.autoscale_view()
+        except Exception as e:
+            print(f" ⚠ Error en el dibujo alternativo: {e}")
+
+    ax.set_aspect('equal')
+
+    ax.set_title('ANÁLISIS SEGUNDA VELTA PRESIDENCIAL CHILE 2025 - DIFERENCIA JARA vs KAST', fontproperties=_FP_TITULO,
+                 fontsize=24, pad=20)
     ax.set_axis_off()
 
     # Leyenda de colores
-    leyenda_elementos = [
-        mpatches.Patch(color='#B91C1C', label='Jara +50% o más'),
-        mpatches.Patch(color='#C92A2A', label='Jara +40% a +50%'),
-        mpatches.Patch(color='#DA4A4A', label='Jara +30% a +40%'),
-        mpatches.Patch(color='#E86969', label='Jara +20% a +30%'),
-        mpatches.Patch(color='#F28787', label='Jara +10% a +20%'),
-        mpatches.Patch(color='#F8A0A0', label='Jara +1% a +10%'),
-        mpatches.Patch(color='#9CA3AF', label='Empate técnico'),
-        mpatches.Patch(color='#8BB2F0', label='Kast +1% a +10%'),
-        mpatches.Patch(color='#5E91E8', label='Kast +10% a +20%'),
-        mpatches.Patch(color='#3D76D1', label='Kast +20% a +30%'),
-        mpatches.Patch(color='#2A58A6', label='Kast +30% a +40%'),
-        mpatches.Patch(color='#1A3D7C', label='Kast +40% a +50%'),
-        mpatches.Patch(color='#0F2D5C', label='Kast +50% o más'),
-        mpatches.Patch(color='#D3D3D3', label='Sin datos'),
-    ]
+    _dibujar_leyenda_diferencias(ax.inset_axes([0.01, 0.6, 0.22, 0.39]),
+                                 'Leyenda (Nueva Escala COLORES_BALOTAJE)', fontsize=9, title_fontsize=11)
 
-    ax.legend(handles=leyenda_elementos,
-              loc='upper left',
-              bbox_to_anchor=(0.01, 0.99),
-              fontsize=9,
-              title='Leyenda (Nueva Escala COLORES_BALOTAJE)',
-              title_fontsize=11,
-              framealpha=0.9,
-              ncol=2)
-
-    output_path = os.path.join(output_dir, "MAPA_NACIONAL_COMPLETO.png")
-    plt.tight_layout()
+    output_path = _rutas_salida(output_dir)['mapa_nacional']
+    _ajustar_diseno()
     plt.savefig(output_path, dpi=300, bbox_inches='tight')
     plt.close(fig)
 
@@ -4330,7 +4880,7 @@ def generar_mapa_nacional(mapa_data, output_dir):
 # FUNCIÓN PRINCIPAL
 # ============================================================================
 
-def main(csv_path, output_dir, regions=None):
+def main(csv_path, output_dir, regions=None, emparejamiento_difuso=EMPAREJAMIENTO_DIFUSO):
     """
     Función principal del generador de mapas electorales.
 
@@ -4338,6 +4888,7 @@ def main(csv_path, output_dir, regions=None):
         csv_path (str): Ruta al archivo CSV con datos electorales.
         output_dir (str): Directorio de salida para los mapas.
         regions (list or None): Lista de regiones a procesar, o None para todas.
+        emparejamiento_difuso (bool): Activa el emparejamiento difuso de nombres de comunas.
     """
     print("\n" + "=" * 80)
     print("ANÁLISIS SEGUNDA VUELTA PRESIDENCIAL CHILE 2025 - JARA vs KAST")
@@ -4359,16 +4910,20 @@ def main(csv_path, output_dir, regions=None):
         print(f"❌ Archivo no encontrado")
         return
 
-    os.makedirs(output_dir, exist_ok=True)
+    _rutas_salida(output_dir)
 
     try:
+        # Precargar las fotos en paralelo (quedan en la caché en disco); el
+        # GeoJSON de Gran Santiago se descarga una sola vez al generar su mapa
+        _precargar_urls(FOTOS_JARA_URLS + FOTOS_KAST_URLS, headers=CABECERAS_IMAGENES)
+
         # Cargar y procesar datos
         comunas = cargar_datos_geograficos()
         df_electoral = procesar_csv(csv_path)
-        mapa_data = unir_datos(comunas, df_electoral)
+        mapa_data = unir_datos(comunas, df_electoral, emparejamiento_difuso)
 
         # Guardar datos combinados
-        datos_path = os.path.join(output_dir, 'datos_combinados.csv')
+        datos_path = _rutas_salida(output_dir)['datos_combinados']
         columnas_a_guardar = []
         for col in ['COD_COM', 'NOM_COM', 'REGION_NUM', 'geometry',
                     'comuna', 'region', 'jara_votos', 'kast_votos', 'jara_pct', 'kast_pct',
@@ -4378,8 +4933,8 @@ def main(csv_path, output_dir, regions=None):
 
         if columnas_a_guardar:
             if 'geometry' in mapa_data.columns:
-                mapa_data[columnas_a_guardar].to_file(datos_path.replace('.csv', '.geojson'), driver='GeoJSON')
-                print(f"\n💾 Datos combinados guardados (GeoJSON): {datos_path.replace('.csv', '.geojson')}")
+                mapa_data[columnas_a_guardar].to_file(datos_path.with_suffix('.geojson'), driver='GeoJSON')
+                print(f"\n💾 Datos combinados guardados (GeoJSON): {datos_path.with_suffix('.geojson')}")
 
             columnas_sin_geo = [c for c in columnas_a_guardar if c != 'geometry']
             if columnas_sin_geo:
@@ -4390,26 +4945,21 @@ def main(csv_path, output_dir, regions=None):
         print("🎨 GENERANDO MAPAS REGIONALES")
         print("=" * 60)
 
-        # Generar mapas regionales
+        # Generar mapas regionales (por defecto, todas las regiones)
         if regions is None:
-            regions = range(1, 17)
-
-        mapas_generados = []
-        for region_num in regions:
-            try:
-                mapa_path = crear_mapa_regional_completo(region_num, mapa_data, output_dir)
-                if mapa_path:
-                    mapas_generados.append(mapa_path)
-            except Exception as e:
-                print(f" ✗ Error generando mapa Región {region_num}: {e}")
+            regions = list(_REGION_TABLE.index)
+        mapas_generados = generar_mapas_regionales(mapa_data, output_dir, regions)
 
         print("\n" + "=" * 60)
         print("🏝️ GENERANDO MAPAS DE ISLAS SEPARADAS")
         print("=" * 60)
 
         # Mapas de islas
-        crear_mapa_isla_pascua(mapa_data, output_dir)
-        crear_mapa_juan_fernandez(mapa_data, output_dir)
+        try:
+            crear_mapa_isla_pascua(mapa_data, output_dir)
+            crear_mapa_juan_fernandez(mapa_data, output_dir)
+        finally:
+            _cerrar_esqueleto_isla()
 
         print("\n" + "=" * 60)
         print("🗺️ GENERANDO NUEVO MAPA DE CHILE EN TRES PARTES")
@@ -4423,13 +4973,13 @@ def main(csv_path, output_dir, regions=None):
         print("=" * 60)
 
         # Mapas de áreas metropolitanas
-        if 5 in regions or regions is None:
+        if 5 in regions:
             crear_mapa_gran_valparaiso(mapa_data, output_dir)
 
-        if 8 in regions or regions is None:
+        if 8 in regions:
             crear_mapa_gran_concepcion(mapa_data, output_dir)
 
-        if 13 in regions or regions is None:
+        if 13 in regions:
             crear_mapa_conurbacion_santiago(mapa_data, output_dir)
             crear_reporte_gran_santiago_completo(mapa_data, output_dir)
 
@@ -4480,6 +5030,8 @@ if __name__ == "__main__":
                         help="Directorio de salida")
     parser.add_argument('--regions', type=str, default=None,
                         help="Regiones a procesar (ej: 1,13 o all)")
+    parser.add_argument('--emparejamiento-difuso', action='store_true',
+                        help="Emparejar por similitud (dentro de la región) las comunas sin coincidencia exacta; requiere rapidfuzz")
 
     args = parser.parse_args()
 
@@ -4490,4 +5042,4 @@ if __name__ == "__main__":
         regions = None
 
     # Ejecutar función principal
-    main(args.csv, args.output, regions)
+    main(args.csv, args.output, regions, args.emparejamiento_difuso)